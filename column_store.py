@@ -0,0 +1,960 @@
+#!/usr/bin/env python3
+"""
+column_store.py - 열 저장소
+
+data_analyzer.py가 데이터를 보관하는 열 단위(columnar) 형식입니다. 숫자형
+열은 ``array('d')``와 셀 상태 마스크로, 문자형 열은 사전(dictionary) 인코딩된
+정수 코드로 보관합니다. CSV 행 묶음에서 열을 만드는 빌더, 파일별 열을 이어
+붙이는 함수, 열 저장소를 CSV 옆에 저장하는 바이너리 캐시(사이드카) 형식도
+여기에 있습니다.
+"""
+
+import re
+import os
+import sys
+import json
+import mmap
+import struct
+import operator
+import tempfile
+from array import array
+from itertools import compress
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable, Iterator, Sequence
+from collections import Counter
+from pathlib import Path
+
+# 선택적 의존성: 설치되어 있으면 숫자 연산을 벡터화합니다.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+BACKENDS = ("python", "numpy")
+
+
+# 숫자형 열의 셀 상태 코드 (NumericColumn.status)
+_MISSING = 0       # 빈 문자열
+_CANONICAL = 1     # _format_number()로 원문 복원 가능
+_FIXED = 2         # 열의 고정 소수점 자릿수로 원문 복원 가능 (예: "12.50")
+_RAW_NUMBER = 3    # 숫자이지만 원문을 따로 보관 (예: "1,234")
+_RAW_TEXT = 4      # 숫자가 아닌 값 (원문 보관)
+
+# 상태 코드 -> 유효 숫자 여부(1/0) 변환표 (bytes.translate 용)
+_VALID_TABLE = bytes(1 if code in (_CANONICAL, _FIXED, _RAW_NUMBER) else 0 for code in range(256))
+_CANONICAL_TABLE = bytes(1 if code == _CANONICAL else 0 for code in range(256))
+_FIXED_TABLE = bytes(1 if code == _FIXED else 0 for code in range(256))
+# 일괄 변환 묶음의 비교 결과(1: 원문 복원 가능) -> 상태 코드 (0은 이후 다시 분류)
+_BATCH_STATUS_TABLE = bytes(_CANONICAL if code == 1 else _RAW_NUMBER for code in range(256))
+
+# 숫자형으로 판단하는 숫자 셀 비율
+NUMERIC_RATIO_THRESHOLD = 0.8
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    """숫자 연산 백엔드를 결정합니다 (None이면 NumPy가 있을 때 numpy)."""
+    if backend is None:
+        return "numpy" if NUMPY_AVAILABLE else "python"
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 백엔드입니다: {backend}")
+    if backend == "numpy" and not NUMPY_AVAILABLE:
+        raise ImportError(
+            "NumPy가 설치되지 않았습니다.\n"
+            "설치: pip install numpy"
+        )
+    return backend
+
+
+def _np_counter(values: "np.ndarray") -> Counter:
+    """NumPy 배열의 값별 빈도를 처음 등장한 순서의 Counter로 반환합니다."""
+    unique, first, counts = np.unique(values, return_index=True, return_counts=True)
+    order = np.argsort(first, kind="stable")
+    return Counter(dict(zip(unique[order].tolist(), counts[order].tolist())))
+
+
+def _is_blank(value: Optional[str]) -> bool:
+    """결측치(빈 문자열 또는 공백)인지 확인합니다."""
+    return not value or value.strip() == ""
+
+
+# 천 단위 구분 쉼표가 올바르게 들어간 숫자 (예: "1,234,567.5")
+_GROUPED_NUMBER = re.compile(r"\s*[+-]?\d{1,3}(?:,\d{3})+(?:\.\d*)?\s*$")
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    """
+    문자열을 숫자로 변환합니다. 변환할 수 없으면 None을 반환합니다.
+    
+    쉼표는 천 단위 구분자 형식일 때만 허용합니다. "1,5"처럼 소수점 쉼표와
+    구분할 수 없는 값은 숫자로 추측하지 않고 None을 반환합니다.
+    """
+    if _is_blank(value):
+        return None
+    try:
+        if "," in value:
+            if not _GROUPED_NUMBER.match(value):
+                return None
+            value = value.replace(",", "")
+        return float(value)
+    except (ValueError, AttributeError):
+        return None
+
+
+def _format_number(value: float) -> str:
+    """숫자를 기본 문자열 표현으로 변환합니다 (30.0 -> "30")."""
+    if value.is_integer() and abs(value) < 1e16:
+        return str(int(value))
+    return repr(value)
+
+
+class NumericColumn:
+    """
+    숫자형 열
+    
+    값은 ``array('d')``(캐시에서 읽은 경우 mmap 위의 memoryview)에, 셀마다
+    1바이트의 상태 코드는 ``bytearray``에 저장합니다. 상태 코드로 원문을
+    복원할 수 없는 셀만 ``raw``에 보관합니다.
+    
+    backend가 "numpy"이면 같은 버퍼를 복사 없이 ndarray로 보고 통계·비교를
+    벡터화합니다.
+    """
+    
+    dtype = "numeric"
+    backend = "python"
+    
+    def __init__(self, values: Sequence[float], status: bytes,
+                 raw: Optional[Dict[int, str]] = None,
+                 decimals: Optional[int] = None):
+        self.values = values
+        self.status = status
+        self.raw = raw if raw is not None else {}
+        self.decimals = decimals
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # 캐시 파일(mmap)을 가리키는 memoryview는 pickle할 수 없으므로 복사합니다.
+        state = dict(self.__dict__)
+        state["values"] = _to_array(self.values, "d")
+        state["status"] = bytes(self.status)
+        return state
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def get(self, index: int) -> str:
+        """원문 문자열을 반환합니다."""
+        code = self.status[index]
+        if code == _CANONICAL:
+            return _format_number(self.values[index])
+        if code == _FIXED:
+            return f"{self.values[index]:.{self.decimals}f}"
+        if code == _MISSING:
+            return ""
+        return self.raw[index]
+    
+    def strings(self) -> Iterator[str]:
+        """모든 셀의 원문 문자열을 순서대로 반환합니다."""
+        for i in range(len(self.values)):
+            yield self.get(i)
+    
+    def valid_mask(self) -> bytes:
+        """유효한 숫자 셀은 1, 나머지는 0인 마스크를 반환합니다."""
+        return self.status.translate(_VALID_TABLE)
+    
+    def numeric_at(self, index: int) -> Optional[float]:
+        """해당 셀의 숫자 값을 반환합니다."""
+        if _VALID_TABLE[self.status[index]]:
+            return self.values[index]
+        return None
+    
+    def iter_numeric(self) -> Iterator[Optional[float]]:
+        """셀마다 숫자 값(또는 None)을 반환합니다."""
+        for value, valid in zip(self.values, self.valid_mask()):
+            yield value if valid else None
+    
+    def numeric_values(self) -> List[float]:
+        """유효한 숫자 값만 순서대로 반환합니다."""
+        return list(compress(self.values, self.valid_mask()))
+    
+    def arrays(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """(값, 유효 마스크) NumPy 배열을 반환합니다 (값은 버퍼를 복사하지 않음)."""
+        values = np.frombuffer(self.values, dtype=np.float64)
+        return values, np.frombuffer(self.valid_mask(), dtype=np.bool_)
+    
+    def numeric_array(self) -> "np.ndarray":
+        """유효한 숫자 값만 순서대로 담은 NumPy 배열을 반환합니다."""
+        values, valid = self.arrays()
+        return values[valid]
+    
+    def missing_count(self) -> int:
+        """결측치 수를 반환합니다."""
+        blank_raw = sum(1 for i, text in self.raw.items()
+                        if self.status[i] == _RAW_TEXT and _is_blank(text))
+        return self.status.count(_MISSING) + blank_raw
+    
+    def unique_count(self) -> int:
+        """결측치를 제외한 고유 원문 문자열 수를 반환합니다."""
+        # 상태 코드가 원문에 의해 결정되므로 (상태, 값) 쌍과 원문은 1:1로 대응합니다.
+        canonical, fixed = set(), set()
+        for value, code in zip(self.values, self.status):
+            if code == _CANONICAL:
+                canonical.add(value)
+            elif code == _FIXED:
+                fixed.add(value)
+        unique = 0
+        for values in (canonical, fixed):
+            finite = [v for v in values if v == v]
+            unique += len(finite) + (1 if len(finite) != len(values) else 0)
+        unique += len(set(text for text in self.raw.values() if not _is_blank(text)))
+        return unique
+    
+    def counts(self) -> Counter:
+        """원문 문자열별 빈도를 반환합니다 (처음 등장한 순서 유지)."""
+        return Counter(self.strings())
+    
+    def invalid_values(self) -> Dict[int, str]:
+        """숫자로 해석하지 못한 (결측이 아닌) 셀의 {행 번호: 원문}을 반환합니다."""
+        status = self.status
+        return {i: text for i, text in self.raw.items()
+                if status[i] == _RAW_TEXT and not _is_blank(text)}
+    
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """빈도가 높은 순서로 (원문 문자열, 빈도) 목록을 반환합니다."""
+        return self.counts().most_common(n)
+    
+    def select(self, condition: str, text: Any, target: Any,
+               candidates: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        조건을 만족하는 행 번호 목록을 반환합니다.
+        
+        text/target은 _prepare_condition()이 만든 비교 값입니다.
+        """
+        if self.backend == "numpy" and (condition in _COMPARATORS or condition == "between"):
+            return self._select_vectorized(condition, target, candidates)
+        
+        values, status = self.values, self.status
+        rows = range(len(values)) if candidates is None else candidates
+        valid = _VALID_TABLE
+        
+        if condition == "in":
+            return [i for i in rows
+                    if (valid[status[i]] and values[i] in target)
+                    or (not valid[status[i]] and self.get(i) in text)]
+        if condition == "between":
+            low, high = target
+            return [i for i in rows if valid[status[i]] and low <= values[i] <= high]
+        if condition == "regex":
+            search = re.compile(text).search
+            return [i for i in rows if search(self.get(i))]
+        if condition == "eq":
+            return [i for i in rows
+                    if (valid[status[i]] and target is not None and values[i] == target)
+                    or (not valid[status[i]] and self.get(i) == text)]
+        if condition == "ne":
+            # 값이 다르면 원문도 다르므로 같은 값일 때만 원문을 비교합니다.
+            return [i for i in rows
+                    if (valid[status[i]] and (target is None or values[i] != target))
+                    or self.get(i) != text]
+        if condition == "contains":
+            needle = text.lower()
+            return [i for i in rows if needle in self.get(i).lower()]
+        
+        compare = _COMPARATORS[condition]
+        return [i for i in rows if valid[status[i]] and compare(values[i], target)]
+    
+    def _select_vectorized(self, condition: str, target: Any,
+                           candidates: Optional[Iterable[int]]) -> List[int]:
+        """숫자 비교 조건을 NumPy 마스크로 평가합니다."""
+        values, valid = self.arrays()
+        rows = None
+        if candidates is not None:
+            rows = np.fromiter(candidates, dtype=np.int64)
+            values, valid = values[rows], valid[rows]
+        if condition == "between":
+            low, high = target
+            mask = valid & (values >= low) & (values <= high)
+        else:
+            mask = valid & _COMPARATORS[condition](values, target)
+        selected = np.flatnonzero(mask)
+        return (selected if rows is None else rows[selected]).tolist()
+    
+    def take(self, indices: Sequence[int]) -> "NumericColumn":
+        """지정한 행만으로 구성된 새 열을 반환합니다."""
+        values = array("d", (self.values[i] for i in indices))
+        status = bytearray(self.status[i] for i in indices)
+        raw = {}
+        if self.raw:
+            for new_index, old_index in enumerate(indices):
+                text = self.raw.get(old_index)
+                if text is not None:
+                    raw[new_index] = text
+        col = NumericColumn(values, status, raw, self.decimals)
+        col.backend = self.backend
+        return col
+
+
+class StringColumn:
+    """
+    문자형 열
+    
+    서로 다른 문자열은 ``dictionary``에 한 번만 저장하고, 각 셀은
+    ``array('i')`` 정수 코드로 보관합니다. 빈도·고유값·eq 비교는 문자열 대신
+    코드로 처리하며, 코드별 빈도와 문자열→코드 역색인은 처음 필요할 때 한 번만
+    만들어 재사용합니다 (열은 만든 뒤 바뀌지 않음).
+    """
+    
+    dtype = "string"
+    backend = "python"
+    
+    def __init__(self, codes: array, dictionary: List[str]):
+        self.codes = codes
+        self.dictionary = dictionary
+        self._numbers: Optional[List[Optional[float]]] = None
+        self._counts: Optional[Counter] = None
+        self._lookup: Optional[Dict[str, int]] = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["codes"] = _to_array(self.codes, _typecode(self.codes))
+        state["_counts"] = state["_lookup"] = None
+        return state
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def get(self, index: int) -> str:
+        """원문 문자열을 반환합니다."""
+        return self.dictionary[self.codes[index]]
+    
+    def strings(self) -> Iterator[str]:
+        """모든 셀의 원문 문자열을 순서대로 반환합니다."""
+        return map(self.dictionary.__getitem__, self.codes)
+    
+    def numbers(self) -> List[Optional[float]]:
+        """사전 항목별 숫자 변환 결과를 반환합니다 (항목당 한 번만 변환)."""
+        if self._numbers is None or len(self._numbers) != len(self.dictionary):
+            self._numbers = [_parse_number(text) for text in self.dictionary]
+        return self._numbers
+    
+    def numeric_at(self, index: int) -> Optional[float]:
+        """해당 셀의 숫자 값을 반환합니다."""
+        return self.numbers()[self.codes[index]]
+    
+    def iter_numeric(self) -> Iterator[Optional[float]]:
+        """셀마다 숫자 값(또는 None)을 반환합니다."""
+        return map(self.numbers().__getitem__, self.codes)
+    
+    def numeric_values(self) -> List[float]:
+        """유효한 숫자 값만 순서대로 반환합니다."""
+        return [v for v in self.iter_numeric() if v is not None]
+    
+    def code_array(self) -> "np.ndarray":
+        """정수 코드를 NumPy 배열로 반환합니다 (버퍼를 복사하지 않음)."""
+        return np.frombuffer(self.codes, dtype=np.dtype(_typecode(self.codes)))
+    
+    def code_of(self, text: str) -> Optional[int]:
+        """문자열의 사전 코드를 반환합니다 (사전에 없으면 None)."""
+        if self._lookup is None or len(self._lookup) != len(self.dictionary):
+            self._lookup = {entry: code for code, entry in enumerate(self.dictionary)}
+        return self._lookup.get(text)
+    
+    def code_counts(self) -> Counter:
+        """
+        코드별 빈도를 반환합니다 (처음 등장한 순서 유지).
+        
+        결과는 캐시되어 공유되므로 호출한 쪽에서 수정하면 안 됩니다.
+        """
+        if self._counts is None:
+            self._counts = Counter(self.codes)
+        return self._counts
+    
+    def missing_count(self) -> int:
+        """결측치 수를 반환합니다."""
+        dictionary = self.dictionary
+        return sum(n for code, n in self.code_counts().items() if _is_blank(dictionary[code]))
+    
+    def unique_count(self) -> int:
+        """결측치를 제외한 고유값 수를 반환합니다."""
+        dictionary = self.dictionary
+        return sum(1 for code in self.code_counts() if not _is_blank(dictionary[code]))
+    
+    def counts(self) -> Counter:
+        """원문 문자열별 빈도를 반환합니다 (처음 등장한 순서 유지)."""
+        dictionary = self.dictionary
+        return Counter({dictionary[code]: n for code, n in self.code_counts().items()})
+    
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """빈도가 높은 순서로 (원문 문자열, 빈도) 목록을 반환합니다 (코드 단위로 정렬)."""
+        dictionary = self.dictionary
+        return [(dictionary[code], count) for code, count in self.code_counts().most_common(n)]
+    
+    def select(self, condition: str, text: Any, target: Any,
+               candidates: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        조건을 만족하는 행 번호 목록을 반환합니다.
+        
+        text/target은 _prepare_condition()이 만든 비교 값입니다.
+        """
+        # 조건은 사전 항목마다 한 번만 평가하고, 행은 정수 코드로 비교합니다.
+        numbers = self.numbers()
+        if condition == "eq" and target is None:
+            # 숫자로 해석되지 않는 값은 같은 문자열의 코드 하나만 일치합니다.
+            code = self.code_of(text)
+            matched = [False] * len(self.dictionary)
+            if code is not None:
+                matched[code] = True
+        elif condition == "in":
+            matched = [entry in text or (num is not None and num in target)
+                       for entry, num in zip(self.dictionary, numbers)]
+        elif condition == "between":
+            low, high = target
+            matched = [num is not None and low <= num <= high for num in numbers]
+        elif condition == "regex":
+            search = re.compile(text).search
+            matched = [search(entry) is not None for entry in self.dictionary]
+        elif condition == "eq":
+            matched = [entry == text or (num is not None and target is not None and num == target)
+                       for entry, num in zip(self.dictionary, numbers)]
+        elif condition == "ne":
+            matched = [entry != text for entry in self.dictionary]
+        elif condition == "contains":
+            needle = text.lower()
+            matched = [needle in entry.lower() for entry in self.dictionary]
+        else:
+            compare = _COMPARATORS[condition]
+            matched = [num is not None and compare(num, target) for num in numbers]
+        
+        codes = self.codes
+        if candidates is not None:
+            return [i for i in candidates if matched[codes[i]]]
+        if not any(matched):
+            return []
+        if self.backend == "numpy":
+            return np.flatnonzero(np.array(matched, dtype=np.bool_)[self.code_array()]).tolist()
+        return list(compress(range(len(codes)), map(matched.__getitem__, codes)))
+    
+    def take(self, indices: Sequence[int]) -> "StringColumn":
+        """지정한 행만으로 구성된 새 열을 반환합니다."""
+        codes = array(_typecode(self.codes), (self.codes[i] for i in indices))
+        column = StringColumn(codes, self.dictionary)
+        column.backend = self.backend
+        return column
+
+
+Column = Union[NumericColumn, StringColumn]
+
+
+_COMPARATORS = {
+    "gt": lambda a, b: a > b,
+    "lt": lambda a, b: a < b,
+    "ge": lambda a, b: a >= b,
+    "le": lambda a, b: a <= b,
+}
+
+
+# 0/1 마스크를 뒤집는 변환 표
+_INVERT_TABLE = bytes(1 if code == 0 else 0 for code in range(256))
+
+
+class _ColumnBuilder:
+    """
+    셀을 받아 타입을 추론하면서 열을 구성합니다.
+    
+    처음에는 숫자형으로 가정하고, 숫자가 아닌 셀이 많아지면 문자형
+    (사전 인코딩)으로 전환합니다. 최종 타입은 finish()에서 결정합니다.
+    
+    숫자 변환은 열마다 한 번만 수행합니다. 결측·문자가 없는 묶음은 float()로
+    예외 없이 일괄 변환하고, 그렇지 않은 열만 셀 단위로 변환합니다.
+    """
+    
+    # 이 행 수 이후 숫자가 아닌 셀이 절반을 넘으면 문자형으로 전환
+    SWITCH_MIN_ROWS = 1000
+    
+    def __init__(self):
+        self.is_numeric = True
+        self.values = array("d")
+        self.status = bytearray()
+        self.raw: Dict[int, str] = {}
+        self.decimals: Optional[int] = None
+        self.non_numeric = 0
+        # 천 단위 구분자 사용 여부 (첫 묶음에서 판단), 일괄 변환 가능 여부
+        self.thousands: Optional[bool] = None
+        self.clean = True
+        
+        self.codes: Optional[array] = None
+        self.dictionary: List[str] = []
+        self.lookup: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.codes) if self.codes is not None else len(self.values)
+    
+    def extend(self, cells: Iterable[str]) -> None:
+        """셀들을 추가합니다."""
+        if not self.is_numeric:
+            self._extend_strings(cells)
+            return
+        
+        cells = cells if isinstance(cells, list) else list(cells)
+        numbers = self._parse_batch(cells) if self.clean else None
+        if numbers is None:
+            self.clean = False
+            self._extend_cells(cells)
+        else:
+            self._extend_numbers(cells, numbers)
+        
+        n = len(self.values)
+        if n >= self.SWITCH_MIN_ROWS and self.non_numeric * 2 > n:
+            self._switch_to_strings()
+    
+    def _parse_batch(self, cells: List[str]) -> Optional[List[float]]:
+        """
+        묶음 전체를 float()로 일괄 변환합니다.
+        
+        천 단위 구분자는 첫 묶음에 쉼표 숫자가 있고 모두 올바른 형식일 때만
+        사용하는 것으로 판단합니다. 변환할 수 없는 셀이 하나라도 있으면 None을
+        반환합니다.
+        """
+        commas = [cell for cell in cells if "," in cell]
+        if self.thousands is None:
+            self.thousands = bool(commas) and all(map(_GROUPED_NUMBER.match, commas))
+        if commas and not (self.thousands and all(map(_GROUPED_NUMBER.match, commas))):
+            return None
+        try:
+            if commas:
+                return list(map(float, map(operator.methodcaller("replace", ",", ""), cells)))
+            return list(map(float, cells))
+        except ValueError:
+            return None
+    
+    def _extend_numbers(self, cells: List[str], numbers: List[float]) -> None:
+        """일괄 변환된 묶음을 추가합니다 (원문 복원 가능 여부도 한꺼번에 비교)."""
+        base = len(self.values)
+        self.values.extend(numbers)
+        canonical = bytes(map(str.__eq__, cells, map(_format_number, numbers)))
+        self.status.extend(canonical.translate(_BATCH_STATUS_TABLE))
+        for i in compress(range(len(cells)), map(operator.not_, canonical)):
+            self.status[base + i] = self._classify(base + i, cells[i], numbers[i])
+    
+    def _extend_cells(self, cells: List[str]) -> None:
+        """결측이나 문자가 섞인 묶음을 셀 단위로 변환해 추가합니다."""
+        values, status, raw = self.values, self.status, self.raw
+        append_value, append_status = values.append, status.append
+        for cell in cells:
+            if not cell:
+                append_value(0.0)
+                append_status(_MISSING)
+                self.non_numeric += 1
+                continue
+            number = _parse_number(cell)
+            if number is None:
+                raw[len(values)] = cell
+                append_value(0.0)
+                append_status(_RAW_TEXT)
+                self.non_numeric += 1
+                continue
+            if cell == _format_number(number):
+                append_status(_CANONICAL)
+            else:
+                append_status(self._classify(len(values), cell, number))
+            append_value(number)
+    
+    def _classify(self, index: int, cell: str, number: float) -> int:
+        """_format_number()로 복원되지 않는 숫자 셀의 상태 코드를 정합니다."""
+        if self.decimals is None and "." in cell and "," not in cell and cell == cell.strip():
+            self.decimals = len(cell) - cell.index(".") - 1
+        if self.decimals is not None and cell == f"{number:.{self.decimals}f}":
+            return _FIXED
+        self.raw[index] = cell
+        return _RAW_NUMBER
+    
+    def _extend_strings(self, cells: Iterable[str]) -> None:
+        lookup, dictionary = self.lookup, self.dictionary
+        append_code = self.codes.append
+        for cell in cells:
+            code = lookup.get(cell)
+            if code is None:
+                code = lookup[cell] = len(dictionary)
+                dictionary.append(cell)
+            append_code(code)
+    
+    def _switch_to_strings(self) -> None:
+        column = NumericColumn(self.values, self.status, self.raw, self.decimals)
+        self.is_numeric = False
+        self.codes = array("i")
+        self._extend_strings(column.strings())
+        self.values, self.status, self.raw = array("d"), bytearray(), {}
+    
+    def finish(self) -> Column:
+        """최종 타입을 결정하여 열 객체를 반환합니다."""
+        n = len(self)
+        if self.is_numeric:
+            numeric = n - self.non_numeric
+            if n and numeric / n > NUMERIC_RATIO_THRESHOLD:
+                return NumericColumn(self.values, self.status, self.raw, self.decimals)
+            self._switch_to_strings()
+        
+        column = StringColumn(self.codes, self.dictionary)
+        numbers = column.numbers()
+        numeric = sum(count for code, count in column.code_counts().items()
+                      if numbers[code] is not None)
+        if n and numeric / n > NUMERIC_RATIO_THRESHOLD:
+            # 앞부분에서 문자형으로 전환했지만 전체로는 숫자형인 경우
+            builder = _ColumnBuilder()
+            builder.SWITCH_MIN_ROWS = n + 1
+            builder.extend(column.strings())
+            return builder.finish()
+        return column
+
+
+def _iter_row_batches(reader: Iterable[List[str]], width: int,
+                      batch_size: int = 10000) -> Iterator[List[List[str]]]:
+    """CSV 행을 열 수에 맞춰 정리한 뒤 batch_size개씩 묶어 반환합니다."""
+    batch = []
+    for row in reader:
+        if not row:
+            continue  # csv.DictReader와 동일하게 빈 줄은 건너뜀
+        if len(row) != width:
+            row = (row + [""] * width)[:width]
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _sniff_delimiter(sample: str) -> str:
+    """샘플 텍스트에서 가장 많이 등장하는 구분자를 추측합니다."""
+    delimiter = ","
+    for delim in [",", "\t", ";", "|"]:
+        if sample.count(delim) > sample.count(delimiter):
+            delimiter = delim
+    return delimiter
+
+
+def _build_table(batches: Iterable[List[List[str]]], header: List[str],
+                 names: Optional[Iterable[str]] = None) -> Tuple[Dict[str, Column], int]:
+    """
+    행 묶음들을 읽어 열 저장소와 행 수를 반환합니다.
+    
+    Args:
+        batches: 행 묶음들
+        header: 열 이름 목록
+        names: 구성할 열 이름 (기본값: 전체)
+    """
+    # 이름이 중복되면 csv.DictReader처럼 마지막 열을 사용
+    positions = {name: i for i, name in enumerate(header)}
+    if names is not None:
+        positions = {name: positions[name] for name in names}
+    builders = {name: _ColumnBuilder() for name in positions}
+    n_rows = 0
+    # 일부 열만 만들 때는 행 전체를 전치하지 않고 필요한 셀만 꺼냅니다.
+    transpose = len(positions) * 2 >= len(header)
+    
+    for batch in batches:
+        if transpose:
+            cells_by_position = list(zip(*batch))
+            for name, position in positions.items():
+                builders[name].extend(cells_by_position[position])
+        else:
+            for name, position in positions.items():
+                builders[name].extend(list(map(operator.itemgetter(position), batch)))
+        n_rows += len(batch)
+    
+    return {name: builder.finish() for name, builder in builders.items()}, n_rows
+
+
+def _numeric_arrays(col: Column) -> Tuple["np.ndarray", "np.ndarray"]:
+    """열의 (숫자 값, 유효 마스크) NumPy 배열을 반환합니다 (무효 셀의 값은 0)."""
+    if isinstance(col, NumericColumn):
+        return col.arrays()
+    numbers = col.numbers()
+    lookup = np.array([0.0 if x is None else x for x in numbers], dtype=np.float64)
+    known = np.array([x is not None for x in numbers], dtype=np.bool_)
+    codes = col.code_array()
+    return lookup[codes], known[codes]
+
+
+# 바이너리 캐시 파일 (CSV 옆에 저장되는 열 단위 사이드카)
+CACHE_SUFFIX = ".dacache"
+_CACHE_MAGIC = b"DACACHE1"
+_CACHE_VERSION = 1
+
+
+def _cache_path(filepath: Path) -> Path:
+    """CSV 파일에 대응하는 캐시 파일 경로를 반환합니다."""
+    return filepath.with_name(filepath.name + CACHE_SUFFIX)
+
+
+def _cache_key(filepath: Path, encoding: str) -> Dict[str, Any]:
+    """캐시 유효성 검사용 키 (경로 + 크기 + 수정 시각 + 요청 인코딩)"""
+    stat = filepath.stat()
+    return {
+        "source": str(filepath.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "encoding": encoding,
+    }
+
+
+def _typecode(buffer) -> str:
+    """array 또는 memoryview의 요소 타입 코드를 반환합니다."""
+    return getattr(buffer, "typecode", None) or buffer.format
+
+
+def _to_array(buffer, typecode: str) -> array:
+    """memoryview 등의 버퍼를 array로 복사합니다 (이미 array면 그대로 반환)."""
+    if isinstance(buffer, array):
+        return buffer
+    result = array(typecode)
+    result.frombytes(memoryview(buffer).cast("B"))
+    return result
+
+
+class _Segments:
+    """사이드카 파일에 쓸 8바이트 정렬 데이터 구간 목록"""
+    
+    def __init__(self):
+        self.parts: List[bytes] = []
+        self.size = 0
+    
+    def add(self, data: bytes) -> List[int]:
+        """데이터를 덧붙이고 [시작, 길이]를 반환합니다."""
+        position = self.size
+        self.parts.append(data)
+        padding = -len(data) % 8
+        if padding:
+            self.parts.append(b"\0" * padding)
+        self.size += len(data) + padding
+        return [position, len(data)]
+
+
+def _write_sidecar(target: Path, magic: bytes, meta: Dict[str, Any], segments: _Segments) -> None:
+    """
+    사이드카 파일을 임시 파일에 쓴 뒤 교체합니다.
+    
+    형식: MAGIC(8) + 헤더 길이(8, little-endian) + JSON 헤더 + 8바이트 정렬된
+    데이터 구간들. 쓰는 도중 중단되어도 이전 파일이 깨지지 않습니다.
+    """
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    meta_bytes += b" " * (-len(meta_bytes) % 8)
+    fd, temp = tempfile.mkstemp(prefix=target.name + ".", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(magic)
+            f.write(struct.pack("<Q", len(meta_bytes)))
+            f.write(meta_bytes)
+            for part in segments.parts:
+                f.write(part)
+        os.replace(temp, target)
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+
+
+def _open_sidecar(path: Path, magic: bytes) -> Tuple[Dict[str, Any], memoryview]:
+    """
+    사이드카 파일을 mmap으로 열어 (JSON 헤더, 데이터 구간 시작부터의 뷰)를 반환합니다.
+    
+    Raises:
+        OSError: 파일을 열 수 없을 때
+        ValueError: 형식이 다를 때
+    """
+    with open(path, "rb") as f:
+        if f.read(len(magic)) != magic:
+            raise ValueError(f"사이드카 형식이 아닙니다: {path}")
+        size = f.read(8)
+        if len(size) != 8:
+            raise ValueError(f"사이드카 헤더가 잘렸습니다: {path}")
+        (meta_len,) = struct.unpack("<Q", size)
+        meta = json.loads(f.read(meta_len).decode("utf-8"))
+        if not isinstance(meta, dict):
+            raise ValueError(f"사이드카 헤더가 잘못되었습니다: {path}")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return meta, memoryview(mapped)[len(magic) + 8 + meta_len:]
+
+
+def _sidecar_segment(data: memoryview, location: Any, typecode: str, swap: bool = False):
+    """
+    데이터 구간 [시작, 길이]를 typecode 요소의 버퍼로 반환합니다.
+    
+    구간이 파일 범위를 벗어나거나 요소 크기로 나누어떨어지지 않으면
+    ValueError를 냅니다. swap이면 바이트 순서를 바꾼 array 복사본을 반환합니다.
+    """
+    if (not isinstance(location, list) or len(location) != 2
+            or not all(type(x) is int for x in location)):
+        raise ValueError(f"데이터 구간이 잘못되었습니다: {location!r}")
+    start, length = location
+    itemsize = array(typecode).itemsize
+    if start < 0 or length < 0 or start + length > len(data) or length % itemsize:
+        raise ValueError(f"데이터 구간이 파일 범위를 벗어납니다: {location!r}")
+    view = data[start:start + length]
+    if swap and itemsize > 1:
+        values = _to_array(view, typecode)
+        values.byteswap()
+        return values
+    return view.cast(typecode)
+
+
+# StringColumn 코드 배열로 허용하는 타입 코드
+_CODE_TYPECODES = frozenset("bBhHiIlLqQ")
+
+
+def _write_cache(filepath: Path, key: Dict[str, Any], encoding: str,
+                 header: List[str], columns: Dict[str, Column], n_rows: int) -> None:
+    """
+    열 저장소를 바이너리 캐시 파일로 저장합니다 (형식은 _write_sidecar() 참고).
+    
+    숫자 값·상태·코드 배열은 원시 바이트 그대로 저장하여 읽을 때 mmap으로
+    복사 없이 사용할 수 있게 합니다.
+    """
+    segments = _Segments()
+    tables = []
+    for name, col in columns.items():
+        if isinstance(col, NumericColumn):
+            tables.append({
+                "name": name,
+                "dtype": "numeric",
+                "values": segments.add(memoryview(col.values).cast("B").tobytes()),
+                "status": segments.add(bytes(col.status)),
+                "raw": {str(i): text for i, text in col.raw.items()},
+                "decimals": col.decimals,
+            })
+        else:
+            tables.append({
+                "name": name,
+                "dtype": "string",
+                "codes": segments.add(memoryview(col.codes).cast("B").tobytes()),
+                "typecode": _typecode(col.codes),
+                "dictionary": col.dictionary,
+            })
+    
+    meta = dict(key, version=_CACHE_VERSION, byteorder=sys.byteorder,
+                detected_encoding=encoding, header=header, n_rows=n_rows, tables=tables)
+    _write_sidecar(_cache_path(filepath), _CACHE_MAGIC, meta, segments)
+
+
+def _read_cache(filepath: Path, key: Dict[str, Any]
+                ) -> Optional[Tuple[str, List[str], Dict[str, Column], int]]:
+    """
+    유효한 캐시 파일이 있으면 mmap으로 열어 열 저장소를 반환합니다.
+    
+    Returns:
+        (감지된 인코딩, 헤더, 열 저장소, 행 수) 또는 캐시가 없거나 오래되었거나
+        구조가 잘못된 경우 None
+    """
+    try:
+        meta, data = _open_sidecar(_cache_path(filepath), _CACHE_MAGIC)
+        if meta.get("version") != _CACHE_VERSION or any(meta.get(k) != v for k, v in key.items()):
+            return None
+        return _cache_tables(meta, data)
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+def _cache_tables(meta: Dict[str, Any], data: memoryview
+                  ) -> Tuple[str, List[str], Dict[str, Column], int]:
+    """캐시 헤더를 검사하며 열 저장소를 만듭니다. 구조가 잘못되면 ValueError 등을 냅니다."""
+    encoding, header, n_rows = meta["detected_encoding"], meta["header"], meta["n_rows"]
+    if (not isinstance(encoding, str) or type(n_rows) is not int or n_rows < 0
+            or not isinstance(header, list) or not all(isinstance(h, str) for h in header)):
+        raise ValueError("캐시 헤더가 잘못되었습니다")
+    swap = meta["byteorder"] != sys.byteorder
+    
+    columns: Dict[str, Column] = {}
+    for table in meta["tables"]:
+        if table["dtype"] == "numeric":
+            values = _sidecar_segment(data, table["values"], "d", swap)
+            status = bytes(_sidecar_segment(data, table["status"], "B"))
+            raw = {int(i): text for i, text in table["raw"].items()}
+            decimals = table["decimals"]
+            # 원문을 보관한 셀과 raw의 항목이 정확히 일치해야 get()이 실패하지 않습니다.
+            if (len(values) != n_rows or len(status) != n_rows
+                    or max(status, default=_MISSING) > _RAW_TEXT
+                    or status.count(_RAW_NUMBER) + status.count(_RAW_TEXT) != len(raw)
+                    or not all(isinstance(text, str) and 0 <= i < n_rows
+                               and status[i] >= _RAW_NUMBER for i, text in raw.items())
+                    or not (decimals is None or type(decimals) is int)
+                    or (decimals is None and _FIXED in status)):
+                raise ValueError("캐시의 숫자 열이 잘못되었습니다")
+            col: Column = NumericColumn(values, status, raw, decimals)
+        elif table["dtype"] == "string":
+            if table["typecode"] not in _CODE_TYPECODES:
+                raise ValueError("캐시의 코드 타입이 잘못되었습니다")
+            codes = _sidecar_segment(data, table["codes"], table["typecode"], swap)
+            dictionary = table["dictionary"]
+            if (len(codes) != n_rows or not isinstance(dictionary, list)
+                    or not all(isinstance(text, str) for text in dictionary)
+                    or min(codes, default=0) < 0 or max(codes, default=-1) >= len(dictionary)):
+                raise ValueError("캐시의 문자 열이 잘못되었습니다")
+            col = StringColumn(codes, dictionary)
+        else:
+            raise ValueError("캐시의 열 타입이 잘못되었습니다")
+        if table["name"] not in header:
+            raise ValueError("캐시의 열 이름이 헤더에 없습니다")
+        columns[table["name"]] = col
+    
+    return encoding, header, columns, n_rows
+
+
+def _blank_column(n_rows: int) -> StringColumn:
+    """값이 모두 빈 문자열인 열 (해당 열이 없는 파일을 채우는 용도)"""
+    return StringColumn(array("i", bytes(4 * n_rows)), [""])
+
+
+def _conform_table(columns: Dict[str, Column], n_rows: int,
+                   header: List[str]) -> Dict[str, Column]:
+    """파일별 열 저장소를 합친 스키마에 맞춥니다 (없는 열은 빈 값으로 채움)."""
+    return {name: columns[name] if name in columns else _blank_column(n_rows)
+            for name in dict.fromkeys(header)}
+
+
+def _concat_columns(parts: List[Column]) -> Column:
+    """
+    파일별로 나뉜 같은 이름의 열을 하나로 이어 붙입니다.
+    
+    모두 숫자형(소수 자릿수가 같음)이거나 모두 문자형이면 버퍼와 사전을
+    그대로 합치고, 타입이 섞여 있으면 전체 값을 기준으로 타입을 다시
+    추론합니다. 빈 값만 있는 문자형 열은 어느 쪽과도 합칠 수 있습니다.
+    """
+    blank = [isinstance(col, StringColumn) and all(map(_is_blank, col.dictionary))
+             for col in parts]
+    numeric = [col for col in parts if isinstance(col, NumericColumn)]
+    strings = [col for col, empty in zip(parts, blank)
+               if isinstance(col, StringColumn) and not empty]
+    decimals = {col.decimals for col in numeric if col.decimals is not None}
+    
+    if numeric and not strings and len(decimals) <= 1:
+        values, status, raw = array("d"), bytearray(), {}
+        for col in parts:
+            base = len(values)
+            if isinstance(col, NumericColumn):
+                values.frombytes(memoryview(col.values).cast("B"))
+                status.extend(col.status)
+                raw.update((base + i, text) for i, text in col.raw.items())
+                continue
+            for i, text in enumerate(col.strings(), base):
+                values.append(0.0)
+                if text:
+                    raw[i] = text
+                    status.append(_RAW_TEXT)
+                else:
+                    status.append(_MISSING)
+        return NumericColumn(values, status, raw, decimals.pop() if decimals else None)
+    
+    if not numeric:
+        lookup: Dict[str, int] = {}
+        codes = array("i")
+        for col in parts:
+            remap = [lookup.setdefault(text, len(lookup)) for text in col.dictionary]
+            codes.extend(map(remap.__getitem__, col.codes))
+        return StringColumn(codes, list(lookup))
+    
+    builder = _ColumnBuilder()
+    for col in parts:
+        builder.extend(list(col.strings()))
+    return builder.finish()
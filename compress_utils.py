@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+compress_utils.py - 압축 입력 스트리밍 유틸리티
+
+gzip, bz2, xz, zstd로 압축된 파일을 확장자가 아닌 매직 바이트로 감지하여
+임시 파일에 풀지 않고 고정 크기 버퍼로 스트리밍 해제합니다. 압축되지 않은
+파일은 그대로 엽니다. data_analyzer.py, json_utils.py에서 사용합니다.
+"""
+
+import io
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+# 선택적 의존성: zstd 압축 파일을 읽을 때만 필요합니다.
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# 압축 형식별 파일 시작 바이트
+COMPRESSION_MAGIC = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+# 디렉터리에서 데이터 파일을 찾을 때 함께 인식하는 압축 확장자
+COMPRESSED_SUFFIXES = (".gz", ".bz2", ".xz", ".zst")
+
+# 해제 스트림의 읽기 버퍼 크기
+BUFFER_SIZE = 1 << 16
+
+
+def detect_compression(filepath: Union[str, Path]) -> Optional[str]:
+    """
+    파일의 압축 형식을 매직 바이트로 감지합니다.
+
+    Returns:
+        "gzip", "bz2", "xz", "zstd" 중 하나 또는 압축되지 않았으면 None
+    """
+    with open(filepath, "rb") as f:
+        head = f.read(max(len(magic) for magic in COMPRESSION_MAGIC.values()))
+    for name, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _open_zstd(filepath: Union[str, Path], buffer_size: int) -> BinaryIO:
+    if not ZSTD_AVAILABLE:
+        raise ImportError(
+            "zstandard가 설치되지 않았습니다.\n"
+            "설치: pip install zstandard"
+        )
+    reader = zstandard.ZstdDecompressor().stream_reader(
+        open(filepath, "rb"), read_size=buffer_size, read_across_frames=True, closefd=True)
+    return io.BufferedReader(reader, buffer_size)
+
+
+def open_compressed(filepath: Union[str, Path], mode: str = "rb",
+                    encoding: Optional[str] = None, errors: Optional[str] = None,
+                    newline: Optional[str] = None, buffer_size: int = BUFFER_SIZE):
+    """
+    파일을 읽기 전용으로 엽니다. 압축 파일이면 스트리밍으로 해제합니다.
+
+    해제는 buffer_size 단위로 필요할 때만 이루어지므로 메모리 사용량은 파일
+    크기와 무관합니다. zstd 스트림처럼 되감을 수 없는 경우 반환된 파일의
+    seekable()이 False입니다.
+
+    Args:
+        filepath: 파일 경로
+        mode: "rb"(바이너리) 또는 "r"/"rt"(텍스트)
+        encoding, errors, newline: 텍스트 모드 옵션 (open()과 같음)
+        buffer_size: 해제 버퍼 크기 (바이트)
+
+    Returns:
+        바이너리 또는 텍스트 파일 객체
+    """
+    if mode not in ("r", "rt", "rb"):
+        raise ValueError(f"읽기 모드만 지원합니다: {mode}")
+
+    compression = detect_compression(filepath)
+    if compression is None:
+        if mode == "rb":
+            return open(filepath, "rb", buffering=buffer_size)
+        return open(filepath, "r", buffering=buffer_size,
+                    encoding=encoding, errors=errors, newline=newline)
+
+    if compression == "gzip":
+        binary = gzip.open(filepath, "rb")
+    elif compression == "bz2":
+        binary = bz2.open(filepath, "rb")
+    elif compression == "xz":
+        binary = lzma.open(filepath, "rb")
+    else:
+        binary = _open_zstd(filepath, buffer_size)
+
+    if mode == "rb":
+        return binary
+    return io.TextIOWrapper(binary, encoding=encoding, errors=errors, newline=newline)
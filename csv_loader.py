@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+csv_loader.py - CSV 로딩
+
+data_analyzer.py가 CSV 파일(압축 가능)을 읽는 부분입니다. 인코딩과 구분자
+감지, 필요한 열과 필터를 만족하는 행만 읽는 로딩, 바이너리 캐시 사용,
+mmap으로 연 파일을 필요한 열만 만드는 지연 로딩 테이블을 제공합니다.
+"""
+
+import io
+import csv
+import os
+import glob
+import mmap
+import codecs
+import operator
+from array import array
+from itertools import accumulate, chain, compress, count, islice
+from typing import List, Dict, Optional, Tuple, Union, Iterable, Iterator, BinaryIO
+from collections.abc import Mapping
+from pathlib import Path
+
+from compress_utils import COMPRESSED_SUFFIXES, detect_compression, open_compressed
+from column_store import (Column, _build_table, _cache_key, _iter_row_batches, _read_cache,
+                          _sniff_delimiter, _write_cache)
+from filter_planner import _filter_rows, _parse_filter
+
+
+class _ByteRange(io.RawIOBase):
+    """열린 바이너리 파일의 [start, end) 구간만 읽는 파일 객체"""
+
+    def __init__(self, f: BinaryIO, start: int, end: int):
+        self._file = f
+        self._position = start
+        self._end = end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._end - self._position)
+        if size <= 0:
+            return 0
+        self._file.seek(self._position)
+        data = self._file.read(size)
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+def _expand_paths(filepath: Union[str, Path]) -> List[Path]:
+    """
+    경로를 읽을 파일 목록으로 펼칩니다.
+    
+    디렉터리면 그 안의 *.csv 파일(*.csv.gz 등 압축 파일 포함)을, glob
+    패턴(*, ?, [])이면 일치하는 파일을 이름순으로 반환합니다. 그 밖에는
+    경로 하나만 반환합니다.
+    """
+    path = Path(filepath)
+    if path.is_dir():
+        patterns = ["*.csv"] + [f"*.csv{suffix}" for suffix in COMPRESSED_SUFFIXES]
+        files = sorted(p for pattern in patterns for p in path.glob(pattern) if p.is_file())
+    elif not path.exists() and any(ch in str(filepath) for ch in "*?["):
+        files = sorted(Path(p) for p in glob.glob(str(filepath)) if os.path.isfile(p))
+    else:
+        return [path]
+    if not files:
+        raise FileNotFoundError(f"일치하는 파일이 없습니다: {filepath}")
+    return files
+
+
+def _union_header(headers: List[List[str]]) -> List[str]:
+    """여러 파일의 헤더를 합칩니다 (첫 파일 순서를 따르고 새 열은 뒤에 추가)."""
+    result = list(headers[0])
+    seen = set(result)
+    for header in headers[1:]:
+        for name in header:
+            if name not in seen:
+                seen.add(name)
+                result.append(name)
+    return result
+
+
+def _open_csv(filepath: Path, encoding: str):
+    """
+    CSV 파일을 텍스트로 열고 구분자를 감지합니다 (압축 파일은 스트리밍으로 해제).
+    
+    Returns:
+        (처음 위치의 파일 객체, 구분자)
+    """
+    f = open_compressed(filepath, "rt", encoding=encoding, newline="")
+    try:
+        delimiter = _sniff_delimiter(f.read(4096))
+        if f.seekable():
+            f.seek(0)
+            return f, delimiter
+    except Exception:
+        f.close()
+        raise
+    # 되감을 수 없는 해제 스트림(zstd)은 다시 엽니다.
+    f.close()
+    return open_compressed(filepath, "rt", encoding=encoding, newline=""), delimiter
+
+
+def _read_header(filepath: Path, encoding: str) -> Tuple[str, str, List[str]]:
+    """
+    파일 앞부분만 읽어 (인코딩, 구분자, 헤더)를 반환합니다.
+    
+    인코딩은 앞부분을 디코딩해 보고 고르므로, 뒤쪽의 디코딩 오류는 실제로
+    읽을 때 드러납니다.
+    """
+    encoding = _probe_encoding(filepath, _encoding_candidates(encoding))
+    f, delimiter = _open_csv(filepath, encoding)
+    with f:
+        header = next(csv.reader(f, delimiter=delimiter), [])
+    return encoding, delimiter, header
+
+
+def _read_csv(filepath: Path, encoding: str, usecols: Optional[List[str]] = None,
+              where: Optional[str] = None) -> Tuple[str, List[str], Dict[str, Column], int, int]:
+    """
+    CSV 파일을 읽어 열 저장소를 구성합니다.
+    
+    Args:
+        usecols: 만들 열 이름 (기본값: 전체). 나머지 열은 셀을 꺼내지 않습니다.
+        where: 필터 식. 만족하는 행만 열에 저장합니다 (식의 열은 usecols에
+            없어도 됩니다).
+    
+    Returns:
+        (실제로 사용한 인코딩, 헤더, 열 저장소, 저장한 행 수, 파일의 전체 행 수)
+    """
+    encodings_to_try = [encoding, "utf-8", "cp949", "euc-kr", "latin-1"]
+    plan = _parse_filter(where) if where is not None else None
+    
+    for enc in encodings_to_try:
+        try:
+            f, delimiter = _open_csv(filepath, enc)
+            with f:
+                reader = csv.reader(f, delimiter=delimiter)
+                header = next(reader, [])
+                names = None if usecols is None else [name for name in header if name in usecols]
+                if plan is None:
+                    columns, n_rows = _build_table(_iter_row_batches(reader, len(header)),
+                                                   header, names)
+                    return enc, header, columns, n_rows, n_rows
+                # 거르기 전 행 수는 행마다 번호를 붙여 셉니다 (C 수준 반복만 추가).
+                counter = count()
+                rows = map(operator.itemgetter(0), zip(reader, counter))
+                columns, n_rows = _build_table(
+                    _iter_row_batches(_filter_rows(rows, plan, header), len(header)),
+                    header, names)
+                return enc, header, columns, n_rows, next(counter)
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+    
+    raise ValueError(f"파일을 읽을 수 없습니다: {filepath}")
+
+
+def _load_table(filepath: Path, encoding: str, cache: bool,
+                usecols: Optional[List[str]] = None, where: Optional[str] = None
+                ) -> Tuple[str, List[str], Dict[str, Column], int, int]:
+    """
+    CSV 파일 하나를 열 저장소로 읽습니다 (작업 프로세스에서도 사용).
+    
+    cache가 True면 유효한 바이너리 캐시를 사용하고, 없으면 새로 만듭니다.
+    usecols/where는 _read_csv()와 같으며 캐시와 함께 쓸 수 없습니다.
+    """
+    if usecols is not None or where is not None:
+        return _read_csv(filepath, encoding, usecols, where)
+    if cache:
+        key = _cache_key(filepath, encoding)
+        cached = _read_cache(filepath, key)
+        if cached is not None:
+            return (*cached, cached[3])
+    
+    loaded = _read_csv(filepath, encoding)
+    
+    if cache:
+        try:
+            _write_cache(filepath, key, *loaded[:4])
+        except OSError:
+            pass  # 캐시는 선택 사항이므로 저장 실패는 무시
+    return loaded
+
+
+# mmap 지연 로딩을 쓸 수 있는 인코딩 (codecs 정식 이름). 여러 바이트 문자의
+# 뒷바이트에 줄바꿈(0x0A)·따옴표(0x22)가 나오지 않아 바이트 단위로 행 경계를
+# 찾아도 안전합니다.
+_MAPPABLE_ENCODINGS = frozenset({"utf-8", "utf-8-sig", "cp949", "euc_kr",
+                                 "iso8859-1", "ascii", "cp1252"})
+
+# 인코딩을 고를 때 디코딩해 보는 파일 앞부분 크기 (바이트)
+_ENCODING_PROBE = 1 << 16
+
+
+class _MappedTable(Mapping):
+    """
+    mmap으로 연 CSV 파일을 열 이름 -> 열 객체 매핑으로 보여주는 지연 로딩 테이블
+
+    처음 열 때 파일을 바이트 단위로 한 번 훑어 행 시작 위치 인덱스만
+    만듭니다. 따옴표가 없는 구간은 줄바꿈 위치만으로 행을 나누고, 따옴표가
+    있는 구간만 csv 모듈로 파싱해 여러 줄에 걸친 값의 경계를 찾습니다.
+    열은 처음 접근할 때 요청된 열만 타입 추론하여 만들고, head/tail 등 행
+    단위 접근은 해당 행의 바이트만 디코딩합니다.
+
+    파일은 열려 있는 동안 바뀌지 않는다고 가정합니다.
+    """
+
+    BLOCK_SIZE = 1 << 20
+
+    def __init__(self, filepath: Path, encoding: str, mapped: mmap.mmap,
+                 usecols: Optional[List[str]] = None, candidates: Optional[List[str]] = None):
+        self.filepath = filepath
+        self.encoding = encoding
+        self.backend: Optional[str] = None
+        self._mapped = mapped
+        # 디코딩 오류가 나면 이 순서로 다음 인코딩을 시도
+        self._candidates = candidates or [encoding]
+        self._decoded: Dict[str, Column] = {}
+
+        sample = codecs.getincrementaldecoder(encoding)(errors="replace").decode(mapped[:16384])
+        self.delimiter = _sniff_delimiter(sample[:4096])
+        reader, ends = self._reader(0)
+        self.header: List[str] = next(reader, [])
+        # 이름이 중복되면 csv.DictReader처럼 마지막 열을 사용. usecols가 있으면
+        # 그 열만 보여주고 만듭니다 (header는 행 파싱용으로 전체를 유지).
+        self._positions = {name: i for i, name in enumerate(self.header)
+                           if usecols is None or name in usecols}
+        self._data_start = ends[reader.line_num - 1] if reader.line_num else len(mapped)
+        self._offsets: Optional[array] = self._index(self._data_start)
+
+    @classmethod
+    def open(cls, filepath: Path, encoding: str, usecols: Optional[List[str]] = None
+             ) -> Optional["_MappedTable"]:
+        """
+        파일을 mmap으로 열고 행 인덱스를 만듭니다.
+
+        인코딩은 파일 앞부분만 디코딩해 보고 고르며, 뒤에서 디코딩 오류가
+        나면 그때 다음 후보로 바꿉니다 (_fall_back()). 압축 파일, 빈 파일,
+        바이트 단위로 행을 나눌 수 없는 인코딩이거나 CR만 쓰는 줄바꿈처럼 행
+        경계를 확정할 수 없으면 None을 반환합니다 (호출자는 일반 로딩을 사용).
+        """
+        if detect_compression(filepath) is not None:
+            return None
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        candidates = _encoding_candidates(encoding)
+        encoding = _sniff_encoding(mapped[:_ENCODING_PROBE], candidates,
+                                   len(mapped) <= _ENCODING_PROBE)
+        table = None
+        try:
+            if codecs.lookup(encoding).name in _MAPPABLE_ENCODINGS:
+                try:
+                    table = cls(filepath, encoding, mapped, usecols, candidates)
+                except UnicodeDecodeError:
+                    # 헤더나 따옴표 구간을 파싱하다 실패: 파일 전체로 다시 고름
+                    rest = candidates[candidates.index(encoding) + 1:]
+                    encoding = _detect_encoding(filepath, rest)
+                    if codecs.lookup(encoding).name in _MAPPABLE_ENCODINGS:
+                        table = cls(filepath, encoding, mapped, usecols, candidates)
+        except csv.Error:
+            table = None
+        if table is None or table._offsets is None:
+            mapped.close()
+            return None
+        return table
+
+    def _reader(self, position: int):
+        """
+        position부터 한 줄씩 디코딩해 읽는 csv.reader를 만듭니다.
+
+        Returns:
+            (reader, 읽은 줄마다의 끝 위치 목록). reader.line_num번째 줄까지
+            읽었다면 다음 행은 ends[reader.line_num - 1]에서 시작합니다.
+        """
+        mapped, size = self._mapped, len(self._mapped)
+        ends: List[int] = []
+
+        def lines() -> Iterator[str]:
+            cursor = position
+            while cursor < size:
+                end = mapped.find(b"\n", cursor)
+                end = size if end < 0 else end + 1
+                ends.append(end)
+                yield mapped[cursor:end].decode(self.encoding)
+                cursor = end
+
+        return csv.reader(lines(), delimiter=self.delimiter), ends
+
+    def _index(self, position: int) -> Optional[array]:
+        """
+        데이터 행(빈 줄 제외)의 시작 위치 배열을 만듭니다.
+        
+        따옴표가 없는 줄은 줄바꿈 위치만으로 나누고, 따옴표가 있는 줄부터
+        따옴표가 없는 줄이 나올 때까지만 csv로 파싱합니다. CR만 쓰는
+        줄바꿈을 만나면 (csv 모듈과 같은 행 경계를 보장할 수 없으므로)
+        None을 반환합니다.
+        """
+        mapped, size = self._mapped, len(self._mapped)
+        offsets = array("q")
+        while position < size:
+            # 블록은 항상 줄바꿈 바로 뒤에서 끝나도록 자름
+            end = mapped.find(b"\n", min(position + self.BLOCK_SIZE, size) - 1)
+            end = size if end < 0 else end + 1
+            if mapped.find(b"\r", position, end) >= 0:
+                block = mapped[position:end]
+                if block.count(b"\r") != block.count(b"\r\n"):
+                    return None
+            
+            while position < end:
+                quote = mapped.find(b'"', position, end)
+                stop = end if quote < 0 else max(position, mapped.rfind(b"\n", position, quote) + 1)
+                self._index_lines(position, stop, offsets)
+                position = stop
+                if quote >= 0:
+                    position = self._index_quoted(position, offsets)
+        return offsets
+    
+    def _index_lines(self, start: int, end: int, offsets: array) -> None:
+        """따옴표가 없는 [start, end) 구간의 줄 시작 위치를 추가합니다."""
+        if start >= end:
+            return
+        lines = self._mapped[start:end].split(b"\n")
+        if not lines[-1]:
+            lines.pop()
+        starts = accumulate(map((1).__add__, map(len, lines)), initial=start)
+        if b"" in lines or b"\r" in lines:
+            offsets.extend(compress(starts, [line not in (b"", b"\r") for line in lines]))
+        else:
+            offsets.extend(islice(starts, len(lines)))
+    
+    def _index_quoted(self, position: int, offsets: array) -> int:
+        """
+        따옴표가 있는 줄에서 시작해 csv로 행을 파싱하며 인덱스를 추가합니다.
+        
+        여러 줄에 걸친 값을 포함해 행을 끝까지 읽고, 다음 줄에 따옴표가
+        없으면 멈춥니다. 멈춘 위치(행 경계)를 반환합니다.
+        """
+        mapped, size = self._mapped, len(self._mapped)
+        reader, ends = self._reader(position)
+        while position < size:
+            record = next(reader, None)
+            if record is None:
+                break
+            if record:
+                offsets.append(position)
+            position = ends[reader.line_num - 1]
+            line_end = mapped.find(b"\n", position)
+            if mapped.find(b'"', position, size if line_end < 0 else line_end) < 0:
+                break
+        return position
+    
+    @property
+    def n_rows(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def loaded(self) -> bool:
+        """모든 열이 만들어졌는지 여부"""
+        return len(self._decoded) == len(self._positions)
+
+    def __getitem__(self, name: str) -> Column:
+        if name not in self._decoded:
+            if name not in self._positions:
+                raise KeyError(name)
+            self.load([name])
+        return self._decoded[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def values(self):
+        self.load(self._positions)
+        return super().values()
+
+    def items(self):
+        self.load(self._positions)
+        return super().items()
+
+    def _fall_back(self) -> None:
+        """
+        디코딩 오류가 나면 파일 전체를 디코딩할 수 있는 다음 후보 인코딩으로
+        바꾸고, 이전 인코딩으로 만든 열은 버립니다.
+        """
+        rest = self._candidates[self._candidates.index(self.encoding) + 1:]
+        self.encoding = _detect_encoding(self.filepath, rest)
+        self._decoded.clear()
+
+    def load(self, names: Iterable[str]) -> None:
+        """아직 만들지 않은 열들을 파일을 한 번 파싱하여 함께 만듭니다."""
+        names = list(dict.fromkeys(names))
+        while True:
+            missing = [name for name in names if name not in self._decoded]
+            if not missing:
+                return
+            try:
+                columns, _ = _build_table(self._batches(), self.header, missing)
+                break
+            except UnicodeDecodeError:
+                self._fall_back()
+        for col in columns.values():
+            col.backend = self.backend
+        self._decoded.update(columns)
+    
+    def _batches(self) -> Iterator[List[List[str]]]:
+        """데이터 행 전체를 처음부터 파싱해 행 묶음으로 반환합니다."""
+        text = io.TextIOWrapper(
+            io.BufferedReader(_ByteRange(self._mapped, self._data_start, len(self._mapped))),
+            encoding=self.encoding, newline="")
+        reader = csv.reader(text, delimiter=self.delimiter)
+        return _iter_row_batches(reader, len(self.header))
+    
+    def iter_rows(self) -> Iterator[Dict[str, str]]:
+        """
+        모든 행을 열을 만들지 않고 파일 순서대로 dict로 반환합니다.
+
+        도중에 디코딩 오류가 나면 인코딩을 바꿔 이미 반환한 행 다음부터 이어갑니다.
+        """
+        positions = self._positions
+        done = 0
+        while True:
+            try:
+                for cells in islice(chain.from_iterable(self._batches()), done, None):
+                    yield {name: cells[position] for name, position in positions.items()}
+                    done += 1
+                return
+            except UnicodeDecodeError:
+                self._fall_back()
+
+    def row(self, index: int) -> Dict[str, str]:
+        """index번째 행을 그 행의 바이트만 디코딩하여 dict로 반환합니다."""
+        start = self._offsets[index]
+        end = self._offsets[index + 1] if index + 1 < len(self._offsets) else len(self._mapped)
+        try:
+            text = self._mapped[start:end].decode(self.encoding)
+        except UnicodeDecodeError:
+            self._fall_back()
+            text = self._mapped[start:end].decode(self.encoding)
+        reader = csv.reader(io.StringIO(text, newline=""), delimiter=self.delimiter)
+        cells = next(_iter_row_batches(reader, len(self.header), 1))[0]
+        return {name: cells[position] for name, position in self._positions.items()}
+
+
+def _encoding_candidates(encoding: str) -> List[str]:
+    """지정한 인코딩 다음에 시도할 인코딩까지 포함한 후보 목록"""
+    return list(dict.fromkeys([encoding, "utf-8", "cp949", "euc-kr", "latin-1"]))
+
+
+def _sniff_encoding(head: bytes, candidates: List[str], complete: bool) -> str:
+    """
+    파일 앞부분만 디코딩해 보고 인코딩을 고릅니다.
+    
+    complete가 False(파일이 더 남음)면 마지막 줄바꿈 뒤의 잘린 줄은 버립니다.
+    앞부분 뒤에서 디코딩 오류가 나는 경우는 읽는 쪽에서 처리합니다.
+    """
+    if not complete:
+        cut = head.rfind(b"\n")
+        if cut >= 0:
+            head = head[:cut + 1]
+    for enc in candidates:
+        try:
+            codecs.getincrementaldecoder(enc)().decode(head, final=complete)
+            return enc
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+    raise ValueError("파일을 읽을 수 없습니다: 지원하는 인코딩으로 디코딩되지 않습니다")
+
+
+def _probe_encoding(filepath: Path, candidates: List[str]) -> str:
+    """파일(압축 가능)의 처음 _ENCODING_PROBE 바이트로 인코딩을 고릅니다."""
+    with open_compressed(filepath, "rb") as f:
+        head = f.read(_ENCODING_PROBE + 1)
+    return _sniff_encoding(head[:_ENCODING_PROBE], candidates, len(head) <= _ENCODING_PROBE)
+
+
+def _decode_error(path: Path, encoding: str, error: UnicodeDecodeError) -> ValueError:
+    """스트리밍 중 디코딩 오류를 인코딩 지정 안내와 함께 ValueError로 바꿉니다."""
+    hint = next((enc for enc in _encoding_candidates(encoding)[1:]
+                 if _sniff_encoding(error.object, [enc], False) == enc), None)
+    message = f"{path}: {encoding}(으)로 디코딩할 수 없는 바이트가 있습니다"
+    if hint:
+        message += f" — --encoding {hint}로 다시 실행해 보세요"
+    return ValueError(message)
+
+
+def _detect_encoding(filepath: Path, candidates: List[str], block_size: int = 1 << 20) -> str:
+    """
+    파일 전체를 고정 크기 블록으로 디코딩해 보며 사용할 인코딩을 찾습니다.
+    
+    파일을 끝까지 읽으므로 앞부분으로 고른 인코딩이 뒤에서 실패했을 때만 씁니다.
+    """
+    for enc in candidates:
+        decoder = codecs.getincrementaldecoder(enc)()
+        try:
+            with open_compressed(filepath, "rb") as f:
+                for block in iter(lambda: f.read(block_size), b""):
+                    decoder.decode(block)
+                decoder.decode(b"", final=True)
+            return enc
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+    raise ValueError(f"파일을 읽을 수 없습니다: {filepath}")
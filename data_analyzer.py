@@ -3,37 +3,68 @@
 data_analyzer.py - 데이터 분석 유틸리티
 
 CSV 파일의 기본적인 데이터 분석 및 시각화 기능을 제공합니다.
-pandas 없이 기본 라이브러리만으로 구현되었습니다.
+pandas 없이 기본 라이브러리만으로 구현되었습니다. gzip/bz2/xz/zstd로
+압축된 CSV는 임시 파일 없이 스트리밍으로 해제하여 읽습니다.
+
+데이터는 열 단위(columnar)로 저장됩니다. 숫자형 열은 ``array('d')``와
+셀 상태 마스크로, 문자형 열은 사전(dictionary) 인코딩된 정수 코드로
+보관하며, 타입 추론은 로드 시 한 번만 수행합니다.
 """
 
+import io
+import re
 import csv
 import math
+import os
+import sys
+import heapq
+import pickle
+import shutil
+import random
+import time
+import operator
 import argparse
-from typing import List, Dict, Any, Optional, Tuple, Union
+import tempfile
+from array import array
+from bisect import bisect_right
+from itertools import chain, compress, islice, repeat
+from typing import (List, Dict, Any, Optional, Tuple, Union, Iterable, Iterator, Sequence,
+                    BinaryIO)
 from dataclasses import dataclass, field
-from collections import Counter, defaultdict
+from collections import Counter, deque
+from collections.abc import Sequence as SequenceABC
+from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
+from compress_utils import detect_compression, open_compressed
+from date_utils import DateFormat, DateUtils
+# 분리한 모듈의 공개 이름(열 타입, 인덱스, 내보내기 등)도 이 모듈에서 그대로 가져올 수 있습니다.
+from column_store import (BACKENDS, CACHE_SUFFIX, Column, NUMERIC_RATIO_THRESHOLD,
+                          NumericColumn, StringColumn, _build_table, _concat_columns,
+                          _conform_table, _format_number, _is_blank, _iter_row_batches,
+                          _numeric_arrays, _parse_number, _resolve_backend)
+from filter_planner import (FILTER_CONDITIONS, HashIndex, Index, INDEX_KINDS, SortedIndex,
+                            _filter_rows, _FilterContext, _FilterNode, _parse_filter,
+                            _Predicate)
+from csv_loader import (_ByteRange, _decode_error, _expand_paths, _load_table, _MappedTable,
+                        _read_header, _union_header)
+from sketches import (CHECKPOINT_SUFFIX, ColumnStats, _accumulate_batch, _accumulate_table,
+                      _CHECKPOINT_VERSION, _ColumnAccumulator, _last_line_end,
+                      _make_accumulator, _median, _percentile, _probe_digests, _RankFinder,
+                      _read_checkpoint, _summarize_column, _write_checkpoint)
+from sort_join import (JOIN_TYPES, _grace_hash_join, _join_keys, _join_pairs, _join_rows,
+                       _join_spec, _read_run, _row_sort_keys, _sort_spec, _top_k_indices,
+                       _write_run)
+from export_utils import COLUMNAR_SUFFIX, EXPORT_FORMATS, read_columnar, write_rows, _export
 
-@dataclass
-class ColumnStats:
-    """열의 통계 정보"""
-    name: str
-    dtype: str  # 'numeric', 'string', 'mixed'
-    count: int
-    missing: int
-    unique: int
-    
-    # 숫자형일 경우
-    min_val: Optional[float] = None
-    max_val: Optional[float] = None
-    mean: Optional[float] = None
-    median: Optional[float] = None
-    std_dev: Optional[float] = None
-    sum_val: Optional[float] = None
-    
-    # 문자형일 경우
-    top_values: List[Tuple[str, int]] = field(default_factory=list)
+# 선택적 의존성: 설치되어 있으면 숫자 연산을 벡터화합니다.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 @dataclass
@@ -47,379 +78,2898 @@ class DataSummary:
     sample_rows: List[Dict[str, Any]]
 
 
-class DataAnalyzer:
+@dataclass
+class SampleInfo:
+    """표본 추출 정보"""
+    method: str       # 'reservoir', 'bernoulli', 'stratified'
+    population: int   # 원본 행 수
+    size: int         # 표본 행 수
+    stratify: Optional[str] = None
+    strata: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # 층: (원본 행 수, 표본 행 수)
+    seed: Optional[int] = None
+    
+    @property
+    def fraction(self) -> float:
+        """표본 비율"""
+        return self.size / self.population if self.population else 0.0
+    
+    def proportion_error(self, p: float) -> Optional[float]:
+        """
+        표본에서 구한 행 비율 p의 표준오차 (유한 모집단 보정 포함).
+        
+        층화 표본도 단순 무작위 표본 공식으로 계산하므로 약간 보수적인 값입니다.
+        """
+        if self.size < 2:
+            return None
+        fpc = 1 - self.size / self.population
+        return math.sqrt(max(p * (1 - p), 0.0) / (self.size - 1) * fpc)
+    
+    def __str__(self) -> str:
+        text = f"{self.method} 표본 {self.size:,} / {self.population:,}행 ({self.fraction:.2%})"
+        if self.stratify:
+            text += f", '{self.stratify}' 기준 {len(self.strata):,}개 층"
+        return text
+
+
+@dataclass
+class PivotTable:
+    """피벗 테이블 (행 키 × 열 키 → 집계 값)"""
+    index: str                 # 행 키 열
+    columns: str               # 열 키 열
+    values: Optional[str]      # 집계한 열 (None이면 행 수)
+    aggfunc: str
+    row_keys: List[Any]
+    col_keys: List[Any]
+    cells: Dict[Tuple[Any, Any], Any]  # 행이 없는 조합은 빠져 있음
+
+    def get(self, row: Any, col: Any) -> Any:
+        """셀 값을 반환합니다 (해당 조합의 행이 없으면 None)."""
+        return self.cells.get((row, col))
+
+    @property
+    def header(self) -> List[str]:
+        """표 머리글: 행 키 열 이름 + 열 키들"""
+        return [self.index] + [str(col) for col in self.col_keys]
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """행 키마다 {행 키 열: 키, 열 키: 값, ...} dict를 반환합니다 (export()용)."""
+        header = self.header
+        for row in self.row_keys:
+            yield dict(zip(header, [row] + [self.cells.get((row, col)) for col in self.col_keys]))
+
+    def render(self, width: Optional[int] = None) -> str:
+        """render_wide_table()로 표를 문자열로 만듭니다 (빈 셀은 "-")."""
+        def cell(value: Any) -> str:
+            if value is None:
+                return "-"
+            if isinstance(value, float):
+                return f"{value:,.2f}"
+            if isinstance(value, int):
+                return f"{value:,}"
+            return str(value)
+
+        cells = self.cells
+        body = [[str(row)] + [cell(cells.get((row, col))) for col in self.col_keys]
+                for row in self.row_keys]
+        return render_wide_table(self.header, body, width)
+
+
+def _resolve_jobs(jobs: Optional[int]) -> int:
+    """작업 프로세스 수를 결정합니다 (0 이하 또는 None이면 CPU 코어 수)."""
+    if jobs is None or jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _bounded_map(executor: ProcessPoolExecutor, fn, iterable: Iterable,
+                 window: int, *args) -> Iterator:
     """
-    CSV 데이터 분석 클래스
+    executor.map()과 같지만 동시에 제출하는 작업을 window개로 제한합니다.
     
-    pandas 없이 기본 라이브러리만으로 데이터 분석을 수행합니다.
+    입력을 미리 모두 읽어 두지 않으므로 스트리밍 입력에서도 메모리 사용량이
+    일정하며, 결과는 입력 순서대로 반환합니다.
+    """
+    pending: deque = deque()
+    for item in iterable:
+        pending.append(executor.submit(fn, item, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+GROUP_AGGREGATES = ("size", "count", "sum", "mean", "min", "max", "std", "var", "median")
+_PERCENTILE_AGG = re.compile(r"p(100|\d{1,2}(?:\.\d+)?)$")
+
+# 예전 group_by(column, agg_column) 결과를 만드는 데 필요한 집계
+_LEGACY_AGGS = ["size", "count", "sum", "mean", "min", "max"]
+
+
+def _normalize_aggs(aggs: Optional[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """집계 지정({열: 집계 이름 또는 목록})을 검사하고 {열: 집계 이름 목록}으로 정규화합니다."""
+    result = {}
+    for column, names in (aggs or {}).items():
+        if isinstance(names, str):
+            names = [names]
+        names = list(dict.fromkeys(name.lower() for name in names))
+        for name in names:
+            if name not in GROUP_AGGREGATES and not _PERCENTILE_AGG.match(name):
+                raise ValueError(f"지원하지 않는 집계입니다: {name}")
+        result[column] = names
+    return result
+
+
+def _group_spec(columns: List[str], column: Optional[str], agg_column: Optional[str],
+                keys: Optional[Union[str, List[str]]], aggs: Optional[Dict[str, Any]]
+                ) -> Tuple[List[str], Dict[str, List[str]], bool]:
+    """group_by() 인자를 (키 열 목록, 집계 지정, 예전 형식 여부)로 변환합니다."""
+    if keys is None:
+        if column is None:
+            raise ValueError("그룹화 기준 열이 필요합니다")
+        if column not in columns:
+            raise ValueError(f"열이 존재하지 않습니다: {column}")
+        # 예전 방식: 존재하지 않는 집계 열은 무시하고 행 수만 셉니다.
+        if agg_column and agg_column in columns:
+            return [column], {agg_column: list(_LEGACY_AGGS)}, True
+        return [column], {}, True
+    
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    aggs = _normalize_aggs(aggs)
+    if not keys:
+        raise ValueError("그룹화 기준 열이 필요합니다")
+    for name in keys + list(aggs):
+        if name not in columns:
+            raise ValueError(f"열이 존재하지 않습니다: {name}")
+    return keys, aggs, False
+
+
+class _GroupAggregator:
     """
+    단일 패스 해시 그룹 집계
     
-    def __init__(self, filepath: str, encoding: str = "utf-8"):
-        """
-        Args:
-            filepath: CSV 파일 경로
-            encoding: 파일 인코딩 (기본값: utf-8)
+    키 튜플마다 [행 수, 집계 열별 상태...] 목록을 유지합니다. 집계 열 상태는
+    [숫자 수, 합계, 최솟값, 최댓값, 평균, M2, 값 배열]이며, 값 배열은
+    중앙값/분위수를 요청한 열에만 만듭니다. 그룹별 행 목록은 만들지 않고,
+    행 묶음마다 열 단위로 한 번씩 훑으며 누적합니다.
+    """
+    
+    def __init__(self, keys: List[str], aggs: Dict[str, List[str]]):
+        self.keys = keys
+        self.aggs = aggs
+        self.agg_columns = list(aggs)
+        self.moments = [any(name in ("std", "var") for name in aggs[column])
+                        for column in self.agg_columns]
+        self.keep_values = [any(name == "median" or _PERCENTILE_AGG.match(name)
+                                for name in aggs[column])
+                            for column in self.agg_columns]
+        self.groups: Dict[Tuple[str, ...], List] = {}
+    
+    def _new_group(self) -> List:
+        group: List[Any] = [0]
+        for keep in self.keep_values:
+            group.append([0, 0.0, None, None, 0.0, 0.0, array("d") if keep else None])
+        return group
+    
+    def add_columns(self, columns: Dict[str, Column]) -> None:
+        """행 묶음(열 집합)을 누적합니다."""
+        key_cols = [columns[name] for name in self.keys]
+        dictionaries = [col.dictionary if isinstance(col, StringColumn) else None
+                        for col in key_cols]
+        sources = [col.codes if isinstance(col, StringColumn) else col.strings()
+                   for col in key_cols]
+        
+        def decode(raw: Tuple) -> Tuple[str, ...]:
+            # 문자형 키 열은 정수 코드로 해시하고, 새 그룹일 때만 문자열로 바꿉니다.
+            return tuple(value if dictionary is None else dictionary[value]
+                         for value, dictionary in zip(raw, dictionaries))
+        
+        self._add(zip(*sources), decode,
+                  [columns[name].iter_numeric() for name in self.agg_columns])
+    
+    def add_rows(self, keys: List[Tuple[str, ...]],
+                 values: List[List[Optional[float]]]) -> None:
+        """키 튜플 목록과 집계 열별 숫자 값 목록을 누적합니다."""
+        self._add(keys, None, values)
+    
+    def _add(self, raw_keys: Iterable, decode, agg_values: List[Iterable[Optional[float]]]) -> None:
+        groups = self.groups
+        local: Dict[Any, List] = {}
+        
+        def lookup(raw) -> List:
+            key = raw if decode is None else decode(raw)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = self._new_group()
+            local[raw] = group
+            return group
+        
+        if not self.agg_columns:
+            for raw, n in Counter(raw_keys).items():
+                lookup(raw)[0] += n
+            return
+        
+        rows = []
+        for raw in raw_keys:
+            group = local.get(raw) or lookup(raw)
+            group[0] += 1
+            rows.append(group)
+        
+        for slot, values in enumerate(agg_values, 1):
+            moments = self.moments[slot - 1]
+            keep = self.keep_values[slot - 1]
+            for group, x in zip(rows, values):
+                if x is None:
+                    continue
+                state = group[slot]
+                state[0] += 1
+                state[1] += x
+                if state[2] is None or x < state[2]:
+                    state[2] = x
+                if state[3] is None or x > state[3]:
+                    state[3] = x
+                if moments:
+                    delta = x - state[4]
+                    state[4] += delta / state[0]
+                    state[5] += delta * (x - state[4])
+                if keep:
+                    state[6].append(x)
+    
+    def merge(self, other: "_GroupAggregator") -> None:
+        """다른 집계기의 그룹 상태를 합칩니다 (새 그룹은 뒤에 추가)."""
+        groups = self.groups
+        for key, theirs in other.groups.items():
+            mine = groups.get(key)
+            if mine is None:
+                groups[key] = theirs
+                continue
+            mine[0] += theirs[0]
+            for slot in range(1, len(mine)):
+                a, b = mine[slot], theirs[slot]
+                if b[0] == 0:
+                    continue
+                if a[0] == 0:
+                    mine[slot] = b
+                    continue
+                n = a[0] + b[0]
+                delta = b[4] - a[4]
+                a[5] += b[5] + delta * delta * a[0] * b[0] / n
+                a[4] += delta * b[0] / n
+                a[0] = n
+                a[1] += b[1]
+                a[2] = min(a[2], b[2])
+                a[3] = max(a[3], b[3])
+                if a[6] is not None:
+                    a[6].extend(b[6])
+    
+    @staticmethod
+    def _statistic(name: str, size: int, state: List) -> Any:
+        n, total, low, high, _, m2, values = state
+        if name == "size":
+            return size
+        if name == "count":
+            return n
+        if name == "sum":
+            return total
+        if n == 0:
+            return None
+        if name == "mean":
+            return total / n
+        if name == "min":
+            return low
+        if name == "max":
+            return high
+        if name == "var":
+            return m2 / (n - 1) if n > 1 else 0.0
+        if name == "std":
+            return math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+        if name == "median":
+            return _median(values)
+        return _percentile(values, float(name[1:]) / 100)
+    
+    def results(self) -> Iterator[Tuple[Any, Any]]:
         """
-        self.filepath = Path(filepath)
-        self.encoding = encoding
-        self.data: List[Dict[str, Any]] = []
-        self.columns: List[str] = []
+        (그룹 키, 집계 결과) 쌍을 그룹이 처음 나타난 순서로 반환합니다.
         
-        self._load_data()
+        키 열이 하나면 키는 문자열, 여러 개면 튜플입니다. 집계 결과는
+        {집계 열: {집계 이름: 값}}이며, 집계가 없으면 그룹의 행 수입니다.
+        """
+        single = len(self.keys) == 1
+        for key, group in self.groups.items():
+            out_key = key[0] if single else key
+            if not self.agg_columns:
+                yield out_key, group[0]
+                continue
+            yield out_key, {
+                column: {name: self._statistic(name, group[0], group[slot])
+                         for name in self.aggs[column]}
+                for slot, column in enumerate(self.agg_columns, 1)
+            }
+
+
+def _group_table(columns: Dict[str, Column], keys: List[str],
+                 aggs: Dict[str, List[str]]) -> _GroupAggregator:
+    """열 저장소 하나를 그룹 집계합니다 (작업 프로세스용)."""
+    aggregator = _GroupAggregator(keys, aggs)
+    aggregator.add_columns(columns)
+    return aggregator
+
+
+def _group_result(results: Iterable[Tuple[Any, Any]], aggs: Dict[str, List[str]],
+                  legacy: bool) -> Dict[Any, Any]:
+    """집계 결과를 dict로 모읍니다. 예전 방식 호출이면 예전 형식으로 변환합니다."""
+    if not legacy or not aggs:
+        return dict(results)
+    
+    (agg_column,) = aggs
+    result = {}
+    for key, out in results:
+        stats = out[agg_column]
+        if stats["count"]:
+            result[key] = {
+                "count": stats["size"],
+                "sum": stats["sum"],
+                "mean": stats["mean"],
+                "min": stats["min"],
+                "max": stats["max"],
+            }
+        else:
+            result[key] = {"count": stats["size"]}
+    return result
+
+
+def _label_order(label: Any) -> Tuple[bool, bool, float, str]:
+    """
+    피벗 키 정렬 순서: 숫자로 읽히는 키는 값 순서로 앞에, 나머지는 문자열
+    순서로, 결측치(빈 키)는 sort_by()처럼 항상 마지막에 둡니다.
+    """
+    blank = label is None or isinstance(label, str) and _is_blank(label)
+    number = _parse_number(label) if isinstance(label, str) else None
+    return blank, number is None, 0.0 if number is None else number, str(label)
+
+
+def _pivot_spec(columns: List[str], index: str, pivot_columns: str, values: Optional[str],
+                aggfunc: str) -> Tuple[List[str], Dict[str, List[str]]]:
+    """pivot() 인자를 group_by()의 (키 열 목록, 집계 지정)으로 변환합니다."""
+    for name in (index, pivot_columns) + ((values,) if values else ()):
+        if name not in columns:
+            raise ValueError(f"열이 존재하지 않습니다: {name}")
+    aggs = _normalize_aggs({values: aggfunc}) if values else {}
+    if values and len(aggs[values]) != 1:
+        raise ValueError("피벗 집계는 하나만 지정할 수 있습니다")
+    return [index, pivot_columns], aggs
+
+
+def _pivot_result(groups: Dict[Tuple[Any, Any], Any], index: str, columns: str,
+                  values: Optional[str], aggfunc: str) -> PivotTable:
+    """(행 키, 열 키) 그룹 집계 결과를 피벗 테이블로 바꿉니다."""
+    if values:
+        aggfunc = aggfunc.lower()
+        cells = {key: out[values][aggfunc] for key, out in groups.items()}
+    else:
+        aggfunc = "size"
+        cells = dict(groups)
+    row_keys = sorted({row for row, _ in cells}, key=_label_order)
+    col_keys = sorted({col for _, col in cells}, key=_label_order)
+    return PivotTable(index, columns, values, aggfunc, row_keys, col_keys, cells)
+
+
+def _numeric_pairs(col1: Column, col2: Column) -> Tuple[Sequence[float], Sequence[float]]:
+    """두 열 모두 숫자인 행의 값 쌍을 반환합니다 (NumPy 백엔드면 배열)."""
+    if col1.backend == "numpy" or col2.backend == "numpy":
+        x, x_valid = _numeric_arrays(col1)
+        y, y_valid = _numeric_arrays(col2)
+        both = x_valid & y_valid
+        return x[both], y[both]
+    
+    xs, ys = [], []
+    for x, y in zip(col1.iter_numeric(), col2.iter_numeric()):
+        if x is not None and y is not None:
+            xs.append(x)
+            ys.append(y)
+    return xs, ys
+
+
+class _CoMoments:
+    """
+    두 숫자 열의 평균과 공동 적률(co-moment)을 누적하는 병합 가능한 집계기
+    
+    블록마다 편차 곱의 합을 구한 뒤 Chan의 병합 공식으로 합치므로
+    행 묶음 단위로 나누어 계산해도 한 번에 계산한 것과 같은 결과를 줍니다.
+    """
+    
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.cxx = 0.0
+        self.cyy = 0.0
+        self.cxy = 0.0
+    
+    def add_pairs(self, xs: Sequence[float], ys: Sequence[float]) -> None:
+        """값 쌍 목록을 누적합니다."""
+        n = len(xs)
+        if n == 0:
+            return
+        part = _CoMoments()
+        part.n = n
+        if np is not None and isinstance(xs, np.ndarray):
+            part.mean_x = float(xs.sum()) / n
+            part.mean_y = float(ys.sum()) / n
+            dx = xs - part.mean_x
+            dy = ys - part.mean_y
+            part.cxx, part.cyy, part.cxy = float(dx @ dx), float(dy @ dy), float(dx @ dy)
+        else:
+            part.mean_x = sum(xs) / n
+            part.mean_y = sum(ys) / n
+            dx = [x - part.mean_x for x in xs]
+            dy = [y - part.mean_y for y in ys]
+            part.cxx = sum(map(operator.mul, dx, dx))
+            part.cyy = sum(map(operator.mul, dy, dy))
+            part.cxy = sum(map(operator.mul, dx, dy))
+        self.merge(part)
+    
+    def merge(self, other: "_CoMoments") -> None:
+        """다른 집계기의 결과를 합칩니다."""
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean_x, self.mean_y = other.n, other.mean_x, other.mean_y
+            self.cxx, self.cyy, self.cxy = other.cxx, other.cyy, other.cxy
+            return
+        n = self.n + other.n
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+        self.cxx += other.cxx + dx * dx * weight
+        self.cyy += other.cyy + dy * dy * weight
+        self.cxy += other.cxy + dx * dy * weight
+        self.mean_x += dx * other.n / n
+        self.mean_y += dy * other.n / n
+        self.n = n
+    
+    def correlation(self) -> Optional[float]:
+        """피어슨 상관계수를 반환합니다 (계산할 수 없으면 None)."""
+        if self.n < 2 or self.cxx == 0 or self.cyy == 0:
+            return None
+        return self.cxy / (math.sqrt(self.cxx) * math.sqrt(self.cyy))
+
+
+class _CorrelationMatrix:
+    """
+    여러 숫자 열의 쌍별 공동 적률을 한 번의 스캔으로 누적하는 집계기
+    
+    행을 BLOCK_SIZE개씩 나누어 열마다 한 번만 숫자 값을 꺼내고, 블록 안에서
+    결측이 없는 열은 평균과 편차를 한 번 계산해 모든 쌍에서 재사용합니다.
+    결측이 있는 쌍은 두 값이 모두 있는 행만 사용합니다 (pairwise-complete).
+    """
+    
+    BLOCK_SIZE = 65536
     
-    def _load_data(self) -> None:
-        """CSV 파일을 로드합니다."""
-        encodings_to_try = [self.encoding, "utf-8", "cp949", "euc-kr", "latin-1"]
+    def __init__(self, names: List[str]):
+        self.names = names
+        self.pairs = {(a, b): _CoMoments()
+                      for i, a in enumerate(names) for b in names[i + 1:]}
+        self.diagonal = {name: _CoMoments() for name in names}
+    
+    def add_columns(self, columns: Dict[str, Column]) -> None:
+        """행 묶음(열 집합)을 누적합니다."""
+        if any(columns[name].backend == "numpy" for name in self.names):
+            self._add_arrays({name: _numeric_arrays(columns[name]) for name in self.names})
+            return
         
-        for enc in encodings_to_try:
-            try:
-                with open(self.filepath, "r", encoding=enc, newline="") as f:
-                    # 구분자 자동 감지
-                    sample = f.read(4096)
-                    f.seek(0)
-                    
-                    # 구분자 추측
-                    delimiter = ","
-                    for delim in [",", "\t", ";", "|"]:
-                        if sample.count(delim) > sample.count(delimiter):
-                            delimiter = delim
-                    
-                    reader = csv.DictReader(f, delimiter=delimiter)
-                    self.columns = reader.fieldnames or []
-                    self.data = list(reader)
-                    self.encoding = enc
-                    return
-            except (UnicodeDecodeError, UnicodeError):
+        iterators = {name: columns[name].iter_numeric() for name in self.names}
+        while True:
+            blocks = {name: list(islice(it, self.BLOCK_SIZE)) for name, it in iterators.items()}
+            if not blocks or not any(blocks.values()):
+                return
+            self._add_block(blocks)
+    
+    def _add_block(self, blocks: Dict[str, List[Optional[float]]]) -> None:
+        # 결측이 없는 열: (평균, 편차 목록, 편차 제곱합)
+        complete: Dict[str, Tuple[float, List[float], float]] = {}
+        for name, block in blocks.items():
+            if None in block:
+                xs = [x for x in block if x is not None]
+                self.diagonal[name].add_pairs(xs, xs)
                 continue
+            mean = sum(block) / len(block)
+            dev = [x - mean for x in block]
+            ss = sum(map(operator.mul, dev, dev))
+            complete[name] = (mean, dev, ss)
+            part = _CoMoments()
+            part.n, part.mean_x, part.mean_y = len(block), mean, mean
+            part.cxx = part.cyy = part.cxy = ss
+            self.diagonal[name].merge(part)
         
-        raise ValueError(f"파일을 읽을 수 없습니다: {self.filepath}")
+        for (a, b), moments in self.pairs.items():
+            if a in complete and b in complete:
+                mean_a, dev_a, ss_a = complete[a]
+                mean_b, dev_b, ss_b = complete[b]
+                part = _CoMoments()
+                part.n, part.mean_x, part.mean_y = len(dev_a), mean_a, mean_b
+                part.cxx, part.cyy = ss_a, ss_b
+                part.cxy = sum(map(operator.mul, dev_a, dev_b))
+                moments.merge(part)
+            else:
+                xs, ys = [], []
+                for x, y in zip(blocks[a], blocks[b]):
+                    if x is not None and y is not None:
+                        xs.append(x)
+                        ys.append(y)
+                moments.add_pairs(xs, ys)
     
-    def _is_numeric(self, value: str) -> bool:
-        """값이 숫자인지 확인합니다."""
-        if not value or value.strip() == "":
-            return False
-        try:
-            float(value.replace(",", ""))
-            return True
-        except (ValueError, AttributeError):
-            return False
+    def _add_arrays(self, arrays: Dict[str, Tuple["np.ndarray", "np.ndarray"]]) -> None:
+        # _add_block()과 같은 블록 구조를 NumPy 배열로 계산합니다.
+        n_rows = len(next(iter(arrays.values()))[0]) if arrays else 0
+        for start in range(0, n_rows, self.BLOCK_SIZE):
+            stop = start + self.BLOCK_SIZE
+            blocks = {name: (values[start:stop], valid[start:stop])
+                      for name, (values, valid) in arrays.items()}
+            complete: Dict[str, Tuple[float, "np.ndarray", float]] = {}
+            for name, (values, valid) in blocks.items():
+                if not valid.all():
+                    xs = values[valid]
+                    self.diagonal[name].add_pairs(xs, xs)
+                    continue
+                mean = float(values.sum()) / len(values)
+                dev = values - mean
+                ss = float(dev @ dev)
+                complete[name] = (mean, dev, ss)
+                part = _CoMoments()
+                part.n, part.mean_x, part.mean_y = len(values), mean, mean
+                part.cxx = part.cyy = part.cxy = ss
+                self.diagonal[name].merge(part)
+            
+            for (a, b), moments in self.pairs.items():
+                if a in complete and b in complete:
+                    mean_a, dev_a, ss_a = complete[a]
+                    mean_b, dev_b, ss_b = complete[b]
+                    part = _CoMoments()
+                    part.n, part.mean_x, part.mean_y = len(dev_a), mean_a, mean_b
+                    part.cxx, part.cyy = ss_a, ss_b
+                    part.cxy = float(dev_a @ dev_b)
+                    moments.merge(part)
+                else:
+                    (x, x_valid), (y, y_valid) = blocks[a], blocks[b]
+                    both = x_valid & y_valid
+                    moments.add_pairs(x[both], y[both])
     
-    def _to_numeric(self, value: str) -> Optional[float]:
-        """값을 숫자로 변환합니다."""
-        if not value or value.strip() == "":
+    def merge(self, other: "_CorrelationMatrix") -> None:
+        """다른 집계기의 결과를 합칩니다."""
+        for key, moments in self.pairs.items():
+            moments.merge(other.pairs[key])
+        for name, moments in self.diagonal.items():
+            moments.merge(other.diagonal[name])
+    
+    def result(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """{열: {열: 상관계수}} 행렬을 반환합니다 (계산할 수 없는 칸은 None)."""
+        matrix: Dict[str, Dict[str, Optional[float]]] = {name: {} for name in self.names}
+        for a in self.names:
+            for b in self.names:
+                if a == b:
+                    matrix[a][b] = 1.0 if self.diagonal[a].correlation() is not None else None
+                elif (a, b) in self.pairs:
+                    matrix[a][b] = self.pairs[a, b].correlation()
+                else:
+                    matrix[a][b] = matrix[b][a]
+        return matrix
+
+
+ROLLING_AGGREGATES = ("mean", "sum", "min", "max", "count")
+
+# 시간 폭 단위별 초. 달(m)과 연(y)은 길이가 일정하지 않아 시간 구간에서만 씁니다.
+_SPAN_SECONDS = {"s": 1, "min": 60, "h": 3600, "d": 86400, "w": 604800}
+_SPAN_PATTERN = re.compile(r"\s*(\d+)\s*(s|min|h|d|w|m|y)\s*$")
+
+# 시각은 1970-01-01 기준 초로 다룹니다. 주 구간은 월요일(1970-01-05)부터 나눕니다.
+_EPOCH = datetime(1970, 1, 1)
+_WEEK_ORIGIN = 4 * 86400
+
+
+def _parse_span(text: str) -> Tuple[int, str]:
+    """시간 폭 문자열(예: "15min", "1h", "7d", "1m")을 (개수, 단위)로 변환합니다."""
+    match = _SPAN_PATTERN.match(str(text).lower())
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"시간 폭 형식이 올바르지 않습니다: {text} "
+                         "(예: 30s, 15min, 1h, 7d, 2w, 1m, 1y)")
+    return int(match.group(1)), match.group(2)
+
+
+def _window_spec(window: Union[int, str], on: Optional[str], agg: str
+                 ) -> Tuple[Optional[int], Optional[float]]:
+    """rolling() 인자를 검사해 (행 수, 시간 폭(초)) 중 하나를 채워 반환합니다."""
+    if agg not in ROLLING_AGGREGATES:
+        raise ValueError(f"지원하지 않는 집계입니다: {agg}")
+    if isinstance(window, str) and window.strip().isdigit():
+        window = int(window)
+    if isinstance(window, int):
+        if window <= 0:
+            raise ValueError("창 크기는 1 이상이어야 합니다")
+        return window, None
+    
+    count, unit = _parse_span(window)
+    if unit not in _SPAN_SECONDS:
+        raise ValueError(f"시간 창에는 달/연 단위를 쓸 수 없습니다: {window}")
+    if on is None:
+        raise ValueError("시간 폭 창에는 시간 열(on)이 필요합니다")
+    return None, float(count * _SPAN_SECONDS[unit])
+
+
+def _time_values(col: Column) -> List[Optional[float]]:
+    """
+    날짜/시각 열을 1970-01-01 기준 초 목록으로 변환합니다 (해석하지 못하면 None).
+    
+    형식은 date_utils의 DateUtils.detect_format()으로 찾고, 같은 형식이 이어지는
+    동안은 그 형식으로 바로 파싱합니다. 문자형 열은 사전의 값마다 한 번만 파싱합니다.
+    """
+    fmt: Optional[str] = None
+    
+    def parse(text: str) -> Optional[float]:
+        nonlocal fmt
+        if _is_blank(text):
             return None
-        try:
-            return float(value.replace(",", ""))
-        except (ValueError, AttributeError):
+        text = text.strip()
+        if fmt is not None:
+            try:
+                return (datetime.strptime(text, fmt) - _EPOCH).total_seconds()
+            except ValueError:
+                pass
+        fmt = DateUtils.detect_format(text)
+        if fmt is None:
             return None
+        return (datetime.strptime(text, fmt) - _EPOCH).total_seconds()
     
-    def _calculate_stats(self, values: List[float]) -> Dict[str, float]:
-        """숫자 리스트의 통계를 계산합니다."""
-        if not values:
-            return {}
+    if isinstance(col, StringColumn):
+        table = [parse(text) for text in col.dictionary]
+        return [table[code] for code in col.codes]
+    return [parse(text) for text in col.strings()]
+
+
+def _bucket_labels(times: Iterable[Optional[float]], count: int, unit: str
+                   ) -> List[Optional[str]]:
+    """
+    시각(초)을 그것이 속한 구간의 시작 시각 문자열로 바꿉니다.
+    
+    고정 길이 구간은 1970-01-01(주 단위는 월요일)부터, 달·연 구간은 1월부터
+    count개씩 나눕니다. 하루 이상 구간은 날짜만 표시합니다. 문자열은 시간
+    순서와 사전 순서가 같습니다.
+    """
+    fmt = DateFormat.ISO_TIME if unit in ("s", "min", "h") else DateFormat.ISO
+    step = count * _SPAN_SECONDS.get(unit, 0)
+    origin = _WEEK_ORIGIN if unit == "w" else 0
+    months = count * 12 if unit == "y" else count
+    cache: Dict[float, str] = {}
+    labels: List[Optional[str]] = []
+    for t in times:
+        if t is None:
+            labels.append(None)
+            continue
+        if step:
+            start = origin + (t - origin) // step * step
+        else:
+            moment = _EPOCH + timedelta(seconds=t)
+            index = moment.year * 12 + moment.month - 1
+            start = index - index % months
+        label = cache.get(start)
+        if label is None:
+            if step:
+                moment = _EPOCH + timedelta(seconds=start)
+            else:
+                moment = datetime(int(start) // 12, int(start) % 12 + 1, 1)
+            label = cache[start] = DateUtils.format_date(moment, fmt)
+        labels.append(label)
+    return labels
+
+
+def _add_buckets(aggregator: _GroupAggregator, columns: Dict[str, Column],
+                 time_column: str, count: int, unit: str) -> None:
+    """열 집합의 행을 시간 구간을 키로 집계기에 누적합니다 (시각이 없는 행은 제외)."""
+    labels = _bucket_labels(_time_values(columns[time_column]), count, unit)
+    mask = [label is not None for label in labels]
+    aggregator.add_rows([(label,) for label in compress(labels, mask)],
+                        [compress(columns[name].iter_numeric(), mask)
+                         for name in aggregator.agg_columns])
+
+
+class _RollingWindow:
+    """
+    이동 창 집계기 (행당 분할 상환 O(1))
+    
+    창 안의 (위치, 값)을 deque로 유지하며, 합계·평균·개수는 들어오고 나가는
+    값만 반영하는 누적합으로, 최솟값·최댓값은 더 나은 값이 뒤에 들어오면
+    앞선 후보를 버리는 단조 deque로 계산합니다. 위치는 행 번호(행 수 창) 또는
+    시각(시간 폭 창)이며, update()를 여러 번 호출해도 창이 이어집니다.
+    """
+    
+    # 빼기를 거듭하며 쌓이는 반올림 오차를 없애기 위해 이만큼 뺄 때마다 다시 합산합니다.
+    RESUM_INTERVAL = 4096
+    
+    def __init__(self, agg: str, size: Optional[int] = None, span: Optional[float] = None):
+        self.agg = agg
+        self.size = size
+        self.span = span
+        self.window: deque = deque()
+        self.extremes: deque = deque()
+        self.total = 0.0
+        self.removed = 0
+        self.rows = 0
+        self.last: Optional[float] = None
+        # min이면 값이 증가하는, max면 감소하는 후보 deque를 유지합니다.
+        self.keeps = operator.lt if agg == "min" else operator.gt
+    
+    def update(self, values: Iterable[Optional[float]],
+               times: Optional[Iterable[Optional[float]]] = None) -> List[Optional[float]]:
+        """
+        행들을 차례로 창에 넣고 행마다 집계 결과를 반환합니다.
+        
+        시간 폭 창이면 times가 필요하며 오름차순이어야 합니다. 시각이 없는 행은
+        창에 넣지 않고 None을 반환합니다.
+        """
+        agg = self.agg
+        extreme = agg in ("min", "max")
+        window, extremes, keeps = self.window, self.extremes, self.keeps
+        if self.span is None:
+            positions: Iterable = range(self.rows, sys.maxsize)
+        else:
+            positions = times
+        results: List[Optional[float]] = []
+        
+        for position, value in zip(positions, values):
+            self.rows += 1
+            if self.span is None:
+                bound = position - self.size
+            else:
+                if position is None:
+                    results.append(None)
+                    continue
+                if self.last is not None and position < self.last:
+                    raise ValueError("시간 창은 시간 열이 오름차순이어야 합니다 "
+                                     "(sort_by()로 먼저 정렬하세요)")
+                self.last = position
+                bound = position - self.span
+            
+            if value is not None:
+                window.append((position, value))
+                if extreme:
+                    while extremes and not keeps(extremes[-1][1], value):
+                        extremes.pop()
+                    extremes.append((position, value))
+                else:
+                    self.total += value
+            while window and window[0][0] <= bound:
+                _, old = window.popleft()
+                if not extreme:
+                    self.total -= old
+                    self.removed += 1
+            if extreme:
+                while extremes and extremes[0][0] <= bound:
+                    extremes.popleft()
+            elif self.removed >= self.RESUM_INTERVAL:
+                self.total = math.fsum(x for _, x in window)
+                self.removed = 0
+            
+            n = len(window)
+            if agg == "count":
+                results.append(n)
+            elif not n:
+                results.append(None)
+            elif extreme:
+                results.append(extremes[0][1])
+            else:
+                results.append(self.total / n if agg == "mean" else self.total)
+        return results
+
+
+def _cumulative(values: Iterable[Optional[float]], agg: str) -> Iterator[Optional[float]]:
+    """
+    처음 행부터 현재 행까지의 누적 집계를 행마다 차례로 반환합니다.
+    
+    숫자가 아닌 셀은 건너뛰고 직전 누적값을 그대로 반환하며, 아직 숫자가
+    없으면 None(count는 0)입니다.
+    """
+    if agg not in ROLLING_AGGREGATES:
+        raise ValueError(f"지원하지 않는 집계입니다: {agg}")
+    n = 0
+    total = 0.0
+    low = high = None
+    for x in values:
+        if x is not None:
+            n += 1
+            total += x
+            if low is None or x < low:
+                low = x
+            if high is None or x > high:
+                high = x
+        if agg == "count":
+            yield n
+        elif not n:
+            yield None
+        elif agg == "sum":
+            yield total
+        elif agg == "mean":
+            yield total / n
+        else:
+            yield low if agg == "min" else high
+
+
+# 표본 오차를 95% 신뢰구간 반폭으로 보고할 때의 정규분포 분위수
+_Z95 = 1.96
+
+
+def _parse_sample(spec: Union[str, int, float]) -> Tuple[Optional[int], Optional[float]]:
+    """--sample 값("10000", "0.01", "1%")을 (행 수, 비율) 중 하나로 변환합니다."""
+    text = str(spec).strip()
+    try:
+        if text.endswith("%"):
+            size, fraction = None, float(text[:-1]) / 100
+        elif re.fullmatch(r"\d+", text):
+            size, fraction = int(text), None
+        else:
+            size, fraction = None, float(text)
+    except ValueError:
+        raise ValueError(f"표본 크기는 행 수 또는 비율이어야 합니다: {spec}") from None
+    if size is not None and size <= 0:
+        raise ValueError("표본 행 수는 1 이상이어야 합니다")
+    if fraction is not None and not 0 < fraction < 1:
+        raise ValueError(f"표본 비율은 0과 1 사이여야 합니다: {spec}")
+    return size, fraction
+
+
+def _uniform(rng: random.Random) -> float:
+    """(0, 1) 구간의 난수 (log에 넣을 수 있도록 0을 제외)"""
+    u = rng.random()
+    while u == 0.0:
+        u = rng.random()
+    return u
+
+
+class _ReservoirSampler:
+    """
+    크기 size의 균등 무작위 표본을 한 번의 스캔으로 유지하는 저수지 표본 (Algorithm L)
+    
+    저수지를 채운 뒤에는 다음에 교체할 행까지 건너뛸 행 수를 기하분포로 뽑으므로
+    난수 생성은 행마다가 아니라 O(size · log(n / size))번입니다. 항목은
+    (스캔 순번, 행)으로 보관해 나중에 원래 순서로 되돌릴 수 있습니다.
+    """
+    
+    def __init__(self, size: int, rng: random.Random):
+        self.size = size
+        self.rng = rng
+        self.items: List[Tuple[int, Any]] = []
+        self.seen = 0
+        self.weight = 1.0
+        self.next = size - 1
+        self._advance()
+    
+    def _advance(self) -> None:
+        self.weight *= math.exp(math.log(_uniform(self.rng)) / self.size)
+        self.next += int(math.log(_uniform(self.rng)) / math.log1p(-self.weight)) + 1
+    
+    def extend(self, rows: Sequence[Any], indices: Optional[Sequence[int]] = None) -> None:
+        """
+        행들을 차례로 본 것으로 처리합니다.
+        
+        Args:
+            indices: 행별 원본 순번 (기본값: 이 표본이 지금까지 본 행 수부터 연속)
+        """
+        offset = self.seen
+        self.seen += len(rows)
+        if indices is None:
+            indices = range(offset, self.seen)
+        fill = min(self.size - len(self.items), len(rows))
+        self.items.extend(zip(indices[:fill], rows[:fill]))
+        while self.next < self.seen:
+            i = self.next - offset
+            self.items[self.rng.randrange(self.size)] = (indices[i], rows[i])
+            self._advance()
+
+
+class _BernoulliSampler:
+    """
+    각 행을 확률 fraction으로 독립적으로 뽑는 표본
+    
+    다음에 뽑을 행까지 건너뛸 행 수를 기하분포로 뽑으므로 난수 생성은
+    뽑힌 행 수에 비례합니다. 표본은 원래 행 순서입니다.
+    """
+    
+    def __init__(self, fraction: float, rng: random.Random):
+        self.rng = rng
+        self.log_q = math.log1p(-fraction)
+        self.items: List[Any] = []
+        self.seen = 0
+        self.next = self._skip()
+    
+    def _skip(self) -> int:
+        return int(math.log(_uniform(self.rng)) / self.log_q)
+    
+    def extend(self, rows: Sequence[Any]) -> None:
+        offset = self.seen
+        self.seen += len(rows)
+        while self.next < self.seen:
+            self.items.append(rows[self.next - offset])
+            self.next += self._skip() + 1
+
+
+def _allocate(size: int, populations: Dict[str, int]) -> Dict[str, int]:
+    """size행을 층별 원본 행 수에 비례해 나눕니다 (최대 나머지 방식, 합계는 size 이하)."""
+    total = sum(populations.values())
+    size = min(size, total)
+    quotas = {key: size * n / total for key, n in populations.items()}
+    counts = {key: int(quota) for key, quota in quotas.items()}
+    rest = size - sum(counts.values())
+    for key in sorted(quotas, key=lambda key: counts[key] - quotas[key])[:rest]:
+        counts[key] += 1
+    return counts
+
+
+def _value_range(values: Union[Sequence[float], "np.ndarray"]) -> Optional[Tuple[float, float]]:
+    """NaN을 제외한 (최솟값, 최댓값)을 반환합니다 (값이 없으면 None)."""
+    if np is not None and isinstance(values, np.ndarray):
+        values = values[~np.isnan(values)]
+        return (float(values.min()), float(values.max())) if values.size else None
+    values = [v for v in values if v == v]
+    return (min(values), max(values)) if values else None
+
+
+class StreamingHistogram:
+    """
+    고정 메모리 스트리밍 히스토그램
+    
+    값을 묶음 단위로 update()에 넘기면 구간 상태만 유지하므로 메모리 사용량은
+    값 수와 무관합니다.
+    
+    - 고정 구간: 범위(low, high)를 알면 bins개의 같은 폭 구간에 바로 셉니다.
+      결과는 create_histogram()과 같으며, 범위 밖 값은 양 끝 구간에 셉니다.
+    - 적응형: 범위를 모르면 최대 max_bins개의 [평균, 개수, 최솟값, 최댓값]
+      구간을 평균 순으로 유지하고, 넘치면 평균이 가장 가까운 이웃 구간끼리
+      합칩니다 (Ben-Haim & Tom-Tov). 출력할 때는 관측한 [최솟값, 최댓값]을
+      bins개로 나누고, 각 구간의 개수를 평균이 보존되도록 두 조각의 균등
+      분포로 퍼뜨려 근사합니다.
+    
+    같은 방식·설정의 히스토그램은 merge()로 합칠 수 있으므로 파일·청크별로
+    작업 프로세스에서 따로 센 뒤 합칠 수 있습니다.
+    """
+    
+    def __init__(self, bins: int = 10, low: Optional[float] = None,
+                 high: Optional[float] = None, max_bins: int = 128,
+                 backend: Optional[str] = None):
+        if bins <= 0:
+            raise ValueError("구간 수는 1 이상이어야 합니다")
+        if (low is None) != (high is None):
+            raise ValueError("범위는 low와 high를 함께 지정해야 합니다")
+        if low is not None and low > high:
+            raise ValueError(f"범위가 올바르지 않습니다: {low} > {high}")
+        self.bins = bins
+        self.low = low
+        self.high = high
+        self.max_bins = max(max_bins, 2)
+        self.backend = _resolve_backend(backend)
+        self.count = 0
+        self.min_val: Optional[float] = None
+        self.max_val: Optional[float] = None
+        self.counts: Optional[List[int]] = [0] * bins if low is not None else None
+        self.centroids: List[List[float]] = []
+    
+    @property
+    def approximate(self) -> bool:
+        """적응형(근사) 히스토그램인지 여부"""
+        return self.counts is None
+    
+    def update(self, values: Union[Sequence[float], "np.ndarray"]) -> None:
+        """값 묶음을 셉니다 (NaN은 제외)."""
+        vectorized = self.backend == "numpy" or (np is not None and isinstance(values, np.ndarray))
+        if vectorized:
+            data = np.asarray(values, dtype=np.float64)
+            data = data[~np.isnan(data)]
+            if not data.size:
+                return
+            low, high = float(data.min()), float(data.max())
+        else:
+            data = [v for v in values if v == v]
+            if not data:
+                return
+            low, high = min(data), max(data)
+        
+        self.count += len(data)
+        self.min_val = low if self.min_val is None else min(self.min_val, low)
+        self.max_val = high if self.max_val is None else max(self.max_val, high)
+        
+        if self.counts is None:
+            self._add_sorted(np.sort(data) if vectorized else sorted(data))
+            return
+        
+        bins, counts = self.bins, self.counts
+        bin_width = (self.high - self.low) / bins
+        if bin_width == 0:
+            counts[0] += len(data)
+        elif vectorized:
+            # 파이썬 반복문과 같은 식으로 구간 번호를 계산해 결과가 일치합니다.
+            indices = ((data - self.low) / bin_width).astype(np.int64)
+            added = np.bincount(np.clip(indices, 0, bins - 1), minlength=bins)
+            for i, n in enumerate(added.tolist()):
+                counts[i] += n
+        else:
+            low = self.low
+            for v in data:
+                counts[max(min(int((v - low) / bin_width), bins - 1), 0)] += 1
+    
+    def _add_sorted(self, data: Union[List[float], "np.ndarray"]) -> None:
+        """정렬된 값을 개수가 같은 최대 max_bins개 구간으로 묶어 기존 구간과 합칩니다."""
+        n = len(data)
+        k = min(self.max_bins, n)
+        starts = [j * n // k for j in range(k)]
+        if isinstance(data, list):
+            sums = [math.fsum(data[a:b]) for a, b in zip(starts, starts[1:] + [n])]
+        else:
+            sums = np.add.reduceat(data, starts).tolist()
+        ends = starts[1:] + [n]
+        runs = [[total / (b - a), b - a, float(data[a]), float(data[b - 1])]
+                for total, a, b in zip(sums, starts, ends)]
+        self._compress(self.centroids + runs)
+    
+    def _compress(self, items: List[List[float]]) -> None:
+        items.sort(key=operator.itemgetter(0))
+        while len(items) > self.max_bins:
+            gaps = [b[0] - a[0] for a, b in zip(items, items[1:])]
+            i = gaps.index(min(gaps))
+            a, b = items[i], items[i + 1]
+            n = a[1] + b[1]
+            items[i:i + 2] = [[(a[0] * a[1] + b[0] * b[1]) / n, n, min(a[2], b[2]), max(a[3], b[3])]]
+        self.centroids = items
+    
+    def merge(self, other: "StreamingHistogram") -> None:
+        """같은 방식·설정으로 센 다른 히스토그램을 합칩니다."""
+        if other.bins != self.bins or other.approximate != self.approximate or (
+                not self.approximate and (other.low, other.high) != (self.low, self.high)):
+            raise ValueError("구간 설정이 다른 히스토그램은 합칠 수 없습니다")
+        if not other.count:
+            return
+        self.count += other.count
+        self.min_val = other.min_val if self.min_val is None else min(self.min_val, other.min_val)
+        self.max_val = other.max_val if self.max_val is None else max(self.max_val, other.max_val)
+        if self.counts is not None:
+            self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        else:
+            self._compress(self.centroids + [list(c) for c in other.centroids])
+    
+    def bin_counts(self) -> List[Tuple[float, float, int]]:
+        """(구간 시작, 구간 끝, 개수) 목록을 반환합니다 (적응형이면 근사치)."""
+        if not self.count:
+            return []
+        if self.counts is not None:
+            low, bin_width, counts = self.low, (self.high - self.low) / self.bins, self.counts
+        else:
+            low, bin_width = self.min_val, (self.max_val - self.min_val) / self.bins
+            counts = self._spread(low, bin_width) if bin_width else [self.count] + [0] * (self.bins - 1)
+        return [(low + i * bin_width, low + (i + 1) * bin_width, count)
+                for i, count in enumerate(counts)]
+    
+    def _spread(self, low: float, bin_width: float) -> List[int]:
+        """적응형 구간들의 개수를 같은 폭의 bins개 구간에 나누어 정수로 반올림합니다."""
+        bins = self.bins
+        mass = [0.0] * bins
+        
+        def index(x: float) -> int:
+            return max(min(int((x - low) / bin_width), bins - 1), 0)
+        
+        def add(start: float, end: float, n: float) -> None:
+            if n <= 0:
+                return
+            if end <= start:
+                mass[index(start)] += n
+                return
+            first, last = index(start), index(end)
+            for i in range(first, last + 1):
+                left = start if i == first else low + i * bin_width
+                right = end if i == last else low + (i + 1) * bin_width
+                mass[i] += n * (right - left) / (end - start)
+        
+        for mean, n, lo, hi in self.centroids:
+            # [lo, mean]과 [mean, hi]에 평균이 mean이 되도록 개수를 나눕니다.
+            below = n * (hi - mean) / (hi - lo) if hi > lo else n
+            add(lo, mean, below)
+            add(mean, hi, n - below)
+        
+        # 누적값을 반올림해 차이를 구하면 합계가 보존됩니다.
+        counts, previous, total = [], 0, 0.0
+        for m in mass:
+            total += m
+            rounded = int(round(total))
+            counts.append(rounded - previous)
+            previous = rounded
+        return counts
+    
+    def render(self, width: int = 50) -> str:
+        """텍스트 히스토그램을 생성합니다 (create_histogram()과 같은 형식)."""
+        if not self.count:
+            return "데이터가 없습니다."
+        if self.min_val == self.max_val:
+            return f"모든 값이 동일: {self.min_val}"
+        
+        bin_counts = self.bin_counts()
+        max_count = max(count for _, _, count in bin_counts) or 1
+        
+        lines = []
+        for start, end, count in bin_counts:
+            bar_len = int(count / max_count * width)
+            bar = "█" * bar_len
+            lines.append(f"{start:10.2f} - {end:10.2f} | {bar} ({count})")
+        
+        return "\n".join(lines)
+
+
+def _range_batch(batch: List[List[str]], header: List[str], column: str
+                 ) -> Optional[Tuple[float, float]]:
+    """행 묶음 하나의 열 값 범위 (작업 프로세스용)."""
+    columns, _ = _build_table([batch], header, [column])
+    return _value_range(columns[column].numeric_values())
+
+
+def _histogram_batch(batch: List[List[str]], header: List[str], column: str, bins: int,
+                     low: Optional[float], high: Optional[float]) -> StreamingHistogram:
+    """행 묶음 하나의 열 히스토그램 (작업 프로세스용, 범위가 없으면 적응형)."""
+    columns, _ = _build_table([batch], header, [column])
+    hist = StreamingHistogram(bins, low, high, backend="python")
+    hist.update(columns[column].numeric_values())
+    return hist
+
+
+def _histogram_table(columns: Dict[str, Column], column: str, bins: int,
+                     low: float, high: float, backend: str) -> StreamingHistogram:
+    """열 저장소 하나의 고정 구간 히스토그램 (작업 프로세스용)."""
+    col = columns[column]
+    hist = StreamingHistogram(bins, low, high, backend=backend)
+    hist.update(col.numeric_array() if backend == "numpy" and col.dtype == "numeric"
+                else col.numeric_values())
+    return hist
+
+
+def _format_summary(summary: DataSummary) -> str:
+    """DataSummary를 pandas의 describe()와 유사한 문자열로 변환합니다."""
+    lines = []
+    lines.append(f"파일: {summary.filename}")
+    lines.append(f"행 수: {summary.rows:,}")
+    lines.append(f"열 수: {summary.columns}")
+    if any(s.approximate for s in summary.column_stats.values()):
+        lines.append("※ 근사 모드: 중앙값, 고유값 수, 상위값은 스케치로 추정한 값입니다")
+    lines.append("")
+    
+    # 숫자형 열 통계
+    numeric_cols = [s for s in summary.column_stats.values() if s.dtype == "numeric"]
+    if numeric_cols:
+        lines.append("📊 숫자형 열 통계:")
+        lines.append("-" * 80)
+        
+        # 헤더
+        headers = ["", "count", "mean", "std", "min", "median", "max"]
+        lines.append(f"{headers[0]:15} {headers[1]:>10} {headers[2]:>12} {headers[3]:>12} {headers[4]:>12} {headers[5]:>12} {headers[6]:>12}")
+        lines.append("-" * 80)
         
-        n = len(values)
-        sorted_vals = sorted(values)
+        for s in numeric_cols:
+            lines.append(
+                f"{s.name[:15]:15} {s.count - s.missing:>10} "
+                f"{s.mean:>12.2f} {s.std_dev:>12.2f} "
+                f"{s.min_val:>12.2f} {s.median:>12.2f} {s.max_val:>12.2f}"
+            )
+        
+        invalid = [f"{s.name}({s.invalid:,})" for s in numeric_cols if s.invalid]
+        if invalid:
+            lines.append(f"⚠️  숫자로 해석하지 못해 제외한 값: {', '.join(invalid)}")
+    
+    lines.append("")
+    
+    # 문자형 열 통계
+    string_cols = [s for s in summary.column_stats.values() if s.dtype == "string"]
+    if string_cols:
+        lines.append("📝 문자형 열 통계:")
+        lines.append("-" * 60)
         
-        mean = sum(values) / n
+        for s in string_cols:
+            lines.append(f"\n{s.name}:")
+            lines.append(f"  - 유효값: {s.count - s.missing:,} / 결측: {s.missing:,}")
+            lines.append(f"  - 고유값: {s.unique:,}")
+            if s.top_values:
+                top_str = ", ".join(f"{v}({c})" for v, c in s.top_values[:3])
+                lines.append(f"  - 상위값: {top_str}")
+    
+    return "\n".join(lines)
+
+
+class _RowView(SequenceABC):
+    """열 저장소를 행(dict) 목록처럼 보여주는 읽기 전용 뷰"""
+    
+    def __init__(self, analyzer: "DataAnalyzer"):
+        self._analyzer = analyzer
+    
+    def __len__(self) -> int:
+        return self._analyzer._n_rows
+    
+    def __getitem__(self, index):
+        n = self._analyzer._n_rows
+        if isinstance(index, slice):
+            return [self._analyzer._row(i) for i in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("행 번호가 범위를 벗어났습니다")
+        return self._analyzer._row(index)
+    
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        table = self._analyzer._table
+        if isinstance(table, _MappedTable) and not table.loaded:
+            yield from table.iter_rows()
+            return
+        for i in range(self._analyzer._n_rows):
+            yield self._analyzer._row(i)
+
+
+class DataAnalyzer:
+    """
+    CSV 데이터 분석 클래스
+    
+    pandas 없이 기본 라이브러리만으로 데이터 분석을 수행합니다.
+    
+    디렉터리나 glob 패턴을 주면 일치하는 파일들(예: 일별 파티션)을 하나의
+    데이터셋으로 읽습니다. 파일별 열 저장소는 그대로 두고 요약 통계와
+    그룹 집계는 파일별 부분 집계를 병합해 계산하며, 행 단위 접근이 필요한
+    작업(필터, 인덱스 등)을 처음 할 때만 열을 이어 붙입니다.
+    
+    압축되지 않은 단일 파일은 mmap으로 열어 행 시작 위치 인덱스만 만들고
+    (_MappedTable), 열은 처음 사용할 때 그 열만 만듭니다. head/tail과 행
+    번호 접근은 해당 행의 바이트만 디코딩합니다.
+    """
+    
+    def __init__(self, filepath: str, encoding: str = "utf-8", cache: bool = False,
+                 backend: Optional[str] = None, jobs: int = 0,
+                 usecols: Optional[Iterable[str]] = None, where: Optional[str] = None):
+        """
+        Args:
+            filepath: CSV 파일 경로(압축 가능), 디렉터리(안의 *.csv) 또는 glob 패턴
+            encoding: 파일 인코딩 (기본값: utf-8)
+            cache: True면 CSV 옆의 바이너리 캐시(.dacache)를 사용/생성합니다.
+                캐시는 경로·크기·수정 시각이 같을 때만 사용되며 mmap으로 읽습니다.
+                캐시를 만들려면 전체 열이 필요하므로 지연 로딩은 쓰지 않습니다.
+            backend: 숫자 연산 백엔드 ("python" 또는 "numpy").
+                생략하면 NumPy가 설치되어 있을 때 numpy를 사용합니다.
+            jobs: 여러 파일을 읽을 때의 작업 프로세스 수 (0 이하: CPU 코어 수)
+            usecols: 읽을 열 이름 목록 (기본값: 전체). 나머지 열은 토큰화 중에
+                셀을 꺼내지 않으며 데이터셋에도 나타나지 않습니다.
+            where: 필터 식 (query()와 같은 문법). 읽는 도중 원문 셀로 평가하여
+                만족하는 행만 저장합니다 (식의 열은 usecols에 없어도 됨).
+        """
+        if cache and (usecols is not None or where is not None):
+            raise ValueError("캐시는 파일 전체를 저장하므로 usecols/where와 함께 사용할 수 없습니다")
+        if where is not None:
+            _parse_filter(where)  # 파일을 읽기 전에 문법 오류를 알림
+        self.filepath = Path(filepath)
+        self.files = _expand_paths(filepath)
+        self.encoding = encoding
+        self.cache = cache
+        self.usecols: Optional[List[str]] = list(usecols) if usecols is not None else None
+        self.where = where
+        self.backend = _resolve_backend(backend)
+        self.columns: List[str] = []
+        # 파일의 전체 열 (usecols로 일부만 읽어도 헤더 그대로)
+        self.file_columns: List[str] = []
+        # 파일의 전체 행 수 (where로 걸러도 거르기 전 행 수)
+        self.file_rows = 0
+        # 열 이름 -> 열 (단일 파일을 지연 로딩하면 _MappedTable)
+        self._table: Dict[str, Column] = {}
+        # 여러 파일이면 이어 붙이기 전의 파일별 (열 저장소, 행 수)
+        self._parts: Optional[List[Tuple[Dict[str, Column], int]]] = None
+        self._offsets: List[int] = [0]
+        self._n_rows = 0
+        self._indexes: Dict[str, Dict[str, Index]] = {}
+        # StreamingDataAnalyzer.sample()로 만든 표본이면 추출 정보
+        self.sampling: Optional[SampleInfo] = None
+        
+        self._load_data(jobs)
+        if isinstance(self._table, _MappedTable):
+            self._table.backend = self.backend  # 열은 처음 만들 때 설정됨
+            return
+        for columns, _ in self._parts or [(self._table, self._n_rows)]:
+            for col in columns.values():
+                col.backend = self.backend
+    
+    @classmethod
+    def _from_table(cls, source: "StreamingDataAnalyzer", table: Dict[str, Column],
+                    n_rows: int, backend: Optional[str] = None) -> "DataAnalyzer":
+        """스트리밍으로 만든 열 저장소(예: 표본)로 파일을 다시 읽지 않고 만듭니다."""
+        analyzer = cls.__new__(cls)
+        analyzer.filepath = source.filepath
+        analyzer.files = source.files
+        analyzer.encoding = source.encoding
+        analyzer.cache = False
+        analyzer.usecols = analyzer.where = None
+        analyzer.backend = _resolve_backend(backend)
+        analyzer.columns = list(source.columns)
+        analyzer.file_columns = list(source.columns)
+        analyzer.file_rows = n_rows
+        analyzer._table = table
+        analyzer._parts = None
+        analyzer._offsets = [0]
+        analyzer._n_rows = n_rows
+        analyzer._indexes = {}
+        analyzer.sampling = None
+        for col in table.values():
+            col.backend = analyzer.backend
+        return analyzer
+    
+    @property
+    def data(self) -> _RowView:
+        """행(dict) 단위로 데이터에 접근하는 읽기 전용 뷰"""
+        return _RowView(self)
+    
+    @classmethod
+    def open(cls, filepath: str, encoding: str = "utf-8", chunksize: Optional[int] = None,
+             cache: bool = False, backend: Optional[str] = None, jobs: int = 0,
+             usecols: Optional[Iterable[str]] = None, where: Optional[str] = None
+             ) -> Union["DataAnalyzer", "StreamingDataAnalyzer"]:
+        """
+        CSV 파일을 엽니다.
+        
+        Args:
+            filepath: CSV 파일 경로, 디렉터리 또는 glob 패턴
+            encoding: 파일 인코딩
+            chunksize: 지정하면 이 행 수씩 나누어 읽는 스트리밍 모드로 엽니다
+            cache: 바이너리 캐시 사용 여부 (메모리 모드 전용)
+            backend: 숫자 연산 백엔드 (메모리 모드 전용)
+            jobs: 여러 파일을 읽을 때의 작업 프로세스 수 (메모리 모드 전용)
+            usecols, where: 읽을 열과 행 조건 (메모리 모드 전용, __init__() 참고).
+                스트리밍 모드는 작업마다 필요한 열만 만들고 필터를 읽는 중에
+                평가하므로 따로 지정하지 않습니다.
+        
+        Returns:
+            DataAnalyzer 또는 StreamingDataAnalyzer
+        """
+        if chunksize:
+            return StreamingDataAnalyzer(filepath, encoding=encoding, chunksize=chunksize)
+        return cls(filepath, encoding=encoding, cache=cache, backend=backend, jobs=jobs,
+                   usecols=usecols, where=where)
+    
+    def _load_data(self, jobs: int = 0) -> None:
+        """
+        CSV 파일을 로드합니다 (유효한 캐시가 있으면 캐시를 사용).
+        
+        파일이 여러 개면 작업 프로세스에서 파일별로 나누어 읽은 뒤 헤더를
+        합치고, 파일에 없는 열은 빈 값으로 채웁니다.
+        """
+        usecols, where = self.usecols, self.where
+        if len(self.files) == 1:
+            mapped = None
+            if not self.cache and where is None:
+                mapped = _MappedTable.open(self.files[0], self.encoding, usecols)
+            if mapped is not None:
+                self.encoding, header, self._n_rows = mapped.encoding, mapped.header, mapped.n_rows
+                self.file_rows = self._n_rows
+                self._table = mapped
+            else:
+                self.encoding, header, self._table, self._n_rows, self.file_rows = _load_table(
+                    self.files[0], self.encoding, self.cache, usecols, where)
+            self.columns = self._project(header)
+            return
+        
+        jobs = min(_resolve_jobs(jobs), len(self.files))
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                tables = list(executor.map(_load_table, self.files, repeat(self.encoding),
+                                           repeat(self.cache), repeat(usecols), repeat(where)))
+        else:
+            tables = [_load_table(path, self.encoding, self.cache, usecols, where)
+                      for path in self.files]
+        
+        self.encoding = tables[0][0]
+        self.columns = self._project(_union_header([header for _, header, *_ in tables]))
+        self._parts = [(_conform_table(columns, n_rows, self.columns), n_rows)
+                       for _, _, columns, n_rows, _ in tables]
+        self.file_rows = sum(file_rows for *_, file_rows in tables)
+        for _, n_rows in self._parts:
+            self._offsets.append(self._offsets[-1] + n_rows)
+        self._n_rows = self._offsets[-1]
+    
+    def _project(self, header: List[str]) -> List[str]:
+        """usecols/where의 열이 헤더에 있는지 확인하고 데이터셋의 열 목록을 반환합니다."""
+        self.file_columns = header
+        names = list(self.usecols or [])
+        if self.where is not None:
+            names.extend(_parse_filter(self.where).columns())
+        for name in names:
+            if name not in header:
+                raise ValueError(f"열이 존재하지 않습니다: {name}")
+        if self.usecols is None:
+            return header
+        return [name for name in header if name in self.usecols]
+    
+    @property
+    def _columns(self) -> Dict[str, Column]:
+        """열 저장소 (여러 파일이면 처음 접근할 때 파일별 열을 이어 붙임)"""
+        if self._parts is not None:
+            self._table = {name: _concat_columns([columns[name] for columns, _ in self._parts])
+                           for name in self._parts[0][0]}
+            self._parts = None
+            for col in self._table.values():
+                col.backend = self.backend
+        return self._table
+    
+    def _row(self, index: int) -> Dict[str, str]:
+        """index번째 행을 dict로 반환합니다 (열을 아직 만들지 않았으면 파일에서 직접)."""
+        if self._parts is not None:
+            part = bisect_right(self._offsets, index) - 1
+            columns = self._parts[part][0]
+            index -= self._offsets[part]
+        else:
+            columns = self._columns
+            if isinstance(columns, _MappedTable) and not columns.loaded:
+                return columns.row(index)
+        return {name: columns[name].get(index) for name in self.columns}
+    
+    def _get_column(self, column: str) -> Column:
+        """열 객체를 반환합니다."""
+        if column not in self.columns:
+            raise ValueError(f"열이 존재하지 않습니다: {column}")
+        return self._columns[column]
+    
+    def _decode(self, names: Iterable[str]) -> Dict[str, Column]:
+        """
+        열 저장소를 반환합니다.
+        
+        지연 로딩 중이면 names의 열 중 아직 만들지 않은 열들을 파일을 한 번만
+        파싱하여 함께 만듭니다 (열마다 따로 접근하면 열 수만큼 파싱).
+        """
+        names = list(names)
+        for name in names:
+            if name not in self.columns:
+                raise ValueError(f"열이 존재하지 않습니다: {name}")
+        columns = self._columns
+        if isinstance(columns, _MappedTable):
+            columns.load(names)
+        return columns
+    
+    def _summarize_parts(self, names: List[str], jobs: int = 1,
+                         approx: Optional[float] = None) -> Dict[str, ColumnStats]:
+        """
+        파일별 열 저장소의 부분 집계를 파일 순서대로 병합해 통계를 계산합니다.
+        
+        jobs가 2 이상이면 파일 단위로 작업 프로세스에 나누어 집계합니다.
+        정확한 중앙값은 파일별 숫자 값을 모아 따로 계산합니다.
+        """
+        tables = [{name: columns[name] for name in names} for columns, _ in self._parts]
+        jobs = min(_resolve_jobs(jobs), len(tables))
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                partials = list(executor.map(_accumulate_table, tables, repeat(names),
+                                             repeat(approx), range(1, len(tables) + 1)))
+        else:
+            partials = [_accumulate_table(table, names, approx, seed)
+                        for seed, table in enumerate(tables, 1)]
+        
+        accumulators = partials[0]
+        for partial in partials[1:]:
+            for name in names:
+                accumulators[name].merge(partial[name])
+        
+        column_stats = {}
+        for name in names:
+            median = None
+            if approx is None and accumulators[name].dtype == "numeric":
+                cols = [table[name] for table in tables]
+                if self.backend == "numpy":
+                    values = np.concatenate([v[m] for v, m in map(_numeric_arrays, cols)])
+                    median = float(np.median(values)) if len(values) else None
+                else:
+                    values = list(chain.from_iterable(col.numeric_values() for col in cols))
+                    median = _median(values) if values else None
+            column_stats[name] = accumulators[name].result(median=median)
+        return column_stats
+    
+    def _is_numeric(self, value: str) -> bool:
+        """값이 숫자인지 확인합니다."""
+        return _parse_number(value) is not None
+    
+    def _to_numeric(self, value: str) -> Optional[float]:
+        """값을 숫자로 변환합니다."""
+        return _parse_number(value)
+    
+    def get_numeric_values(self, column: str) -> List[float]:
+        """열의 유효한 숫자 값 목록을 반환합니다."""
+        return self._get_column(column).numeric_values()
+    
+    def get_column_stats(self, column: str, approx: Optional[float] = None) -> ColumnStats:
+        """
+        특정 열의 통계를 계산합니다.
+        
+        Args:
+            column: 열 이름
+            approx: 근사 모드 오차 한도 (예: 0.01). 지정하면 중앙값·고유값 수·상위 값을
+                스케치(KLL, HyperLogLog, Misra-Gries)로 계산합니다.
+        """
+        if self._parts is not None:
+            if column not in self.columns:
+                raise ValueError(f"열이 존재하지 않습니다: {column}")
+            return self._summarize_parts([column], approx=approx)[column]
+        return _summarize_column(column, self._get_column(column), approx)
+    
+    def get_summary(self, jobs: int = 1, approx: Optional[float] = None) -> DataSummary:
+        """
+        데이터셋 전체 요약을 반환합니다.
+        
+        열마다 저장소를 한 번만 스캔하여 count/결측/고유값/상위값과
+        숫자 통계를 함께 계산합니다.
+        
+        Args:
+            jobs: 작업 프로세스 수 (1: 직렬, 0 이하: CPU 코어 수).
+                열 단위(여러 파일이면 파일 단위)로 나누어 계산하므로 결과는
+                직렬 계산과 같습니다.
+            approx: 근사 모드 오차 한도 (get_column_stats() 참고)
+        """
+        names = list(dict.fromkeys(self.columns))
+        jobs = min(_resolve_jobs(jobs), len(names))
+        
+        if self._parts is not None:
+            column_stats = self._summarize_parts(names, jobs, approx)
+        elif jobs > 1:
+            columns = self._decode(names)
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = {name: executor.submit(_summarize_column, name, columns[name], approx)
+                           for name in names}
+                column_stats = {name: future.result() for name, future in futures.items()}
+        else:
+            columns = self._decode(names)
+            column_stats = {name: _summarize_column(name, columns[name], approx)
+                            for name in names}
+        
+        return DataSummary(
+            filename=self.filepath.name,
+            rows=self._n_rows,
+            columns=len(self.columns),
+            column_names=self.columns,
+            column_stats=column_stats,
+            sample_rows=self.head(5)
+        )
+    
+    def describe(self, jobs: int = 1, approx: Optional[float] = None) -> str:
+        """
+        pandas의 describe()와 유사한 출력을 생성합니다.
+        
+        Args:
+            jobs: 작업 프로세스 수 (get_summary() 참고)
+            approx: 근사 모드 오차 한도 (get_column_stats() 참고)
+        """
+        summary = self.get_summary(jobs=jobs, approx=approx)
+        text = _format_summary(summary)
+        if self.sampling is None:
+            return text
+        
+        lines = [text, "", f"🎲 {self.sampling} — 위 통계는 표본 기준입니다",
+                 "   평균의 95% 오차 한계 (±1.96 × 표준오차):"]
+        for stats in summary.column_stats.values():
+            if stats.dtype != "numeric":
+                continue
+            error = self.sampling_error(stats.name)
+            margin = f"±{_Z95 * error:,.2f}" if error is not None else "(표본 부족)"
+            lines.append(f"   {stats.name[:15]:15} {stats.mean:>14,.2f} {margin}")
+        return "\n".join(lines)
+    
+    def sampling_error(self, column: str) -> Optional[float]:
+        """
+        표본에서 구한 열 평균의 표준오차를 반환합니다 (표본이 아니면 None).
+        
+        단순 무작위 표본은 s / √n × √(1 - n/N), 층화 표본은 층별 분산을
+        층 비중으로 합친 √Σ W²·s²/n × (1 - n/N)로 계산합니다 (유한 모집단 보정 포함).
+        """
+        info = self.sampling
+        if info is None:
+            return None
+        if info.stratify is None:
+            stats = self.get_column_stats(column)
+            n = stats.count - stats.missing - stats.invalid
+            if stats.dtype != "numeric" or n < 2:
+                return None
+            return stats.std_dev / math.sqrt(n) * math.sqrt(max(1 - info.size / info.population, 0.0))
+        
+        groups = self.group_by(keys=[info.stratify], aggs={column: ["count", "var"]})
+        variance = 0.0
+        for key, out in groups.items():
+            population, size = info.strata.get(key, (0, 0))
+            n, var = out[column]["count"], out[column]["var"]
+            if n < 2 or not population:
+                continue
+            weight = population / info.population
+            variance += weight * weight * var / n * max(1 - size / population, 0.0)
+        return math.sqrt(variance)
+    
+    def _filter_context(self) -> _FilterContext:
+        return _FilterContext(self._columns, self._n_rows, self._indexes)
+    
+    def _filter_indices(self, column: str, condition: str, value: Any) -> List[int]:
+        """조건에 맞는 행 번호 목록을 반환합니다."""
+        self._get_column(column)
+        return _Predicate(column, condition, value).evaluate(self._filter_context(), None)
+    
+    def create_index(self, column: str, kind: Optional[str] = None) -> Index:
+        """
+        열에 인덱스를 생성합니다. 이후 filter()가 자동으로 사용합니다.
+        
+        Args:
+            column: 인덱스를 만들 열
+            kind: "sorted"(gt/lt/ge/le/between, 숫자 eq/in) 또는 "hash"(eq/ne/in).
+                생략하면 숫자형 열은 sorted, 문자형 열은 hash를 사용합니다.
+        
+        Returns:
+            생성된 인덱스
+        """
+        col = self._get_column(column)
+        if kind is None:
+            kind = "sorted" if col.dtype == "numeric" else "hash"
+        if kind not in INDEX_KINDS:
+            raise ValueError(f"지원하지 않는 인덱스 종류입니다: {kind}")
+        
+        index = INDEX_KINDS[kind](col)
+        self._indexes.setdefault(column, {})[kind] = index
+        return index
+    
+    def drop_index(self, column: str, kind: Optional[str] = None) -> None:
+        """열의 인덱스를 삭제합니다 (kind를 생략하면 모든 종류)."""
+        indexes = self._indexes.get(column, {})
+        if kind is None:
+            indexes.clear()
+        else:
+            indexes.pop(kind, None)
+    
+    def filter(self, column: str, condition: str, value: Any) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 행을 필터링합니다.
+        
+        Args:
+            column: 필터링할 열
+            condition: 조건 (eq, ne, gt, lt, ge, le, contains, in, between, regex)
+            value: 비교 값 (in은 값 목록, between은 [하한, 상한])
+        
+        Returns:
+            필터링된 행 목록
+        """
+        return [self._row(i) for i in self._filter_indices(column, condition, value)]
+    
+    def query(self, expression: str) -> List[Dict[str, Any]]:
+        """
+        필터 식에 맞는 행을 반환합니다.
+        
+        식은 AND/OR/NOT, 괄호, IN, BETWEEN, 정규식(~)을 지원하며, 조건은
+        선택도가 낮은 것부터 열 배열 위에서 평가됩니다.
+        
+        Args:
+            expression: 필터 식 (예: "age ge 30 AND city in (Seoul, Busan)")
+        
+        Returns:
+            필터링된 행 목록
+        """
+        return list(self.iter_query(expression))
+    
+    def iter_query(self, expression: str) -> Iterator[Dict[str, Any]]:
+        """
+        query()와 같지만 행 dict를 필요할 때 하나씩 만듭니다.
+        
+        일치하는 행 번호만 메모리에 두므로 결과를 바로 export()에 넘길 때 사용합니다.
+        """
+        plan = _parse_filter(expression)
+        return map(self._row, plan.evaluate(self._filter_context(), None))
+    
+    def explain(self, expression: str) -> str:
+        """필터 식의 실행 계획(평가 순서, 인덱스 사용 여부, 추정 선택도)을 반환합니다."""
+        plan = _parse_filter(expression)
+        return "\n".join(plan.explain(self._filter_context()))
+    
+    def group_by(self, column: Optional[str] = None, agg_column: Optional[str] = None,
+                 keys: Optional[List[str]] = None,
+                 aggs: Optional[Dict[str, List[str]]] = None,
+                 jobs: int = 1) -> Dict[Any, Any]:
+        """
+        열 기준으로 그룹화합니다.
+        
+        group_by(column, agg_column) 형식은 예전과 같은 결과를 반환하고,
+        keys/aggs를 지정하면 여러 키와 여러 집계를 한 번에 계산합니다.
+        
+        Args:
+            column: 그룹화 기준 열
+            agg_column: 집계할 열 (선택적)
+            keys: 그룹화 기준 열 목록 (키가 여러 개면 결과 키는 튜플)
+            aggs: {열: [집계, ...]} — size, count, sum, mean, min, max,
+                std, var, median, pNN(분위수, 예: p95)
+            jobs: 여러 파일일 때 파일별 부분 집계에 쓸 작업 프로세스 수
+                (1: 직렬, 0 이하: CPU 코어 수)
+        
+        Returns:
+            그룹별 집계 결과 (keys 지정 시 {키: {열: {집계: 값}}})
+        """
+        keys, aggs, legacy = _group_spec(self.columns, column, agg_column, keys, aggs)
+        if self._parts is None:
+            aggregator = _group_table(self._decode(keys + list(aggs)), keys, aggs)
+            return _group_result(aggregator.results(), aggs, legacy)
+        
+        names = list(dict.fromkeys(keys + list(aggs)))
+        tables = [{name: columns[name] for name in names} for columns, _ in self._parts]
+        jobs = min(_resolve_jobs(jobs), len(tables))
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                partials = list(executor.map(_group_table, tables, repeat(keys), repeat(aggs)))
+            aggregator = partials[0]
+            for partial in partials[1:]:
+                aggregator.merge(partial)
+        else:
+            aggregator = _GroupAggregator(keys, aggs)
+            for table in tables:
+                aggregator.add_columns(table)
+        return _group_result(aggregator.results(), aggs, legacy)
+    
+    def pivot(self, index: str, columns: str, values: Optional[str] = None,
+              aggfunc: str = "sum", jobs: int = 1) -> PivotTable:
+        """
+        피벗 테이블(교차 집계)을 만듭니다.
+        
+        (index, columns) 두 키로 group_by()를 한 번 실행해 모든 셀을 한 번의
+        해시 집계 패스로 계산합니다. 행 키마다 group_by()를 따로 부를 필요가 없습니다.
+        
+        Args:
+            index: 행 키 열
+            columns: 열 키 열
+            values: 집계할 열 (생략하면 조합별 행 수)
+            aggfunc: 집계 이름 하나 (group_by()의 집계와 같음, 예: sum, mean, p95)
+            jobs: group_by()와 같음
+        
+        Returns:
+            PivotTable
+        """
+        keys, aggs = _pivot_spec(self.columns, index, columns, values, aggfunc)
+        groups = self.group_by(keys=keys, aggs=aggs, jobs=jobs)
+        return _pivot_result(groups, index, columns, values, aggfunc)
+    
+    def correlation(self, col1: str, col2: str) -> Optional[float]:
+        """두 숫자형 열의 상관계수를 계산합니다."""
+        if col1 not in self._columns or col2 not in self._columns:
+            raise ValueError("열이 존재하지 않습니다")
+        
+        columns = self._decode([col1, col2])
+        moments = _CoMoments()
+        moments.add_pairs(*_numeric_pairs(columns[col1], columns[col2]))
+        return moments.correlation()
+    
+    def correlation_matrix(self, columns: Optional[List[str]] = None
+                           ) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        여러 열의 상관계수 행렬을 한 번의 스캔으로 계산합니다.
+        
+        각 쌍은 두 값이 모두 숫자인 행만 사용합니다 (pairwise-complete).
+        
+        Args:
+            columns: 대상 열 목록 (기본값: 모든 숫자형 열)
+        
+        Returns:
+            {열: {열: 상관계수 또는 None}}
+        """
+        if columns is None:
+            table = self._decode(self.columns)
+            columns = [name for name in dict.fromkeys(self.columns)
+                       if table[name].dtype == "numeric"]
+        table = self._decode(columns)
+        
+        matrix = _CorrelationMatrix(list(dict.fromkeys(columns)))
+        matrix.add_columns(table)
+        return matrix.result()
+    
+    def sort_by(self, columns: Union[str, List[str]],
+                descending: Union[bool, List[bool]] = False,
+                limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        열 기준으로 정렬한 행을 반환합니다 (안정 정렬).
+        
+        숫자 값은 숫자 순서, 그 밖의 값은 문자열 순서로 정렬하며, 숫자가 먼저
+        오고 결측치는 항상 마지막입니다. 행 번호만 정렬하고 행(dict)은 결과로
+        내보낼 때 만듭니다.
+        
+        Args:
+            columns: 정렬 기준 열 (여러 개면 앞의 열이 우선)
+            descending: 내림차순 여부 (열마다 다르게 하려면 목록)
+            limit: 지정하면 앞의 limit개 행만 힙으로 골라 반환합니다 (전체 정렬 없음)
+        
+        Returns:
+            정렬된 행 목록
+        """
+        names, flags = _sort_spec(self.columns, columns, descending)
+        keys = _row_sort_keys(self._decode(names), names, flags)
+        if limit is not None:
+            order = heapq.nsmallest(max(limit, 0), range(self._n_rows), key=keys.__getitem__)
+        else:
+            self._decode(self.columns)  # 모든 행을 내보내므로 행별 디코딩 대신 전체 열 구성
+            order = sorted(range(self._n_rows), key=keys.__getitem__)
+        return [self._row(i) for i in order]
+    
+    def top_k(self, column: str, k: int = 10, largest: bool = True) -> List[Dict[str, Any]]:
+        """
+        숫자 값이 가장 큰(largest=False면 가장 작은) k개 행을 값 순서로 반환합니다.
+        
+        전체를 정렬하지 않고 크기 k의 힙으로 고르므로 O(n log k)입니다.
+        숫자가 아닌 셀은 제외하며, 값이 같으면 앞쪽 행이 먼저 옵니다.
+        """
+        col = self._get_column(column)
+        return [self._row(i) for i in _top_k_indices(col, k, largest)]
+    
+    def _row_tuples(self) -> Iterator[Tuple[str, ...]]:
+        """모든 행을 열 순서의 값 튜플로 차례로 반환합니다."""
+        columns = self._decode(self.columns)
+        return zip(*(columns[name].strings() for name in self.columns))
+    
+    def join(self, other: Union[str, "DataAnalyzer", "StreamingDataAnalyzer"],
+             on: Union[str, List[str]], how: str = "inner",
+             partitions: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        다른 데이터셋과 키 열이 같은 행을 해시 조인합니다.
+        
+        해시 테이블은 행이 적은 쪽에 만들고, 결과는 왼쪽(self) 행 순서입니다.
+        키는 원문 문자열로 비교하며 키에 결측치가 있는 행은 짝을 찾지 않습니다.
+        오른쪽 열 이름이 왼쪽과 겹치면 "_right"를 붙입니다.
+        
+        Args:
+            other: 오른쪽 데이터셋 또는 CSV 파일 경로
+            on: 조인 키 열 (양쪽에 같은 이름으로 있어야 함)
+            how: "inner" 또는 "left"(짝이 없는 왼쪽 행도 오른쪽 열을 빈 값으로 포함)
+            partitions: 지정하면 양쪽을 키 해시로 이 개수만큼 임시 파일에 나누어
+                분할별로 조인합니다 (grace hash join). 오른쪽이 스트리밍
+                데이터셋이면 기본값 16으로 이 방식을 사용합니다.
+        
+        Returns:
+            조인된 행 목록
+        """
+        if isinstance(other, (str, Path)):
+            if partitions:
+                other = StreamingDataAnalyzer(str(other), encoding=self.encoding)
+            else:
+                other = DataAnalyzer(str(other), encoding=self.encoding,
+                                     cache=self.cache, backend=self.backend)
+        keys, right_names, out_names = _join_spec(self.columns, other.columns, on, how)
+        
+        if partitions or isinstance(other, StreamingDataAnalyzer):
+            left_positions = {name: i for i, name in enumerate(self.columns)}
+            right_positions = {name: i for i, name in enumerate(other.columns)}
+            pairs = _grace_hash_join(
+                self._row_tuples(), [left_positions[name] for name in keys],
+                other._row_tuples(), [right_positions[name] for name in keys],
+                [right_positions[name] for name in right_names], how, partitions or 16)
+            return list(_join_rows(pairs, self.columns, out_names))
+        
+        left = self._decode(self.columns)
+        right = other._decode(keys + right_names)
+        pairs = _join_pairs(_join_keys(left, keys), _join_keys(right, keys), how)
+        right_cols = [right[name] for name in right_names]
+        rows = []
+        for i, j in pairs:
+            row = self._row(i)
+            for name, col in zip(out_names, right_cols):
+                row[name] = col.get(j) if j is not None else ""
+            rows.append(row)
+        return rows
+    
+    def rolling(self, column: str, window: Union[int, str], agg: str = "mean",
+                on: Optional[str] = None) -> List[Optional[float]]:
+        """
+        이동 창 집계(이동 평균 등)를 행마다 계산합니다.
+        
+        창에 값이 들어오고 나갈 때만 상태를 갱신하므로 창 크기와 무관하게
+        행당 O(1)입니다 (합계·평균: 누적합, 최솟값·최댓값: 단조 deque).
+        창 안의 숫자 값만 집계합니다.
+        
+        Args:
+            column: 집계할 열
+            window: 행 수(현재 행 포함 최근 N행) 또는 시간 폭 문자열
+                (예: "30s", "15min", "1h", "7d" — 시각이 (t - 폭, t]인 행)
+            agg: mean, sum, min, max, count
+            on: 시간 폭 창의 기준 날짜/시각 열 (오름차순이어야 하며
+                date_utils가 인식하는 형식으로 해석)
+        
+        Returns:
+            행 순서의 결과 목록 (창에 숫자 값이 없으면 None)
+        """
+        size, span = _window_spec(window, on, agg)
+        table = self._decode([column] if span is None else [column, on])
+        times = _time_values(table[on]) if span is not None else None
+        return _RollingWindow(agg, size, span).update(table[column].iter_numeric(), times)
+    
+    def cumulative(self, column: str, agg: str = "sum") -> List[Optional[float]]:
+        """
+        처음 행부터 각 행까지의 누적 집계(누적 합계 등)를 계산합니다.
+        
+        Args:
+            column: 집계할 열 (숫자가 아닌 셀은 건너뛰고 직전 누적값 유지)
+            agg: sum, mean, min, max, count
+        """
+        return list(_cumulative(self._get_column(column).iter_numeric(), agg))
+    
+    def time_buckets(self, time_column: str, freq: str,
+                     aggs: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """
+        날짜/시각 열을 일정한 시간 구간으로 나누어 구간별로 집계합니다.
+        
+        시각은 date_utils가 인식하는 형식으로 해석하며, 해석하지 못한 행은
+        제외합니다. 구간 키로 group_by()와 같은 단일 패스 해시 집계를 합니다.
+        
+        Args:
+            time_column: 날짜/시각 열
+            freq: 구간 폭 (예: "15min", "1h", "1d", "1w"(월요일 시작),
+                "1m"(달), "1y")
+            aggs: {열: [집계, ...]} — group_by()와 같음
+        
+        Returns:
+            구간 시작 시각 순서의 {구간 시작: {열: {집계: 값}}}
+            (aggs가 없으면 {구간 시작: 행 수})
+        """
+        count, unit = _parse_span(freq)
+        keys, aggs, _ = _group_spec(self.columns, None, None, [time_column], aggs)
+        aggregator = _GroupAggregator(keys, aggs)
+        _add_buckets(aggregator, self._decode(keys + list(aggs)), time_column, count, unit)
+        return dict(sorted(aggregator.results(), key=operator.itemgetter(0)))
+    
+    def histogram(self, column: str, bins: int = 10, jobs: int = 1) -> StreamingHistogram:
+        """
+        열의 고정 구간 히스토그램을 계산합니다 (create_histogram()과 같은 구간).
+        
+        범위는 정렬 인덱스(create_index())가 있으면 인덱스의 양 끝에서 바로 얻고,
+        없으면 숫자 값의 최솟값/최댓값입니다. 여러 파일이면 파일별로 센 뒤
+        합칩니다 (jobs가 2 이상이면 작업 프로세스에서).
+        """
+        if column not in self.columns:
+            raise ValueError(f"열이 존재하지 않습니다: {column}")
+        tables = ([{column: columns[column]} for columns, _ in self._parts]
+                  if self._parts is not None else [{column: self._columns[column]}])
+        
+        index = self._indexes.get(column, {}).get("sorted")
+        if index is not None:
+            value_range = (index.keys[0], index.keys[-1]) if index.keys else None
+        else:
+            ranges = [_value_range(table[column].numeric_values()) for table in tables]
+            ranges = [r for r in ranges if r is not None]
+            value_range = (min(r[0] for r in ranges), max(r[1] for r in ranges)) if ranges else None
+        if value_range is None:
+            return StreamingHistogram(bins, backend=self.backend)
+        
+        jobs = min(_resolve_jobs(jobs), len(tables))
+        args = (repeat(column), repeat(bins), repeat(value_range[0]), repeat(value_range[1]),
+                repeat(self.backend))
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                partials = list(executor.map(_histogram_table, tables, *args))
+        else:
+            partials = list(map(_histogram_table, tables, *args))
+        hist = partials[0]
+        for partial in partials[1:]:
+            hist.merge(partial)
+        return hist
+    
+    def to_csv(self, filepath: str, rows: Optional[Iterable[Dict]] = None,
+               columns: Optional[List[str]] = None) -> None:
+        """
+        데이터를 CSV 파일로 저장합니다.
+        
+        Args:
+            filepath: 저장할 파일 경로
+            rows: 저장할 행 (기본값: 전체 데이터, 생성기 가능)
+            columns: rows의 열 이름 (기본값: 데이터셋의 열, 조인 결과 등에 사용)
+        """
+        self.export(filepath, rows, columns, format="csv")
+    
+    def export(self, filepath: str, rows: Optional[Iterable[Dict]] = None,
+               columns: Optional[List[str]] = None, format: Optional[str] = None) -> int:
+        """
+        데이터를 CSV, JSON Lines 또는 컬럼 형식 파일로 저장합니다.
+        
+        rows가 생성기(예: iter_query())면 행을 모으지 않고 묶음 단위로 바로
+        쓰므로 결과 행 수와 무관하게 메모리 사용량이 일정합니다.
+        
+        Args:
+            filepath: 저장할 파일 경로
+            rows: 저장할 행 (기본값: 전체 데이터)
+            columns: rows의 열 이름 (기본값: 데이터셋의 열)
+            format: "csv", "jsonl", "columnar" (기본값: 확장자로 판단, write_rows() 참고)
+        
+        Returns:
+            저장한 행 수
+        """
+        if rows is not None:
+            return write_rows(filepath, rows, columns or self.columns, format)
+        table = self._decode(self.columns)
+        return _export(filepath, self.columns,
+                       zip(*(table[name].strings() for name in self.columns)), format)
+    
+    def head(self, n: int = 5) -> List[Dict[str, Any]]:
+        """처음 n개 행을 반환합니다."""
+        return self.data[:n]
+    
+    def tail(self, n: int = 5) -> List[Dict[str, Any]]:
+        """마지막 n개 행을 반환합니다."""
+        return self.data[-n:]
+    
+    def value_counts(self, column: str) -> List[Tuple[str, int]]:
+        """열의 값 빈도를 반환합니다."""
+        return self._get_column(column).most_common()
+    
+    def invalid_values(self, column: str) -> List[Tuple[int, str]]:
+        """
+        숫자형 열에서 숫자로 해석하지 못한 셀의 (행 번호, 원문) 목록을 반환합니다.
+        
+        "1,5"처럼 천 단위 구분자인지 소수점 쉼표인지 알 수 없는 값도 포함됩니다.
+        이 셀들은 숫자 통계에서 제외됩니다.
+        """
+        col = self._get_column(column)
+        if isinstance(col, StringColumn):
+            return []
+        return list(col.invalid_values().items())
+    
+    def unique(self, column: str) -> List[str]:
+        """결측치를 제외한 고유값을 처음 등장한 순서로 반환합니다."""
+        col = self._get_column(column)
+        if isinstance(col, StringColumn):
+            dictionary = col.dictionary
+            values = (dictionary[code] for code in col.code_counts())
+        else:
+            values = iter(col.counts())
+        return [value for value in values if not _is_blank(value)]
+
+
+@dataclass
+class _Chunk:
+    """열 단위로 저장된 행 묶음"""
+    columns: Dict[str, Column]
+    n_rows: int
+    
+    def row(self, index: int, names: List[str]) -> Dict[str, str]:
+        """index번째 행을 dict로 반환합니다."""
+        return {name: self.columns[name].get(index) for name in names}
+
+
+class StreamingDataAnalyzer:
+    """
+    파일 전체를 메모리에 올리지 않는 스트리밍 분석 클래스
+    
+    CSV를 chunksize행씩 열 단위 묶음으로 읽어 병합 가능한 부분 집계만
+    유지하므로, 메모리 사용량은 행 수가 아니라 묶음 크기와 고유값 수에
+    비례합니다. 결과는 DataAnalyzer와 같습니다.
+    
+    디렉터리나 glob 패턴을 주면 파일들을 이름순으로 이어서 읽으며, 헤더가
+    다른 파일의 행은 합친 헤더 순서로 맞춥니다 (없는 열은 빈 값).
+    """
+    
+    # 외부 정렬: 한 번에 병합하는 런 수, 런 파일에 한 번에 쓰는 행 수
+    MERGE_FAN_IN = 64
+    RUN_BLOCK_SIZE = 4096
+    
+    def __init__(self, filepath: str, encoding: str = "utf-8", chunksize: int = 100000):
+        """
+        Args:
+            filepath: CSV 파일 경로(압축 가능), 디렉터리(안의 *.csv) 또는 glob 패턴
+            encoding: 파일 인코딩 (기본값: utf-8)
+            chunksize: 한 번에 읽을 행 수
+        """
+        if chunksize <= 0:
+            raise ValueError("chunksize는 1 이상이어야 합니다")
+        self.filepath = Path(filepath)
+        self.files = _expand_paths(filepath)
+        self.chunksize = chunksize
+        
+        # 파일별 (경로, 인코딩, 구분자, 헤더)
+        self._sources: List[Tuple[Path, str, str, List[str]]] = []
+        for path in self.files:
+            # 뒤의 디코딩 오류는 읽는 중에 알립니다 (iter_batches()).
+            self._sources.append((path, *_read_header(path, encoding)))
+        
+        _, self.encoding, self.delimiter, _ = self._sources[0]
+        self.columns: List[str] = _union_header([header for *_, header in self._sources])
+        
+        # 마지막 증분 갱신(get_summary(incremental=True))에서 한 일 설명
+        self.last_refresh: Optional[str] = None
+        # 전체 행 수 (파일을 끝까지 한 번 읽은 뒤에 알 수 있음)
+        self.n_rows: Optional[int] = None
+    
+    def _align(self, batches: Iterable[List[List[str]]], header: List[str]
+               ) -> Iterator[List[List[str]]]:
+        """파일 헤더 순서의 행 묶음을 합친 헤더(self.columns) 순서로 맞춥니다."""
+        if header == self.columns:
+            yield from batches
+            return
+        
+        # 이름이 중복되면 csv.DictReader처럼 마지막 열을 사용
+        positions = {name: i for i, name in enumerate(header)}
+        order = [positions.get(name) for name in self.columns]
+        for batch in batches:
+            yield [["" if p is None else row[p] for p in order] for row in batch]
+    
+    def iter_batches(self) -> Iterator[List[List[str]]]:
+        """
+        파일을 처음부터 chunksize행씩 읽어 행 목록 묶음으로 반환합니다.
+        
+        끝까지 읽으면 전체 행 수를 n_rows에 기록합니다.
+        """
+        n_rows = 0
+        for path, encoding, delimiter, header in self._sources:
+            with open_compressed(path, "rt", encoding=encoding, newline="") as f:
+                reader = csv.reader(f, delimiter=delimiter)
+                try:
+                    next(reader, None)
+                    for batch in self._align(
+                            _iter_row_batches(reader, len(header), self.chunksize), header):
+                        n_rows += len(batch)
+                        yield batch
+                except UnicodeDecodeError as e:
+                    raise _decode_error(path, encoding, e) from None
+        self.n_rows = n_rows
+    
+    def _range_batches(self, f: BinaryIO, start: int, end: int,
+                       errors: str = "strict") -> Iterator[List[List[str]]]:
+        """
+        단일 파일의 [start, end) 바이트 구간을 chunksize행씩 읽습니다.
         
-        # 중앙값
-        mid = n // 2
-        if n % 2 == 0:
-            median = (sorted_vals[mid - 1] + sorted_vals[mid]) / 2
-        else:
-            median = sorted_vals[mid]
+        start가 0이면 첫 줄을 헤더로 보고 건너뜁니다.
+        """
+        _, encoding, delimiter, header = self._sources[0]
+        text = io.TextIOWrapper(io.BufferedReader(_ByteRange(f, start, end)),
+                                encoding=encoding, errors=errors, newline="")
+        reader = csv.reader(text, delimiter=delimiter)
+        try:
+            if start == 0:
+                next(reader, None)
+            yield from self._align(_iter_row_batches(reader, len(header), self.chunksize), header)
+        except UnicodeDecodeError as e:
+            raise _decode_error(self.files[0], encoding, e) from None
+    
+    def iter_chunks(self, names: Optional[Iterable[str]] = None) -> Iterator[_Chunk]:
+        """
+        파일을 처음부터 chunksize행씩 읽어 열 단위 묶음으로 반환합니다.
         
-        # 표준편차
-        if n > 1:
-            variance = sum((x - mean) ** 2 for x in values) / (n - 1)
-            std_dev = math.sqrt(variance)
-        else:
-            std_dev = 0
-        
-        return {
-            "min": min(values),
-            "max": max(values),
-            "mean": mean,
-            "median": median,
-            "std_dev": std_dev,
-            "sum": sum(values),
-        }
-    
-    def get_column_stats(self, column: str) -> ColumnStats:
-        """특정 열의 통계를 계산합니다."""
+        Args:
+            names: 구성할 열 이름 (기본값: 전체). 나머지 열은 타입 추론을 건너뜁니다.
+        """
+        names = list(dict.fromkeys(names)) if names is not None else None
+        for batch in self.iter_batches():
+            yield _Chunk(*_build_table([batch], self.columns, names))
+    
+    def _check_column(self, column: str) -> None:
         if column not in self.columns:
             raise ValueError(f"열이 존재하지 않습니다: {column}")
+    
+    def iter_rows(self) -> Iterator[Dict[str, str]]:
+        """모든 행을 dict로 차례로 반환합니다."""
+        for chunk in self.iter_chunks():
+            for i in range(chunk.n_rows):
+                yield chunk.row(i, self.columns)
+    
+    def _medians(self, accumulators: Dict[str, _ColumnAccumulator]) -> Dict[str, float]:
+        """숫자형 열의 중앙값을 고정 메모리로 정확히 계산합니다 (추가 스캔 필요)."""
+        finders: Dict[str, List[_RankFinder]] = {}
+        for name, acc in accumulators.items():
+            if acc.dtype != "numeric":
+                continue
+            mid = acc.n // 2
+            ranks = [mid] if acc.n % 2 else [mid - 1, mid]
+            finders[name] = [_RankFinder(k, acc.min, acc.max) for k in ranks]
+        
+        for group in finders.values():
+            for finder in group:
+                if finder.low == finder.high:
+                    finder.result = finder.low
         
-        values = [row.get(column, "") for row in self.data]
+        while any(not f.done for group in finders.values() for f in group):
+            pending = [name for name, group in finders.items() if not all(f.done for f in group)]
+            for chunk in self.iter_chunks(pending):
+                for name in pending:
+                    active = [f for f in finders[name] if not f.done]
+                    if active:
+                        values = chunk.columns[name].numeric_values()
+                        for finder in active:
+                            finder.scan(values)
+            for group in finders.values():
+                for finder in group:
+                    if not finder.done:
+                        finder.finish_pass()
+        
+        return {name: sum(f.result for f in group) / len(group)
+                for name, group in finders.items()}
+    
+    def _accumulate(self, names: List[str], jobs: int = 1, approx: Optional[float] = None,
+                    batches: Optional[Iterable[List[List[str]]]] = None, seed: int = 1
+                    ) -> Tuple[Dict[str, _ColumnAccumulator], int]:
+        """
+        묶음별 부분 집계를 파일 순서대로 병합합니다.
         
-        # 결측치 계산
-        missing = sum(1 for v in values if not v or v.strip() == "")
+        jobs가 2 이상이면 묶음의 타입 추론과 집계를 작업 프로세스에 나누어
+        맡기며, 병합 순서가 같으므로 결과는 직렬 계산과 같습니다.
+        approx를 지정하면 스케치를 쓰는 근사 모드 집계기를 병합합니다.
+        batches를 주면 파일 전체 대신 그 행 묶음들만 집계합니다. 묶음마다
+        seed부터 차례로 다른 스케치 시드를 씁니다.
+        """
+        if batches is None:
+            batches = self.iter_batches()
+        accumulators = {name: _make_accumulator(name, approx) for name in names}
+        n_rows = 0
         
-        # 고유값 수
-        unique = len(set(v for v in values if v and v.strip()))
+        def merge(partials: Iterable[Tuple[Dict[str, _ColumnAccumulator], int]]) -> None:
+            nonlocal n_rows
+            for partial, rows in partials:
+                n_rows += rows
+                for name, accumulator in partial.items():
+                    accumulators[name].merge(accumulator)
         
-        # 숫자형 여부 판단
-        numeric_values = [self._to_numeric(v) for v in values]
-        numeric_values = [v for v in numeric_values if v is not None]
+        jobs = _resolve_jobs(jobs)
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                merge(_bounded_map(executor, _accumulate_batch, enumerate(batches, seed),
+                                   jobs * 2, self.columns, names, approx))
+        else:
+            merge(_accumulate_batch(item, self.columns, names, approx)
+                  for item in enumerate(batches, seed))
+        return accumulators, n_rows
+    
+    def _refresh(self, jobs: int = 1, approx: Optional[float] = None
+                 ) -> Tuple[Dict[str, _ColumnAccumulator], int]:
+        """
+        체크포인트 이후 파일 끝에 추가된 행만 읽어 전체 집계를 갱신합니다.
         
-        numeric_ratio = len(numeric_values) / len(values) if values else 0
+        체크포인트(CSV 옆의 .dackpt 파일)에는 마지막으로 읽은 완성된 줄의 끝
+        위치와 그때까지의 병합 가능한 열 집계가 들어 있습니다. 파일이 그
+        위치보다 짧아졌거나(잘림), 앞부분 또는 그 위치 직전 구간의 해시가
+        달라졌거나(다시 쓰임), 인코딩·구분자·헤더·approx가 바뀌었으면
+        처음부터 다시 집계합니다. 쓰는 중이라 줄바꿈으로 끝나지 않은 마지막
+        줄은 이번 결과에만 반영하고 체크포인트에는 넣지 않습니다.
+        """
+        path, encoding, delimiter, header = self._sources[0]
+        if len(self._sources) != 1 or detect_compression(path) is not None:
+            raise ValueError("증분 갱신은 압축되지 않은 단일 CSV 파일에서만 사용할 수 있습니다")
+        names = list(dict.fromkeys(self.columns))
+        settings = {"encoding": encoding, "delimiter": delimiter,
+                    "header": header, "approx": approx}
         
-        stats = ColumnStats(
-            name=column,
-            dtype="numeric" if numeric_ratio > 0.8 else "string",
-            count=len(values),
-            missing=missing,
-            unique=unique
-        )
+        state = _read_checkpoint(path)
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if state is None:
+                reason = "체크포인트 없음"
+            elif any(state.get(key) != value for key, value in settings.items()):
+                reason = "설정이 바뀜"
+            elif state["offset"] > size:
+                reason = "파일이 잘림"
+            elif _probe_digests(f, state["offset"]) != state["digests"]:
+                reason = "파일 내용이 바뀜"
+            else:
+                reason = None
+            
+            if reason is None:
+                start, accumulators, n_rows = state["offset"], state["accumulators"], state["rows"]
+            else:
+                start, n_rows = 0, 0
+                accumulators = {name: _make_accumulator(name, approx) for name in names}
+            
+            end = max(start, _last_line_end(f, size))
+            # 스케치 시드는 바이트 위치로 정해 이전 갱신의 묶음과 겹치지 않게 합니다.
+            added, rows = self._accumulate(names, jobs=jobs, approx=approx,
+                                           batches=self._range_batches(f, start, end),
+                                           seed=start + 1)
+            n_rows += rows
+            for name in names:
+                accumulators[name].merge(added[name])
+            
+            try:
+                _write_checkpoint(path, dict(
+                    settings, version=_CHECKPOINT_VERSION, offset=end, rows=n_rows,
+                    digests=_probe_digests(f, end), accumulators=accumulators))
+            except OSError:
+                pass  # 저장하지 못하면 다음 갱신이 전체 재구성이 될 뿐
+            
+            if end < size:
+                partial, rows = self._accumulate(
+                    names, approx=approx, batches=self._range_batches(f, end, size, "replace"),
+                    seed=end + 1)
+                n_rows += rows
+                for name in names:
+                    accumulators[name].merge(partial[name])
         
-        if stats.dtype == "numeric" and numeric_values:
-            calc_stats = self._calculate_stats(numeric_values)
-            stats.min_val = calc_stats.get("min")
-            stats.max_val = calc_stats.get("max")
-            stats.mean = calc_stats.get("mean")
-            stats.median = calc_stats.get("median")
-            stats.std_dev = calc_stats.get("std_dev")
-            stats.sum_val = calc_stats.get("sum")
+        read = size - start
+        if reason is None:
+            self.last_refresh = f"증분 갱신: 체크포인트 이후 {read:,}바이트만 읽음"
         else:
-            # 문자형: 빈도 상위 값
-            counter = Counter(v for v in values if v and v.strip())
-            stats.top_values = counter.most_common(5)
+            self.last_refresh = f"전체 재구성 ({reason}): {read:,}바이트 읽음"
+        return accumulators, n_rows
+    
+    def get_column_stats(self, column: str, approx: Optional[float] = None) -> ColumnStats:
+        """
+        특정 열의 통계를 계산합니다.
         
-        return stats
+        Args:
+            column: 열 이름
+            approx: 근사 모드 오차 한도. 지정하면 중앙값을 위한 추가 스캔 없이
+                한 번의 스캔으로 끝납니다 (DataAnalyzer.get_column_stats() 참고).
+        """
+        self._check_column(column)
+        accumulators, _ = self._accumulate([column], approx=approx)
+        medians = self._medians(accumulators) if approx is None else {}
+        return accumulators[column].result(median=medians.get(column))
     
-    def get_summary(self) -> DataSummary:
-        """데이터셋 전체 요약을 반환합니다."""
-        column_stats = {}
-        for col in self.columns:
-            column_stats[col] = self.get_column_stats(col)
+    def get_summary(self, jobs: int = 1, approx: Optional[float] = None,
+                    incremental: bool = False) -> DataSummary:
+        """
+        데이터셋 전체 요약을 반환합니다.
+        
+        Args:
+            jobs: 작업 프로세스 수 (1: 직렬, 0 이하: CPU 코어 수).
+                행 묶음 단위로 나누어 계산한 부분 집계를 순서대로 병합합니다.
+            approx: 근사 모드 오차 한도 (get_column_stats() 참고)
+            incremental: True이면 체크포인트 파일을 두고 지난번 이후 추가된
+                행만 읽습니다 (압축되지 않은 단일 파일만, _refresh() 참고).
+                정확 모드의 중앙값은 추가 스캔 대신 값별 빈도로 구합니다.
+        """
+        names = list(dict.fromkeys(self.columns))
+        if incremental:
+            accumulators, n_rows = self._refresh(jobs=jobs, approx=approx)
+            medians = ({name: acc.median() for name, acc in accumulators.items()
+                        if acc.dtype == "numeric"} if approx is None else {})
+        else:
+            accumulators, n_rows = self._accumulate(names, jobs=jobs, approx=approx)
+            medians = self._medians(accumulators) if approx is None else {}
         
         return DataSummary(
             filename=self.filepath.name,
-            rows=len(self.data),
+            rows=n_rows,
             columns=len(self.columns),
             column_names=self.columns,
-            column_stats=column_stats,
-            sample_rows=self.data[:5]
+            column_stats={name: accumulators[name].result(median=medians.get(name))
+                          for name in self.columns},
+            sample_rows=self.head(5)
         )
     
-    def describe(self) -> str:
-        """pandas의 describe()와 유사한 출력을 생성합니다."""
-        summary = self.get_summary()
-        
-        lines = []
-        lines.append(f"파일: {summary.filename}")
-        lines.append(f"행 수: {summary.rows:,}")
-        lines.append(f"열 수: {summary.columns}")
-        lines.append("")
-        
-        # 숫자형 열 통계
-        numeric_cols = [s for s in summary.column_stats.values() if s.dtype == "numeric"]
-        if numeric_cols:
-            lines.append("📊 숫자형 열 통계:")
-            lines.append("-" * 80)
-            
-            # 헤더
-            headers = ["", "count", "mean", "std", "min", "median", "max"]
-            lines.append(f"{headers[0]:15} {headers[1]:>10} {headers[2]:>12} {headers[3]:>12} {headers[4]:>12} {headers[5]:>12} {headers[6]:>12}")
-            lines.append("-" * 80)
-            
-            for s in numeric_cols:
-                lines.append(
-                    f"{s.name[:15]:15} {s.count - s.missing:>10} "
-                    f"{s.mean:>12.2f} {s.std_dev:>12.2f} "
-                    f"{s.min_val:>12.2f} {s.median:>12.2f} {s.max_val:>12.2f}"
-                )
-        
-        lines.append("")
-        
-        # 문자형 열 통계
-        string_cols = [s for s in summary.column_stats.values() if s.dtype == "string"]
-        if string_cols:
-            lines.append("📝 문자형 열 통계:")
-            lines.append("-" * 60)
-            
-            for s in string_cols:
-                lines.append(f"\n{s.name}:")
-                lines.append(f"  - 유효값: {s.count - s.missing:,} / 결측: {s.missing:,}")
-                lines.append(f"  - 고유값: {s.unique:,}")
-                if s.top_values:
-                    top_str = ", ".join(f"{v}({c})" for v, c in s.top_values[:3])
-                    lines.append(f"  - 상위값: {top_str}")
+    def describe(self, jobs: int = 1, approx: Optional[float] = None,
+                 incremental: bool = False) -> str:
+        """
+        pandas의 describe()와 유사한 출력을 생성합니다.
         
-        return "\n".join(lines)
+        Args:
+            jobs: 작업 프로세스 수 (get_summary() 참고)
+            approx: 근사 모드 오차 한도 (get_column_stats() 참고)
+            incremental: 추가된 행만 읽어 갱신 (get_summary() 참고)
+        """
+        text = _format_summary(self.get_summary(jobs=jobs, approx=approx, incremental=incremental))
+        if not incremental:
+            return text
+        return f"{text}\n\n🔁 {self.last_refresh}"
     
-    def filter(self, column: str, condition: str, value: Any) -> List[Dict[str, Any]]:
+    def filter(self, column: str, condition: str, value: Any) -> Iterator[Dict[str, Any]]:
         """
-        조건에 맞는 행을 필터링합니다.
+        조건에 맞는 행을 차례로 반환합니다 (지연 평가).
         
         Args:
             column: 필터링할 열
-            condition: 조건 (eq, ne, gt, lt, ge, le, contains)
-            value: 비교 값
-            
+            condition: 조건 (eq, ne, gt, lt, ge, le, contains, in, between, regex)
+            value: 비교 값 (in은 값 목록, between은 [하한, 상한])
+        
         Returns:
-            필터링된 행 목록
+            필터링된 행을 반환하는 이터레이터
         """
-        if column not in self.columns:
-            raise ValueError(f"열이 존재하지 않습니다: {column}")
-        
-        results = []
-        
-        for row in self.data:
-            cell_value = row.get(column, "")
-            numeric_cell = self._to_numeric(cell_value)
-            
-            match = False
-            
-            if condition == "eq":
-                match = cell_value == str(value) or (numeric_cell is not None and numeric_cell == float(value))
-            elif condition == "ne":
-                match = cell_value != str(value)
-            elif condition == "gt" and numeric_cell is not None:
-                match = numeric_cell > float(value)
-            elif condition == "lt" and numeric_cell is not None:
-                match = numeric_cell < float(value)
-            elif condition == "ge" and numeric_cell is not None:
-                match = numeric_cell >= float(value)
-            elif condition == "le" and numeric_cell is not None:
-                match = numeric_cell <= float(value)
-            elif condition == "contains":
-                match = str(value).lower() in cell_value.lower()
-            
-            if match:
-                results.append(row)
+        self._check_column(column)
+        return self._query(_Predicate(column, condition, value))
+    
+    def query(self, expression: str) -> Iterator[Dict[str, Any]]:
+        """
+        필터 식에 맞는 행을 차례로 반환합니다 (지연 평가).
         
-        return results
+        행을 읽는 대로 원문 셀에 식을 평가합니다. 식 문법은 DataAnalyzer.query()와 같습니다.
+        """
+        plan = _parse_filter(expression)
+        for name in plan.columns():
+            self._check_column(name)
+        return self._query(plan)
+    
+    def _query(self, plan: _FilterNode) -> Iterator[Dict[str, Any]]:
+        # 열을 만들지 않고 원문 셀로 평가하므로 걸러진 행은 타입 추론도 하지 않습니다.
+        positions = {name: i for i, name in enumerate(self.columns)}
+        for row in _filter_rows(chain.from_iterable(self.iter_batches()), plan, self.columns):
+            yield {name: row[i] for name, i in positions.items()}
     
-    def group_by(self, column: str, agg_column: Optional[str] = None) -> Dict[str, Any]:
+    def group_by(self, column: Optional[str] = None, agg_column: Optional[str] = None,
+                 keys: Optional[List[str]] = None,
+                 aggs: Optional[Dict[str, List[str]]] = None,
+                 partitions: Optional[int] = None) -> Dict[Any, Any]:
         """
-        열 기준으로 그룹화합니다.
+        열 기준으로 그룹화합니다. 인자는 DataAnalyzer.group_by()와 같습니다.
         
         Args:
-            column: 그룹화 기준 열
-            agg_column: 집계할 열 (선택적)
-            
-        Returns:
-            그룹별 집계 결과
+            partitions: 지정하면 키를 이 개수로 해시 분할해 임시 파일로 내보낸 뒤
+                분할마다 따로 집계합니다 (키 종류가 매우 많을 때, iter_groups() 참고).
         """
-        if column not in self.columns:
-            raise ValueError(f"열이 존재하지 않습니다: {column}")
+        keys, aggs, legacy = _group_spec(self.columns, column, agg_column, keys, aggs)
+        if partitions:
+            results = self._partitioned_groups(keys, aggs, partitions)
+        else:
+            aggregator = _GroupAggregator(keys, aggs)
+            for chunk in self.iter_chunks(list(dict.fromkeys(keys + list(aggs)))):
+                aggregator.add_columns(chunk.columns)
+            results = aggregator.results()
+        return _group_result(results, aggs, legacy)
+    
+    def iter_groups(self, keys: List[str], aggs: Optional[Dict[str, List[str]]] = None,
+                    partitions: int = 16) -> Iterator[Tuple[Any, Any]]:
+        """
+        그룹별 집계 결과를 (키, 결과) 쌍으로 차례로 반환합니다.
         
-        groups: Dict[str, List[Dict]] = defaultdict(list)
+        키를 해시 분할해 임시 파일로 내보낸 뒤 분할마다 따로 집계하므로, 동시에
+        메모리에 두는 그룹 상태는 전체의 약 1/partitions입니다. 그룹은 분할
+        순서대로 나옵니다.
+        """
+        keys, aggs, _ = _group_spec(self.columns, None, None, keys, aggs)
+        return self._partitioned_groups(keys, aggs, partitions)
+    
+    def _partitioned_groups(self, keys: List[str], aggs: Dict[str, List[str]],
+                            partitions: int) -> Iterator[Tuple[Any, Any]]:
+        agg_columns = list(aggs)
+        names = list(dict.fromkeys(keys + agg_columns))
         
-        for row in self.data:
-            key = row.get(column, "(빈값)")
-            groups[key].append(row)
+        with tempfile.TemporaryDirectory(prefix="data_analyzer_") as tmpdir:
+            paths = [Path(tmpdir) / f"part{p}.pkl" for p in range(partitions)]
+            files = [open(path, "wb") for path in paths]
+            try:
+                for chunk in self.iter_chunks(names):
+                    chunk_keys = list(zip(*(chunk.columns[name].strings() for name in keys)))
+                    chunk_values = [list(chunk.columns[name].iter_numeric()) for name in agg_columns]
+                    buckets: List[List[int]] = [[] for _ in range(partitions)]
+                    for i, key in enumerate(chunk_keys):
+                        buckets[hash(key) % partitions].append(i)
+                    for f, rows in zip(files, buckets):
+                        if rows:
+                            part = ([chunk_keys[i] for i in rows],
+                                    [[values[i] for i in rows] for values in chunk_values])
+                            pickle.dump(part, f, pickle.HIGHEST_PROTOCOL)
+            finally:
+                for f in files:
+                    f.close()
+            
+            for path in paths:
+                aggregator = _GroupAggregator(keys, aggs)
+                with open(path, "rb") as f:
+                    while True:
+                        try:
+                            part_keys, part_values = pickle.load(f)
+                        except EOFError:
+                            break
+                        aggregator.add_rows(part_keys, part_values)
+                yield from aggregator.results()
+    
+    def pivot(self, index: str, columns: str, values: Optional[str] = None,
+              aggfunc: str = "sum", partitions: Optional[int] = None) -> PivotTable:
+        """
+        피벗 테이블을 한 번의 스트리밍 패스로 만듭니다.
         
-        if agg_column and agg_column in self.columns:
-            # 숫자형 집계
-            result = {}
-            for key, rows in groups.items():
-                values = [self._to_numeric(r.get(agg_column, "")) for r in rows]
-                values = [v for v in values if v is not None]
-                
-                if values:
-                    result[key] = {
-                        "count": len(rows),
-                        "sum": sum(values),
-                        "mean": sum(values) / len(values),
-                        "min": min(values),
-                        "max": max(values),
-                    }
-                else:
-                    result[key] = {"count": len(rows)}
-            return result
-        else:
-            # 단순 카운트
-            return {key: len(rows) for key, rows in groups.items()}
+        인자는 DataAnalyzer.pivot()과 같고, partitions는 group_by()와 같습니다.
+        """
+        keys, aggs = _pivot_spec(self.columns, index, columns, values, aggfunc)
+        groups = self.group_by(keys=keys, aggs=aggs, partitions=partitions)
+        return _pivot_result(groups, index, columns, values, aggfunc)
     
     def correlation(self, col1: str, col2: str) -> Optional[float]:
         """두 숫자형 열의 상관계수를 계산합니다."""
         if col1 not in self.columns or col2 not in self.columns:
             raise ValueError("열이 존재하지 않습니다")
         
-        pairs = []
-        for row in self.data:
-            v1 = self._to_numeric(row.get(col1, ""))
-            v2 = self._to_numeric(row.get(col2, ""))
-            if v1 is not None and v2 is not None:
-                pairs.append((v1, v2))
+        moments = _CoMoments()
+        for chunk in self.iter_chunks([col1, col2]):
+            moments.add_pairs(*_numeric_pairs(chunk.columns[col1], chunk.columns[col2]))
+        return moments.correlation()
+    
+    def correlation_matrix(self, columns: Optional[List[str]] = None
+                           ) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        여러 열의 상관계수 행렬을 한 번의 스캔으로 계산합니다.
         
-        if len(pairs) < 2:
-            return None
+        Args:
+            columns: 대상 열 목록 (기본값: 모든 숫자형 열). 생략하면 describe()와
+                같은 전체 스캔으로 열 타입을 먼저 정하므로 파일을 두 번 읽습니다.
+        """
+        if columns is None:
+            names = list(dict.fromkeys(self.columns))
+            accumulators, _ = self._accumulate(names)
+            columns = [name for name in names if accumulators[name].dtype == "numeric"]
+        for name in columns:
+            self._check_column(name)
+        
+        columns = list(dict.fromkeys(columns))
+        if not columns:
+            return {}
+        matrix = _CorrelationMatrix(columns)
+        for chunk in self.iter_chunks(columns):
+            matrix.add_columns(chunk.columns)
+        return matrix.result()
+    
+    def value_counts(self, column: str) -> List[Tuple[str, int]]:
+        """열의 값 빈도를 반환합니다."""
+        self._check_column(column)
+        counts: Counter = Counter()
+        for chunk in self.iter_chunks([column]):
+            counts.update(chunk.columns[column].counts())
+        return counts.most_common()
+    
+    def unique(self, column: str) -> List[str]:
+        """결측치를 제외한 고유값을 처음 등장한 순서로 반환합니다."""
+        self._check_column(column)
+        seen: Dict[str, None] = {}
+        for chunk in self.iter_chunks([column]):
+            col = chunk.columns[column]
+            if isinstance(col, StringColumn):
+                dictionary = col.dictionary
+                seen.update(dict.fromkeys(dictionary[code] for code in col.code_counts()))
+            else:
+                seen.update(dict.fromkeys(col.counts()))
+        return [value for value in seen if not _is_blank(value)]
+    
+    def head(self, n: int = 5) -> List[Dict[str, Any]]:
+        """처음 n개 행을 반환합니다."""
+        rows = []
+        if n <= 0:
+            return rows
+        for row in self.iter_rows():
+            rows.append(row)
+            if len(rows) >= n:
+                break
+        return rows
+    
+    def tail(self, n: int = 5) -> List[Dict[str, Any]]:
+        """마지막 n개 행을 반환합니다."""
+        if n <= 0:
+            return list(self.iter_rows())
+        return list(deque(self.iter_rows(), maxlen=n))
+    
+    def sort_by(self, columns: Union[str, List[str]],
+                descending: Union[bool, List[bool]] = False,
+                limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        열 기준으로 정렬한 행을 차례로 반환합니다 (외부 병합 정렬).
         
-        n = len(pairs)
-        x_vals = [p[0] for p in pairs]
-        y_vals = [p[1] for p in pairs]
+        chunksize행씩 정렬한 런(run)을 임시 파일로 내보낸 뒤 k-way 병합하므로
+        메모리 사용량은 청크 크기와 병합 차수에 비례합니다. 런이 MERGE_FAN_IN개를
+        넘으면 여러 단계로 나누어 병합합니다. 정렬 순서는 DataAnalyzer.sort_by()와
+        같습니다.
+        
+        Args:
+            columns: 정렬 기준 열 (여러 개면 앞의 열이 우선)
+            descending: 내림차순 여부 (열마다 다르게 하려면 목록)
+            limit: 지정하면 앞의 limit개 행만 크기 limit의 힙으로 유지합니다
+                (임시 파일을 쓰지 않음)
+        """
+        names, flags = _sort_spec(self.columns, columns, descending)
+        if limit is not None:
+            return iter(self._sorted_head(names, flags, max(limit, 0)))
+        return self._external_sort(names, flags)
+    
+    def _keyed_batches(self, names: List[str], flags: List[bool]
+                       ) -> Iterator[Tuple[List[Tuple], List[List[str]]]]:
+        """행 묶음마다 (행별 정렬 키, 행 목록)을 반환합니다 (정렬 열만 타입 추론)."""
+        for batch in self.iter_batches():
+            columns, _ = _build_table([batch], self.columns, names)
+            yield _row_sort_keys(columns, names, flags), batch
+    
+    def _sorted_head(self, names: List[str], flags: List[bool], limit: int
+                     ) -> List[Dict[str, Any]]:
+        best: List[Tuple] = []
+        for keys, batch in self._keyed_batches(names, flags):
+            # 이전 후보가 앞쪽 행이므로 nsmallest의 안정성으로 같은 키는 먼저 온 행이 남습니다.
+            best = heapq.nsmallest(limit, chain(best, zip(keys, batch)), key=operator.itemgetter(0))
+        return [dict(zip(self.columns, row)) for _, row in best]
+    
+    def _external_sort(self, names: List[str], flags: List[bool]) -> Iterator[Dict[str, Any]]:
+        by_key = operator.itemgetter(0)
+        with tempfile.TemporaryDirectory(prefix="data_analyzer_") as tmpdir:
+            runs: List[Path] = []
+            for keys, batch in self._keyed_batches(names, flags):
+                order = sorted(range(len(batch)), key=keys.__getitem__)
+                path = Path(tmpdir) / f"run{len(runs)}.pkl"
+                _write_run(path, ((keys[i], batch[i]) for i in order), self.RUN_BLOCK_SIZE)
+                runs.append(path)
+            
+            # 열린 파일 수를 제한하기 위해 런을 MERGE_FAN_IN개씩 미리 병합합니다.
+            # 이웃한 런끼리 순서대로 병합하므로 정렬의 안정성이 유지됩니다.
+            generation = 0
+            while len(runs) > self.MERGE_FAN_IN:
+                merged = []
+                for start in range(0, len(runs), self.MERGE_FAN_IN):
+                    group = runs[start:start + self.MERGE_FAN_IN]
+                    path = Path(tmpdir) / f"merge{generation}_{start}.pkl"
+                    _write_run(path, heapq.merge(*map(_read_run, group), key=by_key),
+                               self.RUN_BLOCK_SIZE)
+                    for run in group:
+                        run.unlink()
+                    merged.append(path)
+                runs = merged
+                generation += 1
+            
+            for _, row in heapq.merge(*map(_read_run, runs), key=by_key):
+                yield dict(zip(self.columns, row))
+    
+    def top_k(self, column: str, k: int = 10, largest: bool = True) -> List[Dict[str, Any]]:
+        """
+        숫자 값이 가장 큰(largest=False면 가장 작은) k개 행을 값 순서로 반환합니다.
         
-        mean_x = sum(x_vals) / n
-        mean_y = sum(y_vals) / n
+        청크마다 상위 k개만 골라 크기 k의 후보와 합치므로 메모리는 O(k)입니다.
+        결과는 DataAnalyzer.top_k()와 같습니다.
+        """
+        self._check_column(column)
+        select = heapq.nlargest if largest else heapq.nsmallest
+        best: List[Tuple[float, Dict[str, str]]] = []
+        for batch in self.iter_batches():
+            columns, _ = _build_table([batch], self.columns, [column])
+            col = columns[column]
+            found = [(col.numeric_at(i), dict(zip(self.columns, batch[i])))
+                     for i in _top_k_indices(col, k, largest)]
+            best = select(k, chain(best, found), key=operator.itemgetter(0))
+        return [row for _, row in best]
+    
+    def _row_tuples(self) -> Iterator[List[str]]:
+        """모든 행을 열 순서의 값 목록으로 차례로 반환합니다."""
+        return chain.from_iterable(self.iter_batches())
+    
+    def join(self, other: Union[str, DataAnalyzer, "StreamingDataAnalyzer"],
+             on: Union[str, List[str]], how: str = "inner",
+             partitions: int = 16) -> Iterator[Dict[str, Any]]:
+        """
+        다른 데이터셋과 분할(grace) 해시 조인한 행을 차례로 반환합니다.
         
-        numerator = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
-        denom_x = math.sqrt(sum((x - mean_x) ** 2 for x in x_vals))
-        denom_y = math.sqrt(sum((y - mean_y) ** 2 for y in y_vals))
+        양쪽을 키 해시로 partitions개의 임시 파일에 나누어 쓴 뒤 분할마다
+        행이 적은 쪽에 해시 테이블을 만들어 조인하므로, 한 번에 메모리에 두는
+        행은 전체의 약 1/partitions입니다. 결과는 분할 순서로 나옵니다.
+        나머지 규칙은 DataAnalyzer.join()과 같습니다.
         
-        if denom_x == 0 or denom_y == 0:
-            return None
+        Args:
+            other: 오른쪽 데이터셋 또는 CSV 파일 경로 (경로면 같은 chunksize로 스트리밍)
+            on: 조인 키 열
+            how: "inner" 또는 "left"
+            partitions: 분할 수
+        """
+        if isinstance(other, (str, Path)):
+            other = StreamingDataAnalyzer(str(other), encoding=self.encoding,
+                                          chunksize=self.chunksize)
+        keys, right_names, out_names = _join_spec(self.columns, other.columns, on, how)
+        if partitions <= 0:
+            raise ValueError("partitions는 1 이상이어야 합니다")
         
-        return numerator / (denom_x * denom_y)
+        left_positions = {name: i for i, name in enumerate(self.columns)}
+        right_positions = {name: i for i, name in enumerate(other.columns)}
+        pairs = _grace_hash_join(
+            self._row_tuples(), [left_positions[name] for name in keys],
+            other._row_tuples(), [right_positions[name] for name in keys],
+            [right_positions[name] for name in right_names], how, partitions)
+        return _join_rows(pairs, self.columns, out_names)
     
-    def to_csv(self, filepath: str, rows: Optional[List[Dict]] = None) -> None:
-        """데이터를 CSV 파일로 저장합니다."""
-        data_to_write = rows if rows is not None else self.data
+    def rolling(self, column: str, window: Union[int, str], agg: str = "mean",
+                on: Optional[str] = None) -> Iterator[Optional[float]]:
+        """
+        이동 창 집계를 행마다 차례로 반환합니다.
         
-        with open(filepath, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.columns)
-            writer.writeheader()
-            writer.writerows(data_to_write)
+        창 상태가 청크 경계를 넘어 이어지므로 결과는 DataAnalyzer.rolling()과
+        같고, 메모리는 창 안의 값 수에만 비례합니다.
+        """
+        size, span = _window_spec(window, on, agg)
+        self._check_column(column)
+        if span is not None:
+            self._check_column(on)
+        return self._rolling(column, on, _RollingWindow(agg, size, span))
     
-    def head(self, n: int = 5) -> List[Dict[str, Any]]:
-        """처음 n개 행을 반환합니다."""
-        return self.data[:n]
+    def _rolling(self, column: str, on: Optional[str], state: _RollingWindow
+                 ) -> Iterator[Optional[float]]:
+        timed = state.span is not None
+        for chunk in self.iter_chunks([column] + ([on] if timed else [])):
+            times = _time_values(chunk.columns[on]) if timed else None
+            yield from state.update(chunk.columns[column].iter_numeric(), times)
     
-    def tail(self, n: int = 5) -> List[Dict[str, Any]]:
-        """마지막 n개 행을 반환합니다."""
-        return self.data[-n:]
+    def cumulative(self, column: str, agg: str = "sum") -> Iterator[Optional[float]]:
+        """처음 행부터 각 행까지의 누적 집계를 차례로 반환합니다."""
+        self._check_column(column)
+        return _cumulative(chain.from_iterable(
+            chunk.columns[column].iter_numeric() for chunk in self.iter_chunks([column])), agg)
     
-    def value_counts(self, column: str) -> List[Tuple[str, int]]:
-        """열의 값 빈도를 반환합니다."""
-        if column not in self.columns:
-            raise ValueError(f"열이 존재하지 않습니다: {column}")
+    def time_buckets(self, time_column: str, freq: str,
+                     aggs: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """
+        날짜/시각 열의 시간 구간별로 집계합니다. 인자와 결과는
+        DataAnalyzer.time_buckets()와 같으며, 구간별 상태만 메모리에 둡니다.
+        """
+        count, unit = _parse_span(freq)
+        keys, aggs, _ = _group_spec(self.columns, None, None, [time_column], aggs)
+        aggregator = _GroupAggregator(keys, aggs)
+        for chunk in self.iter_chunks(list(dict.fromkeys(keys + list(aggs)))):
+            _add_buckets(aggregator, chunk.columns, time_column, count, unit)
+        return dict(sorted(aggregator.results(), key=operator.itemgetter(0)))
+    
+    def sample(self, size: Optional[int] = None, fraction: Optional[float] = None,
+               stratify: Optional[str] = None, seed: Optional[int] = None,
+               backend: Optional[str] = None) -> DataAnalyzer:
+        """
+        파일을 한 번 스트리밍하면서 무작위 표본을 뽑아 표본만 메모리에 올립니다.
+        
+        size를 주면 저수지 표본(Algorithm L)으로 정확히 size행을, fraction을
+        주면 각 행을 그 확률로 뽑는 베르누이 표본을 만듭니다. stratify 열을 주면
+        층(열 값)마다 size행의 저수지를 유지하다가 끝에서 층별 원본 행 수에 비례해
+        나누므로 (층마다 최대 size행을 메모리에 둠) 층 구성이 원본과 같아집니다.
+        표본은 원래 행 순서이며, 반환된 DataAnalyzer의 모든 분석은 표본 기준이고
+        sampling에 추출 정보가, sampling_error()로 평균의 표준오차를 구할 수 있습니다.
+        
+        Args:
+            size: 표본 행 수
+            fraction: 표본 비율 (0과 1 사이, size와 함께 쓸 수 없음)
+            stratify: 층화 기준 열 (size 필요)
+            seed: 난수 시드 (같으면 같은 표본)
+            backend: 결과 DataAnalyzer의 숫자 연산 백엔드
+        """
+        if (size is None) == (fraction is None):
+            raise ValueError("표본 행 수(size)와 비율(fraction) 중 하나만 지정하세요")
+        if size is None:
+            _parse_sample(fraction)
+            if stratify is not None:
+                raise ValueError("층화 표본은 표본 행 수(size)를 지정해야 합니다 "
+                                 "(한 번의 스캔으로는 층별 행 수를 미리 알 수 없음)")
+        else:
+            _parse_sample(size)
+        if stratify is not None:
+            self._check_column(stratify)
+        rng = random.Random(seed)
+        
+        if stratify is None:
+            sampler = (_ReservoirSampler(size, rng) if size is not None
+                       else _BernoulliSampler(fraction, rng))
+            for batch in self.iter_batches():
+                sampler.extend(batch)
+            population = sampler.seen
+            if size is not None:
+                rows = [row for _, row in sorted(sampler.items, key=operator.itemgetter(0))]
+            else:
+                rows = sampler.items
+            info = SampleInfo("reservoir" if size is not None else "bernoulli",
+                              population, len(rows), seed=seed)
+        else:
+            position = self.columns.index(stratify)
+            strata: Dict[str, _ReservoirSampler] = {}
+            population = 0
+            for batch in self.iter_batches():
+                groups: Dict[str, Tuple[List[int], List[List[str]]]] = {}
+                for i, row in enumerate(batch, population):
+                    group = groups.get(row[position])
+                    if group is None:
+                        group = groups[row[position]] = ([], [])
+                    group[0].append(i)
+                    group[1].append(row)
+                population += len(batch)
+                for key, (indices, rows) in groups.items():
+                    sampler = strata.get(key)
+                    if sampler is None:
+                        sampler = strata[key] = _ReservoirSampler(size, rng)
+                    sampler.extend(rows, indices)
+            
+            counts = _allocate(size, {key: sampler.seen for key, sampler in strata.items()})
+            items: List[Tuple[int, List[str]]] = []
+            for key, sampler in strata.items():
+                items.extend(rng.sample(sampler.items, counts[key]))
+            rows = [row for _, row in sorted(items, key=operator.itemgetter(0))]
+            info = SampleInfo("stratified", population, len(rows), stratify=stratify,
+                              strata={key: (sampler.seen, counts[key])
+                                      for key, sampler in strata.items()},
+                              seed=seed)
+        
+        table, n_rows = _build_table([rows] if rows else [], self.columns)
+        analyzer = DataAnalyzer._from_table(self, table, n_rows, backend)
+        analyzer.sampling = info
+        return analyzer
+    
+    def histogram(self, column: str, bins: int = 10, jobs: int = 1,
+                  approx: bool = False) -> StreamingHistogram:
+        """
+        열의 히스토그램을 청크 단위로 계산합니다 (고정 메모리).
+        
+        기본은 첫 스캔으로 범위를 구한 뒤 두 번째 스캔에서 고정 구간에 세므로
+        DataAnalyzer.histogram()과 결과가 같습니다. approx=True면 한 번의
+        스캔으로 적응형 히스토그램을 만듭니다 (StreamingHistogram 참고).
+        jobs가 2 이상이면 청크를 작업 프로세스에서 센 뒤 순서대로 합칩니다.
+        """
+        self._check_column(column)
+        jobs = _resolve_jobs(jobs)
+        executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        
+        def scan(fn, *args) -> Iterator:
+            if executor is not None:
+                return _bounded_map(executor, fn, self.iter_batches(), jobs * 2, *args)
+            return (fn(batch, *args) for batch in self.iter_batches())
         
-        values = [row.get(column, "") for row in self.data]
-        return Counter(values).most_common()
+        try:
+            low = high = None
+            if not approx:
+                ranges = [r for r in scan(_range_batch, self.columns, column) if r is not None]
+                if not ranges:
+                    return StreamingHistogram(bins)
+                low, high = min(r[0] for r in ranges), max(r[1] for r in ranges)
+            
+            hist = StreamingHistogram(bins, low, high)
+            for partial in scan(_histogram_batch, self.columns, column, bins, low, high):
+                hist.merge(partial)
+            return hist
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    
+    def to_csv(self, filepath: str, rows: Optional[Iterable[Dict]] = None,
+               columns: Optional[List[str]] = None) -> None:
+        """
+        행(기본값: 전체 데이터)을 하나씩 CSV 파일로 저장합니다.
+        
+        Args:
+            columns: rows의 열 이름 (기본값: 데이터셋의 열, 조인 결과 등에 사용)
+        """
+        self.export(filepath, rows, columns, format="csv")
+    
+    def export(self, filepath: str, rows: Optional[Iterable[Dict]] = None,
+               columns: Optional[List[str]] = None, format: Optional[str] = None) -> int:
+        """
+        행(기본값: 전체 데이터)을 하나씩 CSV, JSON Lines 또는 컬럼 형식 파일로
+        저장하고 저장한 행 수를 반환합니다. 인자는 DataAnalyzer.export()와 같습니다.
+        """
+        if rows is not None:
+            return write_rows(filepath, rows, columns or self.columns, format)
+        return _export(filepath, self.columns, chain.from_iterable(self.iter_batches()), format)
 
 
-def create_histogram(values: List[float], bins: int = 10, width: int = 50) -> str:
-    """간단한 텍스트 히스토그램을 생성합니다."""
-    if not values:
+def create_histogram(values: List[float], bins: int = 10, width: int = 50,
+                     backend: Optional[str] = None) -> str:
+    """간단한 텍스트 히스토그램을 생성합니다 (backend는 DataAnalyzer와 같음)."""
+    value_range = _value_range(values)
+    if value_range is None:
         return "데이터가 없습니다."
     
-    min_val = min(values)
-    max_val = max(values)
-    
-    if min_val == max_val:
-        return f"모든 값이 동일: {min_val}"
-    
-    bin_width = (max_val - min_val) / bins
-    bin_counts = [0] * bins
+    hist = StreamingHistogram(bins, *value_range, backend=backend)
+    hist.update(values)
+    return hist.render(width)
+
+
+def benchmark_backends(filepath: str, encoding: str = "utf-8",
+                       repeat: int = 3) -> List[Tuple[str, float, float]]:
+    """
+    python/numpy 백엔드의 주요 숫자 연산 시간을 비교합니다.
     
-    for v in values:
-        idx = min(int((v - min_val) / bin_width), bins - 1)
-        bin_counts[idx] += 1
+    Args:
+        filepath: CSV 파일 경로 (숫자형 열이 하나 이상 필요)
+        encoding: 파일 인코딩
+        repeat: 작업별 반복 횟수 (가장 빠른 시간을 사용)
     
-    max_count = max(bin_counts) if bin_counts else 1
+    Returns:
+        (작업 이름, python 초, numpy 초) 목록
+    """
+    _resolve_backend("numpy")
+    analyzers = {backend: DataAnalyzer(filepath, encoding=encoding, backend=backend)
+                 for backend in BACKENDS}
+    reference = analyzers["python"]
+    numeric = [name for name in dict.fromkeys(reference.columns)
+               if reference._columns[name].dtype == "numeric"]
+    if not numeric:
+        raise ValueError("숫자형 열이 없습니다")
+    column = numeric[0]
+    threshold = reference.get_column_stats(column).median
     
-    lines = []
-    for i, count in enumerate(bin_counts):
-        start = min_val + i * bin_width
-        end = start + bin_width
-        bar_len = int(count / max_count * width)
-        bar = "█" * bar_len
-        lines.append(f"{start:10.2f} - {end:10.2f} | {bar} ({count})")
+    tasks = [
+        ("get_summary", lambda a: a.get_summary()),
+        (f"filter {column} gt {threshold:g}", lambda a: a._filter_indices(column, "gt", threshold)),
+        (f"correlation_matrix ({len(numeric)}열)", lambda a: a.correlation_matrix(numeric)),
+        (f"histogram {column}",
+         lambda a: create_histogram(a.get_numeric_values(column), backend=a.backend)),
+    ]
     
-    return "\n".join(lines)
+    results = []
+    for name, task in tasks:
+        timings = {}
+        for backend, analyzer in analyzers.items():
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                task(analyzer)
+                best = min(best, time.perf_counter() - start)
+            timings[backend] = best
+        results.append((name, timings["python"], timings["numpy"]))
+    return results
 
 
 def print_table(rows: List[Dict[str, Any]], columns: List[str], max_col_width: int = 20) -> None:
@@ -453,6 +3003,81 @@ def print_table(rows: List[Dict[str, Any]], columns: List[str], max_col_width: i
         print(" | ".join(values))
 
 
+def render_wide_table(header: List[str], rows: List[List[str]], width: Optional[int] = None,
+                      max_col_width: int = 20) -> str:
+    """
+    열이 많은 표를 터미널 너비에 맞는 여러 패널로 나누어 문자열로 만듭니다.
+    
+    첫 열(행 이름)은 패널마다 반복하고 나머지 열은 오른쪽 정렬합니다. 열
+    너비는 한 번만 계산하고 줄을 모아 한 번에 합치므로 셀이 수천 개여도
+    print_table()처럼 셀마다 출력하지 않습니다.
+    
+    Args:
+        header: 열 이름 목록
+        rows: 셀 문자열 목록의 목록 (header와 같은 길이)
+        width: 최대 줄 너비 (기본값: 터미널 너비)
+        max_col_width: 셀을 자를 최대 너비
+    """
+    if not rows:
+        return "데이터가 없습니다."
+    width = width or shutil.get_terminal_size().columns
+    widths = [min(max(map(len, column)), max_col_width) for column in zip(header, *rows)]
+    
+    # 첫 열 + 이어지는 열들이 너비를 넘지 않도록 패널을 나눕니다 (패널당 최소 한 열).
+    panels = []
+    start, used = 1, widths[0]
+    for i in range(1, len(header)):
+        if i > start and used + 3 + widths[i] > width:
+            panels.append((start, i))
+            start, used = i, widths[0]
+        used += 3 + widths[i]
+    panels.append((start, len(header)))
+    
+    blocks = []
+    for start, stop in panels:
+        spans = [(0, widths[0], str.ljust)] + [(i, widths[i], str.rjust) for i in range(start, stop)]
+        
+        def line(cells: List[str]) -> str:
+            return " | ".join(align(cells[i][:w], w) for i, w, align in spans)
+        
+        lines = [line(header), "-+-".join("-" * w for _, w, _ in spans)]
+        lines.extend(map(line, rows))
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+def _cli_usecols(args: argparse.Namespace) -> Optional[List[str]]:
+    """
+    CLI 작업에 필요한 열 목록을 반환합니다. 전체 열이 필요하면 None.
+
+    main()의 작업 분기 순서를 그대로 따릅니다.
+    """
+    if args.describe or args.head or args.tail:
+        return None
+    if args.column:
+        return [args.column]
+    if args.filter or args.sort or args.top or args.bottom or args.join:
+        return None
+    aggs = [spec.partition(":")[0] for spec in args.agg or []]
+    if args.group:
+        return [key.strip() for key in args.group.split(",")] + aggs
+    if args.pivot:
+        return args.pivot + ([args.values] if args.values else [])
+    if args.rolling or args.cumulative:
+        return None
+    if args.bucket:
+        return [args.time] + aggs if args.time else None
+    if args.hist:
+        return [args.hist]
+    if args.corr_matrix is not None:
+        return args.corr_matrix or None
+    if args.corr:
+        return list(args.corr)
+    if args.value_counts:
+        return [args.value_counts]
+    return None
+
+
 def main():
     """메인 CLI 함수"""
     parser = argparse.ArgumentParser(
@@ -465,13 +3090,33 @@ def main():
   python data_analyzer.py data.csv --head 10          # 처음 10행
   python data_analyzer.py data.csv --column age       # 특정 열 통계
   python data_analyzer.py data.csv --filter "age gt 30"  # 필터링
+  python data_analyzer.py data.csv --filter "age between 20 and 40 AND city in (Seoul, Busan)"
   python data_analyzer.py data.csv --group city       # 그룹화
+  python data_analyzer.py data.csv --group city,gender --agg salary:mean,p95 age:max
+  python data_analyzer.py data.csv --sort revenue:desc,name  # 정렬
+  python data_analyzer.py data.csv --top revenue 10   # 상위 10개 행
+  python data_analyzer.py sales.csv --join stores.csv --on store_id --how left  # 조인
+  python data_analyzer.py metrics.csv --rolling latency:mean 20  # 20행 이동 평균
+  python data_analyzer.py metrics.csv --rolling latency:max 1h --time ts  # 1시간 이동 최댓값
+  python data_analyzer.py metrics.csv --time ts --bucket 1h --agg latency:mean,p95  # 시간별 집계
   python data_analyzer.py data.csv --hist age         # 히스토그램
+  python data_analyzer.py big.csv --chunksize 100000 --hist age --approx  # 한 번의 스캔으로 근사 히스토그램
   python data_analyzer.py data.csv --corr age salary  # 상관계수
+  python data_analyzer.py data.csv --corr-matrix      # 상관계수 행렬
+  python data_analyzer.py big.csv --chunksize 100000 --describe  # 스트리밍 모드
+  python data_analyzer.py data.csv --describe --jobs 8  # 8개 프로세스로 병렬 통계
+  python data_analyzer.py "sales_2026-*.csv" --describe -j 0  # 여러 파일을 병렬로 읽어 분석
+  python data_analyzer.py data.csv --cache            # 바이너리 캐시로 빠른 재로딩
+  python data_analyzer.py app.log.csv --incremental   # 지난번 이후 추가된 행만 읽어 요약 갱신
+  python data_analyzer.py archive.csv.zst --describe  # 압축 파일을 풀지 않고 바로 분석
+  python data_analyzer.py data.csv --benchmark        # python/numpy 백엔드 속도 비교
+  python data_analyzer.py big.csv --chunksize 100000 --describe --approx  # 근사 통계
+  python data_analyzer.py big.csv --sample 1% --describe  # 1% 무작위 표본으로 분석 (표본 오차 표시)
+  python data_analyzer.py big.csv --sample 10000 --stratify region --group region --agg revenue:mean
         """
     )
     
-    parser.add_argument("file", help="CSV 파일 경로")
+    parser.add_argument("file", help="CSV 파일 경로 (gzip/bz2/xz/zstd 압축 가능, 디렉터리나 glob 패턴이면 여러 파일을 하나로 분석)")
     parser.add_argument("--describe", "-d", action="store_true",
                         help="상세 통계 출력")
     parser.add_argument("--head", type=int, metavar="N",
@@ -481,35 +3126,190 @@ def main():
     parser.add_argument("--column", "-c", type=str,
                         help="특정 열의 통계")
     parser.add_argument("--filter", "-f", type=str,
-                        help="필터링 (예: 'column gt 100')")
+                        help="필터 식 (예: 'price gt 100 AND NOT city eq Seoul')")
     parser.add_argument("--group", "-g", type=str,
                         help="그룹화 기준 열")
-    parser.add_argument("--agg", type=str,
-                        help="그룹화 시 집계할 열")
+    parser.add_argument("--agg", type=str, nargs="+", metavar="COLUMN[:AGG,...]",
+                        help="그룹화 시 집계할 열 (예: salary 또는 salary:sum,mean,p95)")
+    parser.add_argument("--pivot", nargs=2, metavar=("INDEX", "COLUMNS"),
+                        help="피벗 테이블: 행 키 열과 열 키 열 (--values, --aggfunc와 함께)")
+    parser.add_argument("--values", type=str, metavar="COLUMN",
+                        help="피벗 테이블에서 집계할 열 (생략하면 행 수)")
+    parser.add_argument("--aggfunc", type=str, default="sum", metavar="AGG",
+                        help="피벗 테이블 집계 (기본값: sum; mean, max, median, p95 등)")
+    parser.add_argument("--partitions", type=int, metavar="N",
+                        help="스트리밍 그룹화·조인: 키를 N개로 해시 분할해 임시 파일로 처리")
+    parser.add_argument("--sort", type=str, metavar="COLUMNS",
+                        help="정렬 기준 열 (쉼표로 구분, 예: revenue:desc,name)")
+    parser.add_argument("--top", nargs=2, metavar=("COLUMN", "K"),
+                        help="숫자 값이 가장 큰 K개 행 (전체 정렬 없이 힙으로 선택)")
+    parser.add_argument("--bottom", nargs=2, metavar=("COLUMN", "K"),
+                        help="숫자 값이 가장 작은 K개 행")
+    parser.add_argument("--join", type=str, metavar="FILE",
+                        help="다른 CSV 파일과 해시 조인 (--on 필요)")
+    parser.add_argument("--on", type=str, metavar="COLUMNS",
+                        help="조인 키 열 (쉼표로 구분)")
+    parser.add_argument("--how", choices=JOIN_TYPES, default="inner",
+                        help="조인 방식 (기본값: inner)")
+    parser.add_argument("--rolling", nargs=2, metavar=("COLUMN[:AGG]", "WINDOW"),
+                        help="이동 창 집계 (집계: mean, sum, min, max, count; "
+                             "창: 행 수 또는 30s/15min/1h/7d 같은 시간 폭, 시간 폭이면 --time 필요)")
+    parser.add_argument("--cumulative", type=str, metavar="COLUMN[:AGG]",
+                        help="누적 집계 (기본값: 누적 합계)")
+    parser.add_argument("--time", type=str, metavar="COLUMN",
+                        help="날짜/시각 열 (--rolling 시간 폭 창, --bucket에 사용)")
+    parser.add_argument("--bucket", type=str, metavar="FREQ",
+                        help="시간 구간별 집계 (--time, --agg와 함께; 예: 15min, 1h, 1d, 1w, 1m)")
     parser.add_argument("--hist", type=str, metavar="COLUMN",
                         help="히스토그램 출력")
     parser.add_argument("--corr", nargs=2, metavar=("COL1", "COL2"),
                         help="두 열의 상관계수")
+    parser.add_argument("--corr-matrix", nargs="*", metavar="COLUMN",
+                        help="상관계수 행렬 (열을 생략하면 모든 숫자형 열)")
     parser.add_argument("--value-counts", "-v", type=str, metavar="COLUMN",
                         help="값 빈도 출력")
     parser.add_argument("--output", "-o", type=str,
-                        help="결과 저장 파일")
+                        help="결과 저장 파일 (.jsonl/.ndjson은 JSON Lines, .dacol은 컬럼 형식, 그 밖에는 CSV)")
+    parser.add_argument("--output-format", choices=EXPORT_FORMATS,
+                        help="결과 저장 형식 (기본값: --output 확장자로 판단)")
     parser.add_argument("--encoding", "-e", type=str, default="utf-8",
                         help="파일 인코딩 (기본값: utf-8)")
+    parser.add_argument("--chunksize", type=int, metavar="N",
+                        help="스트리밍 모드: N행씩 나누어 읽어 메모리 사용량 제한")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="통계 계산·여러 파일 로딩 작업 프로세스 수 (기본값: 1, 0: CPU 코어 수)")
+    parser.add_argument("--sample", type=str, metavar="N|FRACTION",
+                        help="파일을 한 번 스트리밍하며 N행(저수지) 또는 비율(0.01, 1%%)만큼 "
+                             "무작위 표본을 뽑아 모든 분석을 표본으로 수행")
+    parser.add_argument("--stratify", type=str, metavar="COLUMN",
+                        help="--sample N과 함께: 열 값별 층화 표본 (층 비율 유지)")
+    parser.add_argument("--seed", type=int,
+                        help="--sample 난수 시드")
+    parser.add_argument("--approx", type=float, nargs="?", const=0.01, metavar="ERROR",
+                        help="근사 모드: 중앙값/고유값 수를 스케치로 추정 (오차 한도, 기본값: 0.01)")
+    parser.add_argument("--backend", choices=BACKENDS,
+                        help="숫자 연산 백엔드 (기본값: NumPy가 있으면 numpy)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="python/numpy 백엔드 속도 비교")
+    parser.add_argument("--cache", action="store_true",
+                        help=f"파싱 결과를 바이너리 캐시({CACHE_SUFFIX})로 저장/재사용")
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"요약/--describe를 체크포인트({CHECKPOINT_SUFFIX})로 증분 갱신 "
+                             "(추가된 행만 읽음, 스트리밍 모드)")
     
     args = parser.parse_args()
+    if args.incremental:
+        if args.sample:
+            parser.error("--incremental은 --sample과 함께 사용할 수 없습니다")
+        args.chunksize = args.chunksize or 100000
     
+    analyzer = None
     try:
-        analyzer = DataAnalyzer(args.file, encoding=args.encoding)
+        if args.benchmark:
+            print(f"\n⏱️  백엔드 벤치마크: {args.file}")
+            print("-" * 70)
+            print(f"{'작업':30} {'python':>10} {'numpy':>10} {'속도 향상':>10}")
+            for name, python_time, numpy_time in benchmark_backends(args.file, args.encoding):
+                speedup = python_time / numpy_time if numpy_time else float("inf")
+                print(f"{name[:30]:30} {python_time:>9.3f}s {numpy_time:>9.3f}s {speedup:>9.1f}x")
+            return
+        
+        if args.sample:
+            size, fraction = _parse_sample(args.sample)
+            source = StreamingDataAnalyzer(args.file, encoding=args.encoding,
+                                           chunksize=args.chunksize or 100000)
+            analyzer = source.sample(size, fraction, stratify=args.stratify,
+                                     seed=args.seed, backend=args.backend)
+        else:
+            # 메모리 모드에서는 필요한 열과 필터를 만족하는 행만 읽습니다.
+            # --filter는 필터 작업이 실제로 실행될 때만 로딩에 적용합니다 (_cli_usecols()와 같은 순서).
+            pushdown = {}
+            if not args.chunksize and not args.cache:
+                usecols = _cli_usecols(args)
+                if usecols is not None:
+                    # 헤더에 없는 열은 로딩 단계에서 빼고, 오류 여부는 작업이 정합니다
+                    # (예: 예전 형식 --group의 없는 --agg 열은 무시).
+                    header = set(chain.from_iterable(
+                        _read_header(path, args.encoding)[2] for path in _expand_paths(args.file)))
+                    usecols = [name for name in usecols if name in header]
+                pushdown["usecols"] = usecols
+                if (args.filter and len(args.filter.split()) >= 3
+                        and not (args.describe or args.head or args.tail or args.column)):
+                    pushdown["where"] = args.filter
+            analyzer = DataAnalyzer.open(args.file, encoding=args.encoding,
+                                         chunksize=args.chunksize, cache=args.cache,
+                                         backend=args.backend, jobs=args.jobs, **pushdown)
+        streaming = isinstance(analyzer, StreamingDataAnalyzer)
+        sampling = None if streaming else analyzer.sampling
         
         print(f"\n📂 파일: {args.file}")
-        print(f"📋 행: {len(analyzer.data):,} | 열: {len(analyzer.columns)}")
-        print(f"📑 열 목록: {', '.join(analyzer.columns)}")
+        if len(analyzer.files) > 1:
+            print(f"🗂️  파일 {len(analyzer.files)}개를 하나의 데이터셋으로 분석합니다")
+        file_columns = analyzer.columns if streaming else analyzer.file_columns
+        if streaming:
+            print(f"📋 스트리밍 모드 ({args.chunksize:,}행 단위) | 열: {len(file_columns)}")
+        elif analyzer.where:
+            print(f"📋 필터에 맞는 행: {len(analyzer.data):,} / 전체 {analyzer.file_rows:,} "
+                  f"| 열: {len(file_columns)}")
+        else:
+            print(f"📋 행: {len(analyzer.data):,} | 열: {len(file_columns)}")
+        print(f"📑 열 목록: {', '.join(file_columns)}")
+        if analyzer.columns != file_columns:
+            print(f"📐 읽은 열: {', '.join(analyzer.columns)}")
+        if sampling:
+            print(f"🎲 {sampling} — 아래 결과는 표본 기준입니다")
         print()
         
+        def describe() -> str:
+            if args.incremental:
+                return analyzer.describe(jobs=args.jobs, approx=args.approx, incremental=True)
+            return analyzer.describe(jobs=args.jobs, approx=args.approx)
+        
+        def consume(rows: Iterable[Dict[str, Any]], columns: Optional[List[str]] = None
+                    ) -> Tuple[int, List[Dict[str, Any]]]:
+            """결과 행을 세면서 앞의 20개를 모으고, --output이 있으면 바로 저장합니다."""
+            # 스트리밍 모드에서는 결과를 모으지 않고 세면서 바로 저장합니다.
+            preview: List[Dict[str, Any]] = []
+            matched = 0
+            
+            def track(rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+                nonlocal matched
+                for row in rows:
+                    matched += 1
+                    if len(preview) < 20:
+                        preview.append(row)
+                    yield row
+            
+            if args.output:
+                analyzer.export(args.output, track(rows), columns, args.output_format)
+            else:
+                for _ in track(rows):
+                    pass
+            return matched, preview
+        
+        def parse_aggs(specs: List[str]) -> Dict[str, List[str]]:
+            """--agg의 "열" 또는 "열:집계,..." 목록을 {열: [집계, ...]}로 변환합니다."""
+            aggs = {}
+            for spec in specs:
+                name, _, names = spec.partition(":")
+                aggs[name] = names.split(",") if names else list(_LEGACY_AGGS[1:])
+            return aggs
+        
+        def agg_cells(out: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+            """{열: {집계: 값}} 결과를 "열.집계" 표 셀로 변환합니다."""
+            cells = {}
+            for name, values in out.items():
+                for agg, value in values.items():
+                    if isinstance(value, float):
+                        value = f"{value:,.2f}"
+                    elif isinstance(value, int):
+                        value = f"{value:,}"
+                    cells[f"{name}.{agg}"] = "" if value is None else value
+            return cells
+        
         # 상세 통계
         if args.describe:
-            print(analyzer.describe())
+            print(describe())
             return
         
         # 처음/마지막 N행
@@ -525,14 +3325,14 @@ def main():
         
         # 특정 열 통계
         if args.column:
-            stats = analyzer.get_column_stats(args.column)
+            stats = analyzer.get_column_stats(args.column, approx=args.approx)
             
             print(f"📊 열 '{stats.name}' 통계:")
             print("-" * 40)
             print(f"  타입: {stats.dtype}")
             print(f"  유효값: {stats.count - stats.missing:,}")
             print(f"  결측값: {stats.missing:,}")
-            print(f"  고유값: {stats.unique:,}")
+            print(f"  고유값: {stats.unique:,}{' (근사)' if stats.approximate else ''}")
             
             if stats.dtype == "numeric":
                 print(f"  최솟값: {stats.min_val:,.2f}")
@@ -541,6 +3341,13 @@ def main():
                 print(f"  중앙값: {stats.median:,.2f}")
                 print(f"  표준편차: {stats.std_dev:,.2f}")
                 print(f"  합계: {stats.sum_val:,.2f}")
+                error = analyzer.sampling_error(args.column) if sampling else None
+                if error is not None:
+                    print(f"  평균의 95% 오차 한계: ±{_Z95 * error:,.2f} (표본 오차)")
+                if stats.invalid:
+                    print(f"  ⚠️  숫자로 해석하지 못한 값: {stats.invalid:,}개 (통계에서 제외)")
+                    for row, text in stats.invalid_examples:
+                        print(f"    - {row + 1}행: {text!r}")
             else:
                 print("  상위 값:")
                 for val, count in stats.top_values:
@@ -549,31 +3356,123 @@ def main():
         
         # 필터링
         if args.filter:
-            parts = args.filter.split()
-            if len(parts) < 3:
-                print("❌ 필터 형식: 'column condition value'")
-                print("   조건: eq, ne, gt, lt, ge, le, contains")
+            if len(args.filter.split()) < 3:
+                print("❌ 필터 형식: 'column condition value [AND|OR ...]'")
+                print(f"   조건: {', '.join(FILTER_CONDITIONS)}")
+                return
+            
+            if not streaming and analyzer.where:
+                matched, preview = consume(iter(analyzer.data))
+            else:
+                matched, preview = consume(analyzer.query(args.filter) if streaming
+                                           else analyzer.iter_query(args.filter))
+            
+            print(f"🔍 필터 결과: {matched:,}개 행")
+            if sampling and sampling.size:
+                share = matched / sampling.size
+                error = sampling.proportion_error(share) or 0.0
+                print(f"   원본 추정: {share * sampling.population:,.0f}행 "
+                      f"(±{_Z95 * error * sampling.population:,.0f}, 95%)")
+            print_table(preview, analyzer.columns)
+            
+            if args.output:
+                print(f"\n✅ 저장됨: {args.output}")
+            return
+        
+        # 정렬
+        if args.sort:
+            names, flags = [], []
+            for spec in args.sort.split(","):
+                name, _, order = spec.strip().partition(":")
+                if order.lower() not in ("", "asc", "desc"):
+                    raise ValueError(f"정렬 방향은 asc 또는 desc입니다: {spec}")
+                names.append(name)
+                flags.append(order.lower() == "desc")
+            
+            if args.output:
+                rows = analyzer.sort_by(names, flags)
+                analyzer.export(args.output, rows, format=args.output_format)
+                print(f"✅ 정렬 결과 저장됨: {args.output}")
                 return
             
-            col, cond, val = parts[0], parts[1], " ".join(parts[2:])
-            filtered = analyzer.filter(col, cond, val)
+            print(f"🔃 '{args.sort}' 기준 정렬 (처음 20개 행):")
+            print_table(list(analyzer.sort_by(names, flags, limit=20)), analyzer.columns)
+            return
+        
+        # 상위/하위 K개 행
+        if args.top or args.bottom:
+            column, k = args.top or args.bottom
+            rows = analyzer.top_k(column, int(k), largest=bool(args.top))
+            label = "상위" if args.top else "하위"
+            print(f"🏆 '{column}' {label} {int(k):,}개 행:")
+            print_table(rows, analyzer.columns)
+            if args.output:
+                analyzer.export(args.output, rows, format=args.output_format)
+                print(f"\n✅ 저장됨: {args.output}")
+            return
+        
+        # 조인
+        if args.join:
+            if not args.on:
+                print("❌ 조인 키 열을 --on으로 지정하세요.")
+                return
+            keys = [key.strip() for key in args.on.split(",")]
+            # 스트리밍 모드이거나 --partitions를 주면 양쪽을 분할해 디스크로 내보냅니다.
+            if streaming or args.partitions:
+                other = StreamingDataAnalyzer(args.join, encoding=args.encoding,
+                                              chunksize=args.chunksize or 100000)
+            else:
+                other = DataAnalyzer(args.join, encoding=args.encoding, cache=args.cache,
+                                     backend=args.backend, jobs=args.jobs)
+            options = {"partitions": args.partitions} if args.partitions else {}
+            _, _, out_names = _join_spec(analyzer.columns, other.columns, keys, args.how)
+            columns = list(dict.fromkeys(analyzer.columns)) + out_names
             
-            print(f"🔍 필터 결과: {len(filtered):,}개 행")
-            print_table(filtered[:20], analyzer.columns)
+            matched, preview = consume(analyzer.join(other, on=keys, how=args.how, **options),
+                                       columns)
             
+            print(f"🔗 {args.how} 조인 ({', '.join(keys)}): {matched:,}개 행")
+            print_table(preview, columns)
             if args.output:
-                analyzer.to_csv(args.output, filtered)
                 print(f"\n✅ 저장됨: {args.output}")
             return
         
         # 그룹화
         if args.group:
-            result = analyzer.group_by(args.group, args.agg)
+            keys = [key.strip() for key in args.group.split(",")]
+            specs = args.agg or []
+            if streaming:
+                options = {"partitions": args.partitions} if args.partitions else {}
+            else:
+                options = {"jobs": args.jobs}
+            
+            # 여러 키 또는 "열:집계,..." 지정은 다중 집계 표로 출력합니다.
+            if len(keys) > 1 or len(specs) > 1 or any(":" in spec for spec in specs):
+                aggs = parse_aggs(specs)
+                result = analyzer.group_by(keys=keys, aggs=aggs, **options)
+                
+                print(f"📊 '{', '.join(keys)}' 기준 그룹화 ({len(result):,}개 그룹):")
+                print("-" * 60)
+                headers = keys + [f"{name}.{agg}" for name, names in aggs.items() for agg in names]
+                rows = []
+                for key, out in sorted(result.items(), key=lambda x: str(x[0]))[:20]:
+                    row = dict(zip(keys, key if len(keys) > 1 else (key,)))
+                    if aggs:
+                        row.update(agg_cells(out))
+                    else:
+                        row["count"] = f"{out:,}"
+                    rows.append(row)
+                print_table(rows, headers if aggs else keys + ["count"])
+                return
+            
+            agg_column = specs[0] if specs else None
+            result = analyzer.group_by(args.group, agg_column, **options)
             
             print(f"📊 '{args.group}' 기준 그룹화:")
             print("-" * 60)
             
-            if args.agg:
+            # 없는 집계 열은 group_by()가 무시하고 행 수만 세어 돌려줍니다.
+            if agg_column in analyzer.columns:
                 for key, stats in sorted(result.items(), key=lambda x: x[1].get("count", 0), reverse=True)[:20]:
                     print(f"\n{key}:")
                     for stat_name, stat_val in stats.items():
@@ -586,26 +3485,110 @@ def main():
                     print(f"  {key}: {count:,}")
             return
         
-        # 히스토그램
-        if args.hist:
-            stats = analyzer.get_column_stats(args.hist)
+        # 피벗 테이블
+        if args.pivot:
+            index, columns = args.pivot
+            options = {"partitions": args.partitions} if streaming else {"jobs": args.jobs}
+            table = analyzer.pivot(index, columns, args.values, args.aggfunc, **options)
             
-            if stats.dtype != "numeric":
-                print(f"❌ '{args.hist}' 열은 숫자형이 아닙니다.")
+            label = f"{table.aggfunc}({table.values})" if table.values else "행 수"
+            print(f"📊 피벗: {index} × {columns} → {label} "
+                  f"({len(table.row_keys):,} × {len(table.col_keys):,})")
+            print("-" * 60)
+            print(table.render())
+            if args.output:
+                analyzer.export(args.output, table.rows(), table.header, args.output_format)
+                print(f"\n✅ 저장됨: {args.output}")
+            return
+        
+        # 이동 창 / 누적 집계: 원래 열 뒤에 결과 열을 붙여 출력합니다.
+        if args.rolling or args.cumulative:
+            if args.rolling:
+                spec, window = args.rolling
+                column, _, agg = spec.partition(":")
+                agg = agg.lower() or "mean"
+                results = analyzer.rolling(column, window, agg, on=args.time)
+                name = f"{column}_rolling_{agg}"
+                title = f"📈 '{column}' 이동 {agg} (창: {window})"
+            else:
+                column, _, agg = args.cumulative.partition(":")
+                agg = agg.lower() or "sum"
+                results = analyzer.cumulative(column, agg)
+                name = f"{column}_cum{agg}"
+                title = f"📈 '{column}' 누적 {agg}"
+            
+            # 누적합에 쌓인 반올림 오차 자릿수(12자리 이후)는 잘라서 씁니다.
+            rows = analyzer.iter_rows() if streaming else iter(analyzer.data)
+            columns = list(dict.fromkeys(analyzer.columns)) + [name]
+            matched, preview = consume(
+                ({**row, name: "" if value is None else _format_number(float(f"{value:.12g}"))}
+                 for row, value in zip(rows, results)), columns)
+            
+            print(f"{title}: {matched:,}개 행")
+            print_table(preview, columns)
+            if args.output:
+                print(f"\n✅ 저장됨: {args.output}")
+            return
+        
+        # 시간 구간별 집계
+        if args.bucket:
+            if not args.time:
+                print("❌ 날짜/시각 열을 --time으로 지정하세요.")
                 return
+            aggs = parse_aggs(args.agg or [])
+            result = analyzer.time_buckets(args.time, args.bucket, aggs)
+            
+            headers = [args.time] + ([f"{name}.{agg}" for name, names in aggs.items()
+                                      for agg in names] if aggs else ["count"])
+            rows = []
+            for key, out in result.items():
+                row = {args.time: key}
+                row.update(agg_cells(out) if aggs else {"count": f"{out:,}"})
+                rows.append(row)
             
-            values = []
-            for row in analyzer.data:
-                v = analyzer._to_numeric(row.get(args.hist, ""))
-                if v is not None:
-                    values.append(v)
+            print(f"🕒 '{args.time}' {args.bucket} 구간별 집계 ({len(result):,}개 구간):")
+            print("-" * 60)
+            print_table(rows[:20], headers)
+            if len(rows) > 20:
+                print(f"... 외 {len(rows) - 20:,}개 구간")
+            if args.output:
+                analyzer.export(args.output, rows, headers, args.output_format)
+                print(f"\n✅ 저장됨: {args.output}")
+            return
+        
+        # 히스토그램
+        if args.hist:
+            if streaming:
+                hist = analyzer.histogram(args.hist, jobs=args.jobs, approx=args.approx is not None)
+            else:
+                if analyzer.get_column_stats(args.hist).dtype != "numeric":
+                    print(f"❌ '{args.hist}' 열은 숫자형이 아닙니다.")
+                    return
+                hist = analyzer.histogram(args.hist, jobs=args.jobs)
             
-            print(f"📊 '{args.hist}' 히스토그램:")
+            print(f"📊 '{args.hist}' 히스토그램{' (근사)' if hist.approximate else ''}:")
             print("-" * 70)
-            print(create_histogram(values))
+            print(hist.render())
             return
         
         # 상관계수
+        if args.corr_matrix is not None:
+            matrix = analyzer.correlation_matrix(args.corr_matrix or None)
+            names = list(matrix)
+            if not names:
+                print("❌ 숫자형 열이 없습니다.")
+                return
+            
+            print(f"📈 상관계수 행렬 ({len(names)}개 열):")
+            rows = []
+            for name in names:
+                row = {"": name}
+                for other, value in matrix[name].items():
+                    row[other] = f"{value:.4f}" if value is not None else "-"
+                rows.append(row)
+            print_table(rows, [""] + names)
+            return
+        
         if args.corr:
             col1, col2 = args.corr
             corr = analyzer.correlation(col1, col2)
@@ -632,23 +3615,33 @@ def main():
             
             print(f"📊 '{args.value_counts}' 값 빈도:")
             print("-" * 40)
+            total = sum(count for _, count in counts)
             for val, count in counts[:20]:
-                pct = count / len(analyzer.data) * 100
+                pct = count / total * 100
                 bar = "█" * int(pct / 2)
-                print(f"  {val[:20]:20} {count:>6} ({pct:5.1f}%) {bar}")
+                margin = ""
+                if sampling:
+                    error = sampling.proportion_error(count / total) or 0.0
+                    margin = f" ±{_Z95 * error * 100:4.1f}%p"
+                print(f"  {val[:20]:20} {count:>6} ({pct:5.1f}%{margin}) {bar}")
+            if sampling:
+                print("  (±: 비율의 95% 표본 오차 한계)")
             return
         
         # 기본: 요약 정보
-        print(analyzer.describe())
-        
+        print(describe())
+    
     except FileNotFoundError:
         print(f"❌ 파일을 찾을 수 없습니다: {args.file}")
     except ValueError as e:
         print(f"❌ 오류: {e}")
     except Exception as e:
         print(f"❌ 예상치 못한 오류: {e}")
+    finally:
+        # 스트리밍 모드는 파일을 끝까지 읽은 뒤에야 전체 행 수를 알 수 있습니다.
+        if isinstance(analyzer, StreamingDataAnalyzer) and analyzer.n_rows is not None:
+            print(f"\n📋 전체 행: {analyzer.n_rows:,}")
 
 
 if __name__ == "__main__":
     main()
-
@@ -60,6 +60,25 @@ class DateUtils:
         (12, 25): "크리스마스",
     }
     
+    # parse_date()가 시도하는 형식 (앞에서부터 순서대로)
+    PARSE_FORMATS = (
+        "%Y-%m-%d",
+        "%Y/%m/%d",
+        "%Y%m%d",
+        "%Y.%m.%d",
+        "%d-%m-%Y",
+        "%d/%m/%Y",
+        "%m/%d/%Y",
+        "%b %d, %Y",
+        "%B %d, %Y",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%dT%H:%M:%S",
+        "%Y-%m-%d %H:%M",
+        "%Y-%m-%dT%H:%M",
+        "%Y-%m-%d %H:%M:%S.%f",
+        "%Y-%m-%dT%H:%M:%S.%f",
+    )
+    
     @staticmethod
     def parse_date(date_string: str) -> Optional[datetime]:
         """
@@ -72,22 +91,9 @@ class DateUtils:
         - 2024.01.15
         - 15-01-2024
         - Jan 15, 2024
+        - 2024-01-15 09:30[:00[.123]] (T 구분자 가능)
         """
-        formats = [
-            "%Y-%m-%d",
-            "%Y/%m/%d",
-            "%Y%m%d",
-            "%Y.%m.%d",
-            "%d-%m-%Y",
-            "%d/%m/%Y",
-            "%m/%d/%Y",
-            "%b %d, %Y",
-            "%B %d, %Y",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S",
-        ]
-        
-        for fmt in formats:
+        for fmt in DateUtils.PARSE_FORMATS:
             try:
                 return datetime.strptime(date_string, fmt)
             except ValueError:
@@ -95,6 +101,23 @@ class DateUtils:
         
         return None
     
+    @staticmethod
+    def detect_format(date_string: str) -> Optional[str]:
+        """
+        parse_date()가 인식하는 형식 중 date_string에 맞는 첫 형식을 반환합니다.
+        
+        같은 형식의 값을 많이 파싱할 때 형식을 한 번만 찾고 나머지는
+        datetime.strptime()으로 바로 파싱하는 데 사용합니다.
+        """
+        for fmt in DateUtils.PARSE_FORMATS:
+            try:
+                datetime.strptime(date_string, fmt)
+                return fmt
+            except ValueError:
+                continue
+        
+        return None
+    
     @staticmethod
     def format_date(dt: datetime, format_type: DateFormat = DateFormat.ISO) -> str:
         """날짜를 지정된 형식으로 포맷합니다."""
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+export_utils.py - 결과 내보내기
+
+data_analyzer.py의 결과 행을 하나씩 받아 CSV, JSON Lines, 컬럼 형식(.dacol)으로
+일정한 메모리로 저장하고, .dacol 파일을 다시 읽습니다.
+"""
+
+import csv
+import sys
+import json
+import struct
+from array import array
+from itertools import islice
+from typing import (List, Dict, Any, Optional, Tuple, Union, Iterable, Iterator, Sequence,
+                    BinaryIO)
+from pathlib import Path
+
+
+# 결과 내보내기 (행을 하나씩 받아 일정한 메모리로 저장)
+EXPORT_FORMATS = ("csv", "jsonl", "columnar")
+COLUMNAR_SUFFIX = ".dacol"
+_COLUMNAR_MAGIC = b"DACOL001"
+_COLUMNAR_VERSION = 1
+_EXPORT_BUFFER_SIZE = 1 << 20  # 파일 쓰기 버퍼 (바이트)
+_EXPORT_BATCH_SIZE = 65536  # 한 번에 모아 쓰는 행 수 (컬럼 형식에서는 행 그룹 크기)
+
+
+def _export_format(filepath: Union[str, Path], format: Optional[str]) -> str:
+    """저장 형식을 반환합니다. 지정하지 않으면 확장자로 정합니다 (기본값: csv)."""
+    if format is None:
+        suffix = Path(filepath).suffix.lower()
+        if suffix in (".jsonl", ".ndjson"):
+            return "jsonl"
+        return "columnar" if suffix == COLUMNAR_SUFFIX else "csv"
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 저장 형식입니다: {format} "
+                         f"(사용 가능: {', '.join(EXPORT_FORMATS)})")
+    return format
+
+
+def _write_block(f: BinaryIO, meta: Dict[str, Any], segments: Sequence[array] = ()) -> None:
+    """길이(8) + JSON 메타 + 8바이트 정렬된 데이터 구간들을 씁니다."""
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    meta_bytes += b" " * (-len(meta_bytes) % 8)
+    f.write(struct.pack("<Q", len(meta_bytes)))
+    f.write(meta_bytes)
+    for segment in segments:
+        f.write(segment)
+        padding = -len(segment) * segment.itemsize % 8
+        if padding:
+            f.write(b"\0" * padding)
+
+
+def _read_block(f: BinaryIO) -> Optional[Dict[str, Any]]:
+    """_write_block()이 쓴 메타를 읽습니다. 끝 표시(길이 0)면 None."""
+    (meta_len,) = struct.unpack("<Q", f.read(8))
+    return json.loads(f.read(meta_len).decode("utf-8")) if meta_len else None
+
+
+def _encode_chunk(values: Sequence[Any]) -> Tuple[Dict[str, Any], array]:
+    """
+    행 그룹의 한 열을 (메타, 배열)로 인코딩합니다.
+
+    모두 정수면 int64, 정수·실수면 float64 배열로, 그 밖에는 사전 코드로
+    저장합니다. 문자열이 아닌 값은 str()로 바꾸고 None은 그대로 보존합니다.
+    """
+    kinds = set(map(type, values))
+    if kinds <= {int, float}:
+        try:
+            if kinds == {int}:
+                return {"dtype": "int"}, array("q", values)
+            return {"dtype": "float"}, array("d", values)
+        except OverflowError:
+            pass
+    lookup: Dict[Optional[str], int] = {}
+    codes = [lookup.setdefault(value if value is None or isinstance(value, str) else str(value),
+                               len(lookup))
+             for value in values]
+    typecode = "B" if len(lookup) <= 1 << 8 else "H" if len(lookup) <= 1 << 16 else "i"
+    return {"dtype": "string", "dictionary": list(lookup)}, array(typecode, codes)
+
+
+def _write_columnar(f: BinaryIO, header: List[str], batches: Iterator[List[Sequence[Any]]]) -> int:
+    """
+    행 묶음을 컬럼 형식으로 씁니다.
+
+    형식: MAGIC(8) + 파일 블록({version, byteorder, columns}) + 행 그룹 블록들
+    + 끝 표시(길이 0). 행 그룹마다 열별 배열을 원시 바이트로 저장하므로
+    메모리는 행 그룹 하나 크기만 사용합니다.
+    """
+    f.write(_COLUMNAR_MAGIC)
+    _write_block(f, {"version": _COLUMNAR_VERSION, "byteorder": sys.byteorder, "columns": header})
+    count = 0
+    for batch in batches:
+        chunks, segments = [], []
+        for values in zip(*batch):
+            meta, segment = _encode_chunk(values)
+            meta["typecode"] = segment.typecode
+            chunks.append(meta)
+            segments.append(segment)
+        _write_block(f, {"n_rows": len(batch), "chunks": chunks}, segments)
+        count += len(batch)
+    f.write(struct.pack("<Q", 0))
+    return count
+
+
+def read_columnar(filepath: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    컬럼 형식(.dacol) 파일의 행을 dict로 차례로 반환합니다.
+
+    행 그룹 단위로 읽으므로 파일 크기와 무관하게 메모리 사용량이 일정합니다.
+    """
+    with open(filepath, "rb", buffering=_EXPORT_BUFFER_SIZE) as f:
+        if f.read(len(_COLUMNAR_MAGIC)) != _COLUMNAR_MAGIC:
+            raise ValueError(f"컬럼 형식 파일이 아닙니다: {filepath}")
+        header = _read_block(f)
+        if header.get("version") != _COLUMNAR_VERSION:
+            raise ValueError(f"지원하지 않는 컬럼 형식 버전입니다: {header.get('version')}")
+        names = header["columns"]
+        swap = header["byteorder"] != sys.byteorder
+
+        while True:
+            group = _read_block(f)
+            if group is None:
+                return
+            columns = []
+            for chunk in group["chunks"]:
+                values = array(chunk["typecode"])
+                size = group["n_rows"] * values.itemsize
+                values.frombytes(f.read(size))
+                f.read(-size % 8)
+                if swap:
+                    values.byteswap()
+                if chunk["dtype"] == "string":
+                    columns.append(map(chunk["dictionary"].__getitem__, values))
+                else:
+                    columns.append(values.tolist())
+            for cells in zip(*columns):
+                yield dict(zip(names, cells))
+
+
+def _export(filepath: Union[str, Path], header: List[str], rows: Iterable[Sequence[Any]],
+            format: Optional[str] = None) -> int:
+    """
+    열 순서대로 된 행 튜플을 파일로 저장하고 저장한 행 수를 반환합니다.
+
+    행을 _EXPORT_BATCH_SIZE개씩 모아 한 번에 쓰므로 rows가 생성기면 전체
+    결과를 메모리에 올리지 않습니다.
+    """
+    format = _export_format(filepath, format)
+    rows = iter(rows)
+    batches = iter(lambda: list(islice(rows, _EXPORT_BATCH_SIZE)), [])
+
+    if format == "columnar":
+        with open(filepath, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+            return _write_columnar(f, header, batches)
+
+    count = 0
+    with open(filepath, "w", encoding="utf-8", newline="", buffering=_EXPORT_BUFFER_SIZE) as f:
+        if format == "csv":
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for batch in batches:
+                writer.writerows(batch)
+                count += len(batch)
+        else:
+            dumps = json.JSONEncoder(ensure_ascii=False, default=str).encode
+            for batch in batches:
+                f.write("".join(dumps(dict(zip(header, cells))) + "\n" for cells in batch))
+                count += len(batch)
+    return count
+
+
+def write_rows(filepath: Union[str, Path], rows: Iterable[Dict[str, Any]], columns: List[str],
+               format: Optional[str] = None) -> int:
+    """
+    행 dict를 하나씩 받아 CSV, JSON Lines 또는 컬럼 형식 파일로 저장합니다.
+
+    Args:
+        filepath: 저장할 파일 경로
+        rows: 행 dict (생성기 가능, 없는 열은 빈 값)
+        columns: 저장할 열 순서
+        format: "csv", "jsonl", "columnar" 중 하나 (기본값: 확장자로 판단,
+                .jsonl/.ndjson → jsonl, .dacol → columnar, 그 밖에는 csv)
+
+    Returns:
+        저장한 행 수
+    """
+    return _export(filepath, columns, (tuple(map(row.get, columns)) for row in rows), format)
@@ -0,0 +1,716 @@
+#!/usr/bin/env python3
+"""
+filter_planner.py - 필터 식 파서와 실행 계획
+
+data_analyzer.py의 query()와 --filter 식을 조건 노드 트리로 파싱합니다.
+메모리의 열에 평가할 때는 선택도 추정과 인덱스(SortedIndex, HashIndex)로
+조건 순서를 정해 후보 행을 좁혀 가며, 로딩 중에는 열을 만들기 전 원문
+셀에 같은 식을 평가해 행을 거릅니다.
+"""
+
+import re
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain, compress
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable, Iterator, Callable
+from collections import defaultdict
+
+from column_store import Column, _COMPARATORS, _INVERT_TABLE, _numeric_arrays, _parse_number
+
+# 선택적 의존성: 설치되어 있으면 숫자 연산을 벡터화합니다.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+FILTER_CONDITIONS = ("eq", "ne", "gt", "lt", "ge", "le", "contains", "in", "between", "regex")
+
+
+def _split_values(value: Any) -> List[Any]:
+    """"a, b" 형태의 문자열 또는 시퀀스를 값 목록으로 변환합니다."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",")]
+    return list(value)
+
+
+def _prepare_condition(condition: str, value: Any) -> Tuple[Any, Any]:
+    """
+    필터 조건의 비교 값을 열의 select()가 받는 (text, target) 형태로 변환합니다.
+    
+    - eq/ne/contains/gt/lt/ge/le: (원문, 숫자 값 또는 None)
+    - in: (원문 집합, 숫자 값 집합) — value는 목록 또는 "a, b" 문자열
+    - between: (None, (하한, 상한)) — value는 두 값의 목록 또는 "a, b" 문자열
+    - regex: (패턴, None)
+    """
+    if condition not in FILTER_CONDITIONS:
+        raise ValueError(f"지원하지 않는 조건입니다: {condition}")
+    
+    if condition == "in":
+        texts = frozenset(str(item) for item in _split_values(value))
+        numbers = (_parse_number(text) for text in texts)
+        return texts, frozenset(n for n in numbers if n is not None and n == n)
+    
+    if condition == "between":
+        items = _split_values(value)
+        if len(items) != 2:
+            raise ValueError(f"between에는 두 값이 필요합니다: {value}")
+        bounds = [_parse_number(str(item)) for item in items]
+        if None in bounds:
+            raise ValueError(f"숫자 비교에는 숫자 값이 필요합니다: {value}")
+        return None, (bounds[0], bounds[1])
+    
+    text = str(value)
+    if condition == "regex":
+        try:
+            re.compile(text)
+        except re.error as e:
+            raise ValueError(f"잘못된 정규식입니다: {text} ({e})")
+        return text, None
+    
+    target = _parse_number(text)
+    if condition in _COMPARATORS and target is None:
+        raise ValueError(f"숫자 비교에는 숫자 값이 필요합니다: {value}")
+    return text, target
+
+
+def _cell_test(condition: str, text: Any, target: Any) -> Callable[[str], bool]:
+    """
+    원문 셀 하나에 조건을 평가하는 함수를 반환합니다.
+    
+    열을 만들기 전(로딩 중)에 행을 거를 때 사용하며, 결과는 열의 select()와
+    같습니다. text/target은 _prepare_condition()이 만든 비교 값입니다.
+    """
+    if condition == "eq":
+        if target is None:
+            return text.__eq__
+        return lambda cell: cell == text or _parse_number(cell) == target
+    if condition == "ne":
+        return text.__ne__
+    if condition == "in":
+        return lambda cell: cell in text or _parse_number(cell) in target
+    if condition == "between":
+        low, high = target
+        
+        def between(cell: str) -> bool:
+            number = _parse_number(cell)
+            return number is not None and low <= number <= high
+        return between
+    if condition == "regex":
+        search = re.compile(text).search
+        return lambda cell: search(cell) is not None
+    if condition == "contains":
+        needle = text.lower()
+        return lambda cell: needle in cell.lower()
+    
+    compare = _COMPARATORS[condition]
+    
+    def numeric(cell: str) -> bool:
+        number = _parse_number(cell)
+        return number is not None and compare(number, target)
+    return numeric
+
+
+class SortedIndex:
+    """
+    숫자 값 정렬 인덱스
+    
+    유효한 숫자 셀의 값과 행 번호를 값 순서로 정렬해 두고, gt/lt/ge/le/between과
+    숫자 값의 eq/in 조건을 이분 탐색으로 처리합니다. NaN 셀은 어떤 비교도
+    만족하지 않으므로 인덱스에서 제외합니다.
+    """
+    
+    kind = "sorted"
+    
+    def __init__(self, col: Column):
+        if col.backend == "numpy":
+            values, valid = _numeric_arrays(col)
+            rows = np.flatnonzero(valid & ~np.isnan(values))
+            order = np.argsort(values[rows], kind="stable")
+            self.keys = array("d", values[rows][order].tobytes())
+            self.rows = array("q", rows[order].astype(np.int64).tobytes())
+            return
+        
+        rows, values = [], []
+        for i, value in enumerate(col.iter_numeric()):
+            if value is not None and value == value:
+                rows.append(i)
+                values.append(value)
+        order = sorted(range(len(values)), key=values.__getitem__)
+        self.keys = array("d", (values[o] for o in order))
+        self.rows = array("q", (rows[o] for o in order))
+    
+    def _spans(self, condition: str, text: Any, target: Any) -> Optional[List[Tuple[int, int]]]:
+        """조건을 만족하는 keys 구간 목록 (처리할 수 없으면 None)"""
+        keys = self.keys
+        if condition == "between":
+            low, high = target
+            return [(bisect_left(keys, low), bisect_right(keys, high))]
+        if condition == "in":
+            # 숫자가 아닌 값은 원문 비교가 필요하므로 처리하지 않습니다.
+            if any(n is None or n != n for n in map(_parse_number, text)):
+                return None
+            return [(bisect_left(keys, t), bisect_right(keys, t)) for t in sorted(target)]
+        if condition not in _COMPARATORS and condition != "eq":
+            return None
+        if target is None or target != target:
+            return None
+        if condition == "gt":
+            return [(bisect_right(keys, target), len(keys))]
+        if condition == "ge":
+            return [(bisect_left(keys, target), len(keys))]
+        if condition == "lt":
+            return [(0, bisect_left(keys, target))]
+        if condition == "le":
+            return [(0, bisect_right(keys, target))]
+        return [(bisect_left(keys, target), bisect_right(keys, target))]
+    
+    def count(self, condition: str, text: Any, target: Any) -> Optional[int]:
+        """조건을 만족하는 행 수를 반환합니다 (처리할 수 없으면 None)."""
+        spans = self._spans(condition, text, target)
+        if spans is None:
+            return None
+        return sum(hi - lo for lo, hi in spans)
+    
+    def lookup(self, condition: str, text: Any, target: Any) -> Optional[List[int]]:
+        """
+        조건을 만족하는 행 번호 목록(오름차순)을 반환합니다.
+        
+        인덱스로 처리할 수 없는 조건이면 None을 반환합니다.
+        """
+        spans = self._spans(condition, text, target)
+        if spans is None:
+            return None
+        return sorted(chain.from_iterable(self.rows[lo:hi] for lo, hi in spans))
+
+
+class HashIndex:
+    """
+    값 해시 인덱스
+    
+    숫자 셀은 숫자 값으로, 나머지 셀은 원문으로 행 번호 목록을 묶어
+    eq/ne/in 조건을 전체 스캔 없이 처리합니다.
+    """
+    
+    kind = "hash"
+    
+    def __init__(self, col: Column):
+        self._col = col
+        self._n_rows = len(col)
+        by_number: Dict[float, List[int]] = defaultdict(list)
+        by_text: Dict[str, List[int]] = defaultdict(list)
+        for i, (text, value) in enumerate(zip(col.strings(), col.iter_numeric())):
+            if value is None:
+                by_text[text].append(i)
+            elif value == value:
+                by_number[value].append(i)
+            elif col.dtype == "string":
+                # 문자형 열의 "nan"은 원문으로만 일치합니다 (숫자형 열의 NaN은 어떤 값과도 다름).
+                by_text[text].append(i)
+        self.by_number = dict(by_number)
+        self.by_text = dict(by_text)
+    
+    def _equal_text(self, text: str, target: Optional[float]) -> List[int]:
+        """원문이 정확히 text인 행 번호 목록 (오름차순)"""
+        rows = list(self.by_text.get(text, ()))
+        if target is not None:
+            get = self._col.get
+            rows.extend(i for i in self.by_number.get(target, ()) if get(i) == text)
+            rows.sort()
+        return rows
+    
+    def _groups(self, condition: str, text: Any, target: Any) -> Optional[List[List[int]]]:
+        """eq/in 조건을 만족하는 행 번호 목록들 (서로 겹치지 않음)"""
+        # 각 행은 by_number와 by_text 중 한쪽에만 있습니다.
+        if condition == "eq":
+            groups = [self.by_text.get(text, [])]
+            if target is not None:
+                groups.append(self.by_number.get(target, []))
+            return groups
+        if condition == "in":
+            return ([self.by_text.get(t, []) for t in text]
+                    + [self.by_number.get(t, []) for t in target])
+        return None
+    
+    def count(self, condition: str, text: Any, target: Any) -> Optional[int]:
+        """조건을 만족하는 행 수를 반환합니다 (처리할 수 없으면 None)."""
+        if condition == "ne":
+            return self._n_rows - len(self._equal_text(text, target))
+        groups = self._groups(condition, text, target)
+        if groups is None:
+            return None
+        return sum(len(rows) for rows in groups)
+    
+    def lookup(self, condition: str, text: Any, target: Any) -> Optional[List[int]]:
+        """
+        조건을 만족하는 행 번호 목록(오름차순)을 반환합니다.
+        
+        인덱스로 처리할 수 없는 조건이면 None을 반환합니다.
+        """
+        groups = self._groups(condition, text, target)
+        if groups is not None:
+            return sorted(chain.from_iterable(groups))
+        if condition == "ne":
+            mask = bytearray(b"\x01") * self._n_rows
+            for i in self._equal_text(text, target):
+                mask[i] = 0
+            return list(compress(range(self._n_rows), mask))
+        return None
+
+
+INDEX_KINDS = {"sorted": SortedIndex, "hash": HashIndex}
+Index = Union[SortedIndex, HashIndex]
+
+
+# ---------------------------------------------------------------------------
+# 필터 식
+#
+#   expr      := and_expr (OR and_expr)*
+#   and_expr  := not_expr (AND not_expr)*
+#   not_expr  := NOT not_expr | "(" expr ")" | predicate
+#   predicate := column [NOT] condition value
+#              | column [NOT] IN "(" value ("," value)* ")"
+#              | column [NOT] BETWEEN value AND value
+#
+# 조건은 FILTER_CONDITIONS의 이름 또는 기호(=, !=, >, <, >=, <=, ~)로 씁니다.
+# 공백이 있는 값은 따옴표로 감싸거나 그대로 이어 쓸 수 있습니다 ("city eq New York").
+# ---------------------------------------------------------------------------
+
+_FILTER_TOKEN = re.compile(r"""\s*(?:
+    (?P<quoted>'(?:[^']|'')*'|"(?:[^"]|"")*")
+  | (?P<op>>=|<=|!=|<>|==|=|>|<|~|\(|\)|,)
+  | (?P<word>[^\s(),'"=!<>~][^\s(),=!<>~]*)
+)""", re.VERBOSE)
+
+_FILTER_SYMBOLS = {
+    "=": "eq", "==": "eq", "!=": "ne", "<>": "ne",
+    ">": "gt", "<": "lt", ">=": "ge", "<=": "le", "~": "regex",
+}
+
+_FILTER_KEYWORDS = ("AND", "OR", "NOT")
+
+# 예전 "열 조건 값" 형식에서 쓰던 조건 (값은 나머지 문자열 전체)
+_LEGACY_FILTER_CONDITIONS = ("eq", "ne", "gt", "lt", "ge", "le", "contains")
+
+
+def _tokenize_filter(expression: str) -> List[Tuple[str, str]]:
+    """필터 식을 (종류, 값) 토큰 목록으로 나눕니다."""
+    tokens = []
+    pos = 0
+    expression = expression.rstrip()
+    while pos < len(expression):
+        match = _FILTER_TOKEN.match(expression, pos)
+        if match is None:
+            raise ValueError(f"필터 식을 해석할 수 없습니다: {expression[pos:].strip()}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "quoted":
+            value = value[1:-1].replace(value[0] * 2, value[0])
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+def _mask_of(rows: Iterable[int], n_rows: int) -> bytearray:
+    """행 번호 목록을 0/1 마스크로 변환합니다."""
+    mask = bytearray(n_rows)
+    for i in rows:
+        mask[i] = 1
+    return mask
+
+
+def _restrict(candidates: Optional[List[int]], mask: bytes) -> List[int]:
+    """후보 행 중 마스크가 1인 행만 남깁니다 (후보가 None이면 전체 행)."""
+    if candidates is None:
+        return list(compress(range(len(mask)), mask))
+    return [i for i in candidates if mask[i]]
+
+
+class _FilterContext:
+    """필터 계획을 평가할 열 집합 (선택도 추정 결과를 캐시)"""
+    
+    SAMPLE_SIZE = 1024
+    
+    def __init__(self, columns: Dict[str, Column], n_rows: int,
+                 indexes: Optional[Dict[str, Dict[str, Index]]] = None):
+        self.columns = columns
+        self.n_rows = n_rows
+        self.indexes = indexes or {}
+        self._sample: Optional[List[int]] = None
+        self._estimates: Dict[int, float] = {}
+    
+    def column(self, name: str) -> Column:
+        if name not in self.columns:
+            raise ValueError(f"열이 존재하지 않습니다: {name}")
+        return self.columns[name]
+    
+    @property
+    def sample(self) -> List[int]:
+        """선택도 추정에 쓰는 고르게 흩어진 표본 행 번호"""
+        if self._sample is None:
+            step = max(1, self.n_rows // self.SAMPLE_SIZE)
+            self._sample = list(range(0, self.n_rows, step))
+        return self._sample
+    
+    def estimate(self, node: "_FilterNode") -> float:
+        key = id(node)
+        if key not in self._estimates:
+            self._estimates[key] = node.estimate(self)
+        return self._estimates[key]
+
+
+class _FilterNode:
+    """필터 식 트리의 노드"""
+    
+    def columns(self) -> List[str]:
+        """식이 참조하는 열 이름 목록"""
+        raise NotImplementedError
+    
+    def estimate(self, ctx: _FilterContext) -> float:
+        """만족하는 행의 비율(선택도) 추정치"""
+        raise NotImplementedError
+    
+    def cost(self, ctx: _FilterContext) -> int:
+        """행당 평가 비용의 상대적 크기 (선택도가 같을 때 순서 결정에 사용)"""
+        raise NotImplementedError
+    
+    def evaluate(self, ctx: _FilterContext, candidates: Optional[List[int]]) -> List[int]:
+        """후보 행(None이면 전체) 중 조건을 만족하는 행 번호 목록(오름차순)을 반환합니다."""
+        raise NotImplementedError
+    
+    def explain(self, ctx: _FilterContext, depth: int = 0) -> List[str]:
+        """실행 순서대로 계획을 설명하는 줄 목록"""
+        raise NotImplementedError
+    
+    def matcher(self, positions: Dict[str, int]) -> Callable[[List[str]], bool]:
+        """
+        원문 행(셀 목록)에 식을 평가하는 함수를 반환합니다 (로딩 중 행 거르기용).
+        
+        Args:
+            positions: 열 이름 -> 행에서의 위치 (없는 열은 빈 값으로 평가)
+        """
+        raise NotImplementedError
+
+
+class _Predicate(_FilterNode):
+    """단일 열 조건"""
+    
+    def __init__(self, column: str, condition: str, value: Any):
+        self.column = column
+        self.condition = condition
+        self.value = value
+        self.text, self.target = _prepare_condition(condition, value)
+    
+    def __str__(self) -> str:
+        if self.condition == "in":
+            return f"{self.column} in ({', '.join(map(str, _split_values(self.value)))})"
+        if self.condition == "between":
+            low, high = _split_values(self.value)
+            return f"{self.column} between {low} and {high}"
+        return f"{self.column} {self.condition} {self.value}"
+    
+    def columns(self) -> List[str]:
+        return [self.column]
+    
+    def _index(self, ctx: _FilterContext) -> Tuple[Optional[Index], Optional[int]]:
+        """조건을 처리할 수 있는 인덱스와 그 결과 행 수"""
+        for index in ctx.indexes.get(self.column, {}).values():
+            count = index.count(self.condition, self.text, self.target)
+            if count is not None:
+                return index, count
+        return None, None
+    
+    def estimate(self, ctx: _FilterContext) -> float:
+        if ctx.n_rows == 0:
+            return 0.0
+        index, count = self._index(ctx)
+        if index is not None:
+            return count / ctx.n_rows
+        sample = ctx.sample
+        col = ctx.column(self.column)
+        return len(col.select(self.condition, self.text, self.target, sample)) / len(sample)
+    
+    def cost(self, ctx: _FilterContext) -> int:
+        if self._index(ctx)[0] is not None:
+            return 0
+        if ctx.column(self.column).dtype == "string":
+            return 1    # 사전 항목마다 한 번 평가
+        if self.condition in ("contains", "regex"):
+            return 3    # 셀마다 원문 복원
+        return 2
+    
+    def evaluate(self, ctx: _FilterContext, candidates: Optional[List[int]]) -> List[int]:
+        col = ctx.column(self.column)
+        index, count = self._index(ctx)
+        if index is not None and (candidates is None or count <= len(candidates)):
+            rows = index.lookup(self.condition, self.text, self.target)
+            if candidates is None:
+                return rows
+            return _restrict(candidates, _mask_of(rows, ctx.n_rows))
+        return col.select(self.condition, self.text, self.target, candidates)
+    
+    def explain(self, ctx: _FilterContext, depth: int = 0) -> List[str]:
+        index, _ = self._index(ctx)
+        access = f"인덱스({index.kind})" if index is not None else "스캔"
+        return [f"{'  ' * depth}{self}  [{access}, 추정 {ctx.estimate(self):.1%}]"]
+    
+    def matcher(self, positions: Dict[str, int]) -> Callable[[List[str]], bool]:
+        test = _cell_test(self.condition, self.text, self.target)
+        position = positions.get(self.column)
+        if position is None:
+            result = test("")
+            return lambda row: result
+        return lambda row: test(row[position] if position < len(row) else "")
+
+
+class _And(_FilterNode):
+    """모든 조건을 만족 (선택도가 낮은 조건부터 평가하고 결과가 비면 중단)"""
+    
+    def __init__(self, children: List[_FilterNode]):
+        self.children = children
+    
+    def columns(self) -> List[str]:
+        return [name for child in self.children for name in child.columns()]
+    
+    def ordered(self, ctx: _FilterContext) -> List[_FilterNode]:
+        return sorted(self.children, key=lambda child: (ctx.estimate(child), child.cost(ctx)))
+    
+    def estimate(self, ctx: _FilterContext) -> float:
+        return math.prod(ctx.estimate(child) for child in self.children)
+    
+    def cost(self, ctx: _FilterContext) -> int:
+        return sum(child.cost(ctx) for child in self.children)
+    
+    def evaluate(self, ctx: _FilterContext, candidates: Optional[List[int]]) -> List[int]:
+        rows = candidates
+        for child in self.ordered(ctx):
+            rows = child.evaluate(ctx, rows)
+            if not rows:
+                return []
+        return rows
+    
+    def explain(self, ctx: _FilterContext, depth: int = 0) -> List[str]:
+        lines = [f"{'  ' * depth}AND  [추정 {ctx.estimate(self):.1%}]"]
+        for child in self.ordered(ctx):
+            lines.extend(child.explain(ctx, depth + 1))
+        return lines
+    
+    def matcher(self, positions: Dict[str, int]) -> Callable[[List[str]], bool]:
+        tests = [child.matcher(positions) for child in self.children]
+        return lambda row: all(test(row) for test in tests)
+
+
+class _Or(_FilterNode):
+    """하나 이상의 조건을 만족 (이미 만족한 행은 다음 조건에서 제외)"""
+    
+    def __init__(self, children: List[_FilterNode]):
+        self.children = children
+    
+    def columns(self) -> List[str]:
+        return [name for child in self.children for name in child.columns()]
+    
+    def ordered(self, ctx: _FilterContext) -> List[_FilterNode]:
+        return sorted(self.children, key=lambda child: (-ctx.estimate(child), child.cost(ctx)))
+    
+    def estimate(self, ctx: _FilterContext) -> float:
+        return 1.0 - math.prod(1.0 - ctx.estimate(child) for child in self.children)
+    
+    def cost(self, ctx: _FilterContext) -> int:
+        return sum(child.cost(ctx) for child in self.children)
+    
+    def evaluate(self, ctx: _FilterContext, candidates: Optional[List[int]]) -> List[int]:
+        matched = bytearray(ctx.n_rows)
+        remaining = candidates
+        for child in self.ordered(ctx):
+            rows = child.evaluate(ctx, remaining)
+            for i in rows:
+                matched[i] = 1
+            remaining = _restrict(remaining, matched.translate(_INVERT_TABLE))
+            if not remaining:
+                break
+        return _restrict(candidates, matched)
+    
+    def explain(self, ctx: _FilterContext, depth: int = 0) -> List[str]:
+        lines = [f"{'  ' * depth}OR  [추정 {ctx.estimate(self):.1%}]"]
+        for child in self.ordered(ctx):
+            lines.extend(child.explain(ctx, depth + 1))
+        return lines
+    
+    def matcher(self, positions: Dict[str, int]) -> Callable[[List[str]], bool]:
+        tests = [child.matcher(positions) for child in self.children]
+        return lambda row: any(test(row) for test in tests)
+
+
+class _Not(_FilterNode):
+    """조건을 만족하지 않음"""
+    
+    def __init__(self, child: _FilterNode):
+        self.child = child
+    
+    def columns(self) -> List[str]:
+        return self.child.columns()
+    
+    def estimate(self, ctx: _FilterContext) -> float:
+        return 1.0 - ctx.estimate(self.child)
+    
+    def cost(self, ctx: _FilterContext) -> int:
+        return self.child.cost(ctx)
+    
+    def evaluate(self, ctx: _FilterContext, candidates: Optional[List[int]]) -> List[int]:
+        excluded = _mask_of(self.child.evaluate(ctx, candidates), ctx.n_rows)
+        return _restrict(candidates, excluded.translate(_INVERT_TABLE))
+    
+    def explain(self, ctx: _FilterContext, depth: int = 0) -> List[str]:
+        lines = [f"{'  ' * depth}NOT  [추정 {ctx.estimate(self):.1%}]"]
+        lines.extend(self.child.explain(ctx, depth + 1))
+        return lines
+    
+    def matcher(self, positions: Dict[str, int]) -> Callable[[List[str]], bool]:
+        test = self.child.matcher(positions)
+        return lambda row: not test(row)
+
+
+class _FilterParser:
+    """필터 식을 _FilterNode 트리로 변환하는 재귀 하향 파서"""
+    
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize_filter(expression)
+        self.pos = 0
+    
+    def parse(self) -> _FilterNode:
+        if not self.tokens:
+            raise ValueError("필터 식이 비어 있습니다")
+        node = self._or()
+        if self.pos < len(self.tokens):
+            raise self._error("예상하지 못한 토큰")
+        return node
+    
+    def _error(self, message: str) -> ValueError:
+        if self.pos < len(self.tokens):
+            return ValueError(f"필터 식 오류: {message} '{self.tokens[self.pos][1]}' ({self.expression})")
+        return ValueError(f"필터 식 오류: {message} - 식이 끝났습니다 ({self.expression})")
+    
+    def _peek(self) -> Tuple[Optional[str], Optional[str]]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None, None
+    
+    def _keyword(self) -> Optional[str]:
+        kind, value = self._peek()
+        if kind == "word" and value.upper() in _FILTER_KEYWORDS:
+            return value.upper()
+        return None
+    
+    def _expect(self, op: str) -> None:
+        if self._peek() != ("op", op):
+            raise self._error(f"'{op}'이(가) 필요합니다")
+        self.pos += 1
+    
+    def _or(self) -> _FilterNode:
+        children = [self._and()]
+        while self._keyword() == "OR":
+            self.pos += 1
+            children.append(self._and())
+        return children[0] if len(children) == 1 else _Or(children)
+    
+    def _and(self) -> _FilterNode:
+        children = [self._not()]
+        while self._keyword() == "AND":
+            self.pos += 1
+            children.append(self._not())
+        return children[0] if len(children) == 1 else _And(children)
+    
+    def _not(self) -> _FilterNode:
+        if self._keyword() == "NOT":
+            self.pos += 1
+            return _Not(self._not())
+        if self._peek() == ("op", "("):
+            self.pos += 1
+            node = self._or()
+            self._expect(")")
+            return node
+        return self._predicate()
+    
+    def _predicate(self) -> _FilterNode:
+        kind, column = self._peek()
+        if kind not in ("word", "quoted"):
+            raise self._error("열 이름이 필요합니다")
+        self.pos += 1
+        
+        negate = self._keyword() == "NOT"
+        if negate:
+            self.pos += 1
+        
+        kind, token = self._peek()
+        if kind == "op" and token in _FILTER_SYMBOLS:
+            condition = _FILTER_SYMBOLS[token]
+        elif kind == "word" and token.lower() in FILTER_CONDITIONS:
+            condition = token.lower()
+        else:
+            raise self._error("조건이 필요합니다")
+        self.pos += 1
+        
+        if condition == "in":
+            self._expect("(")
+            value: Any = [self._value()]
+            while self._peek() == ("op", ","):
+                self.pos += 1
+                value.append(self._value())
+            self._expect(")")
+        elif condition == "between":
+            low = self._value()
+            if self._keyword() != "AND":
+                raise self._error("between에는 AND가 필요합니다")
+            self.pos += 1
+            value = [low, self._value()]
+        else:
+            value = self._value()
+        
+        node = _Predicate(column, condition, value)
+        return _Not(node) if negate else node
+    
+    def _value(self) -> str:
+        kind, token = self._peek()
+        if kind == "quoted":
+            self.pos += 1
+            return token
+        words = []
+        while kind == "word" and token.upper() not in ("AND", "OR"):
+            words.append(token)
+            self.pos += 1
+            kind, token = self._peek()
+        if not words:
+            raise self._error("값이 필요합니다")
+        return " ".join(words)
+
+
+def _parse_filter(expression: str) -> _FilterNode:
+    """
+    필터 식을 실행 계획 트리로 변환합니다.
+    
+    예: "age gt 30 AND (city in (Seoul, Busan) OR name ~ '^김')"
+    
+    AND/OR/NOT, 괄호, 따옴표가 없는 예전 형식 "열 조건 값"은 예전처럼 세
+    번째 단어부터 끝까지를 값으로 사용합니다 (값에 =, (, ~ 등이 있어도 됨).
+    """
+    parts = expression.split()
+    if (len(parts) >= 3 and parts[1].lower() in _LEGACY_FILTER_CONDITIONS
+            and not parts[0].startswith(("(", "'", '"'))
+            and not parts[2].startswith(("'", '"'))
+            and not any(part.upper() in _FILTER_KEYWORDS for part in parts[2:])):
+        return _Predicate(parts[0], parts[1].lower(), " ".join(parts[2:]))
+    return _FilterParser(expression).parse()
+
+
+def _filter_rows(rows: Iterable[List[str]], plan: "_FilterNode",
+                 header: List[str]) -> Iterator[List[str]]:
+    """
+    원문 행 중 필터 식을 만족하는 행만 통과시킵니다 (빈 줄은 제외).
+    
+    열을 만들기 전에 셀 문자열로 평가하므로 걸러진 행은 열에 저장되지 않습니다.
+    """
+    # 이름이 중복되면 csv.DictReader처럼 마지막 열을 사용
+    match = plan.matcher({name: i for i, name in enumerate(header)})
+    return (row for row in rows if row and match(row))
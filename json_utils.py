@@ -13,6 +13,8 @@ from typing import Any, Dict, List, Optional, Union
 from functools import reduce
 import operator
 
+from compress_utils import detect_compression, open_compressed
+
 
 class JsonNavigator:
     """
@@ -27,8 +29,12 @@ class JsonNavigator:
     
     @classmethod
     def from_file(cls, filepath: str) -> "JsonNavigator":
-        """파일에서 JSON을 읽어 JsonNavigator 인스턴스를 생성합니다."""
-        with open(filepath, "r", encoding="utf-8") as f:
+        """
+        파일에서 JSON을 읽어 JsonNavigator 인스턴스를 생성합니다.
+        
+        gzip/bz2/xz/zstd로 압축된 파일은 매직 바이트로 감지해 스트리밍으로 해제합니다.
+        """
+        with open_compressed(filepath, "rt", encoding="utf-8") as f:
             data = json.load(f)
         return cls(data)
     
@@ -346,10 +352,11 @@ def main():
   python json_utils.py data.json --search "email"      # 키 검색
   python json_utils.py --compare file1.json file2.json # 두 파일 비교
   python json_utils.py data.json --to-csv              # CSV로 변환
+  python json_utils.py data.json.bz2 --tree            # 압축 파일을 풀지 않고 보기
         """
     )
     
-    parser.add_argument("file", nargs="?", help="JSON 파일 경로")
+    parser.add_argument("file", nargs="?", help="JSON 파일 경로 (gzip/bz2/xz/zstd 압축 가능)")
     parser.add_argument("--get", "-g", type=str, metavar="PATH",
                         help="점 표기법으로 값 가져오기 (예: users.0.name)")
     parser.add_argument("--set", "-s", nargs=2, metavar=("PATH", "VALUE"),
@@ -405,6 +412,11 @@ def main():
     try:
         nav = JsonNavigator.from_file(args.file)
         
+        # 압축된 원본에 일반 JSON을 덮어쓰지 않도록 합니다.
+        if (args.set or args.delete) and not args.output and detect_compression(args.file):
+            print("❌ 압축 파일은 직접 수정할 수 없습니다. --output으로 저장할 파일을 지정하세요.")
+            return
+        
         # 값 가져오기
         if args.get:
             result = nav.get(args.get)
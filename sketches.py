@@ -0,0 +1,943 @@
+#!/usr/bin/env python3
+"""
+sketches.py - 병합 가능한 열 통계 집계기
+
+data_analyzer.py의 요약 통계를 한 번의 스캔으로 계산하는 열 집계기와 근사
+모드용 스케치(KLL 분위수, HyperLogLog 고유값 수, Misra-Gries 상위 값)입니다.
+부분 집계를 파일 순서대로 병합하면 전체를 한 번에 계산한 결과와 같습니다.
+집계 상태를 CSV 옆에 저장하는 증분 갱신 체크포인트 형식도 여기에 있습니다.
+"""
+
+import math
+import sys
+import random
+from array import array
+from itertools import compress, islice
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Sequence, BinaryIO
+from dataclasses import dataclass, field
+from collections import Counter, defaultdict
+from hashlib import blake2b
+from pathlib import Path
+
+from column_store import (Column, NUMERIC_RATIO_THRESHOLD, NumericColumn, _build_table,
+                          _CANONICAL_TABLE, _FIXED_TABLE, _format_number, _is_blank, _MISSING,
+                          _np_counter, _open_sidecar, _parse_number, _RAW_TEXT, _Segments,
+                          _sidecar_segment, _write_sidecar)
+
+# 선택적 의존성: 설치되어 있으면 숫자 연산을 벡터화합니다.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass
+class ColumnStats:
+    """열의 통계 정보"""
+    name: str
+    dtype: str  # 'numeric', 'string', 'mixed'
+    count: int
+    missing: int
+    unique: int
+    
+    # 숫자형일 경우
+    min_val: Optional[float] = None
+    max_val: Optional[float] = None
+    mean: Optional[float] = None
+    median: Optional[float] = None
+    std_dev: Optional[float] = None
+    sum_val: Optional[float] = None
+    invalid: int = 0  # 숫자로 해석하지 못해 통계에서 제외된 값 수
+    # 그중 처음 몇 개의 (0부터 센 행 번호, 원문)
+    invalid_examples: List[Tuple[int, str]] = field(default_factory=list)
+    
+    # 문자형일 경우
+    top_values: List[Tuple[str, int]] = field(default_factory=list)
+    
+    # 근사 모드로 계산한 경우 median/unique/top_values는 근사치
+    approximate: bool = False
+
+
+def _select_kth(values: Sequence[float], k: int) -> float:
+    """k번째(0부터 시작)로 작은 값을 퀵셀렉트로 찾습니다 (평균 O(n))."""
+    data = values
+    while len(data) > 32:
+        # 세 표본의 중앙값을 피벗으로 사용
+        pivot = sorted((data[0], data[len(data) // 2], data[-1]))[1]
+        lows = [x for x in data if x < pivot]
+        if k < len(lows):
+            data = lows
+            continue
+        highs = [x for x in data if x > pivot]
+        n_equal = len(data) - len(lows) - len(highs)
+        if k < len(lows) + n_equal:
+            return pivot
+        k -= len(lows) + n_equal
+        data = highs
+    return sorted(data)[k]
+
+
+def _median(values: Sequence[float]) -> Optional[float]:
+    """정렬 없이 중앙값을 계산합니다."""
+    n = len(values)
+    if n == 0:
+        return None
+    mid = n // 2
+    if n % 2:
+        return _select_kth(values, mid)
+    return (_select_kth(values, mid - 1) + _select_kth(values, mid)) / 2
+
+
+def _percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """q(0~1) 분위수를 선형 보간으로 계산합니다 (정렬 없이)."""
+    n = len(values)
+    if n == 0:
+        return None
+    position = q * (n - 1)
+    lower = int(position)
+    fraction = position - lower
+    low = _select_kth(values, lower)
+    if fraction == 0:
+        return low
+    return low + (_select_kth(values, lower + 1) - low) * fraction
+
+
+class _ColumnAccumulator:
+    """
+    열 통계를 누적하는 병합 가능한 집계기
+    
+    행 수, 결측치, 값별 빈도와 숫자 값의 개수/합계/최솟값/최댓값/평균/분산을
+    한 번의 스캔으로 계산합니다. 평균과 분산은 Welford 방식으로 누적하되,
+    블록 단위로 구한 부분 결과를 Chan의 병합 공식으로 합칩니다.
+    """
+    
+    BLOCK_SIZE = 65536
+    # 숫자로 해석하지 못한 값의 위치를 보관하는 개수
+    INVALID_EXAMPLES = 5
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.missing = 0
+        # 숫자로 해석하지 못한 처음 몇 개의 (행 번호, 원문). 행 번호는 이
+        # 집계기가 받은 첫 행 기준이며, merge()가 앞 집계기의 행 수만큼 밀어 줍니다.
+        self.invalid_examples: List[Tuple[int, str]] = []
+        
+        # 숫자 값 통계
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        
+        # 결측치를 제외한 값별 빈도. 숫자형 열의 값은 문자열로 바꾸지 않고
+        # 숫자 그대로 세었다가 result()에서 고유값 단위로만 변환합니다.
+        self.canonical: Counter = Counter()
+        self.fixed: Dict[int, Counter] = defaultdict(Counter)
+        self.text: Counter = Counter()
+    
+    def _add_moments(self, n: int, mean: float, m2: float, total: float,
+                     low: float, high: float) -> None:
+        if n == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean, self.m2, self.total = n, mean, m2, total
+            self.min, self.max = low, high
+            return
+        combined = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / combined
+        self.m2 += m2 + delta * delta * self.n * n / combined
+        self.n = combined
+        self.total += total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+    
+    def add_values(self, values: Sequence[float]) -> None:
+        """숫자 값 목록(또는 NumPy 배열)을 누적합니다."""
+        if np is not None and isinstance(values, np.ndarray):
+            for start in range(0, len(values), self.BLOCK_SIZE):
+                block = values[start:start + self.BLOCK_SIZE]
+                total = float(block.sum())
+                mean = total / len(block)
+                deviations = block - mean
+                m2 = float(deviations @ deviations)
+                self._add_moments(len(block), mean, m2, total, float(block.min()), float(block.max()))
+            return
+        
+        for start in range(0, len(values), self.BLOCK_SIZE):
+            block = values[start:start + self.BLOCK_SIZE]
+            total = sum(block)
+            mean = total / len(block)
+            m2 = sum((x - mean) ** 2 for x in block)
+            self._add_moments(len(block), mean, m2, total, min(block), max(block))
+    
+    def _add_invalid(self, col: Column) -> None:
+        """add_column() 전에 호출: 열에서 숫자가 아닌 셀의 위치를 필요한 만큼만 모읍니다."""
+        need = self.INVALID_EXAMPLES - len(self.invalid_examples)
+        if need <= 0:
+            return
+        base = self.count
+        if isinstance(col, NumericColumn):
+            found = col.invalid_values().items()
+        else:
+            numbers, dictionary = col.numbers(), col.dictionary
+            bad = {code for code, number in enumerate(numbers)
+                   if number is None and not _is_blank(dictionary[code])}
+            if not bad:
+                return
+            found = ((i, dictionary[code]) for i, code in enumerate(col.codes) if code in bad)
+        self.invalid_examples.extend((base + i, text) for i, text in islice(found, need))
+    
+    def add_column(self, col: Column, numeric_values: Optional[Sequence[float]] = None) -> None:
+        """
+        열 전체를 누적합니다.
+        
+        Args:
+            col: 누적할 열
+            numeric_values: 미리 구한 col.numeric_values() (중복 계산 방지용)
+        """
+        self._add_invalid(col)
+        self.count += len(col)
+        
+        if isinstance(col, NumericColumn):
+            status = col.status
+            if col.backend == "numpy":
+                values, valid = col.arrays()
+                self.add_values(numeric_values if numeric_values is not None else values[valid])
+                canonical = np.frombuffer(status.translate(_CANONICAL_TABLE), dtype=np.bool_)
+                self.canonical.update(_np_counter(values[canonical]))
+                if col.decimals is not None:
+                    fixed = np.frombuffer(status.translate(_FIXED_TABLE), dtype=np.bool_)
+                    self.fixed[col.decimals].update(_np_counter(values[fixed]))
+            else:
+                self.add_values(numeric_values if numeric_values is not None else col.numeric_values())
+                self.canonical.update(compress(col.values, status.translate(_CANONICAL_TABLE)))
+                if col.decimals is not None:
+                    self.fixed[col.decimals].update(compress(col.values, status.translate(_FIXED_TABLE)))
+            self.missing += status.count(_MISSING)
+            for text in col.raw.values():
+                if _is_blank(text):
+                    self.missing += 1
+                else:
+                    self.text[text] += 1
+            return
+        
+        # 문자형 열은 사전 항목 단위로 집계합니다.
+        numbers, dictionary = col.numbers(), col.dictionary
+        for code, n in col.code_counts().items():
+            text = dictionary[code]
+            if _is_blank(text):
+                self.missing += n
+                continue
+            self.text[text] += n
+            number = numbers[code]
+            if number is not None:
+                self._add_moments(n, number, 0.0, number * n, number, number)
+    
+    def merge(self, other: "_ColumnAccumulator") -> None:
+        """다른 집계기의 결과를 합칩니다 (other는 이 집계기 뒤에 이어지는 행)."""
+        need = self.INVALID_EXAMPLES - len(self.invalid_examples)
+        self.invalid_examples.extend((self.count + i, text)
+                                     for i, text in other.invalid_examples[:max(need, 0)])
+        self.count += other.count
+        self.missing += other.missing
+        self._add_moments(other.n, other.mean, other.m2, other.total, other.min, other.max)
+        self.canonical.update(other.canonical)
+        for decimals, counter in other.fixed.items():
+            self.fixed[decimals].update(counter)
+        self.text.update(other.text)
+    
+    @property
+    def dtype(self) -> str:
+        """숫자 셀 비율로 결정한 열 타입"""
+        ratio = self.n / self.count if self.count else 0
+        return "numeric" if ratio > NUMERIC_RATIO_THRESHOLD else "string"
+    
+    def value_counts(self) -> Counter:
+        """결측치를 제외한 원문 문자열별 빈도를 반환합니다."""
+        counts = Counter(self.text)
+        for value, n in self.canonical.items():
+            counts[_format_number(value)] += n
+        for decimals, counter in self.fixed.items():
+            for value, n in counter.items():
+                counts[f"{value:.{decimals}f}"] += n
+        return counts
+
+    def median(self) -> Optional[float]:
+        """
+        값별 빈도로 숫자 값의 중앙값을 정확히 계산합니다.
+
+        파일을 다시 스캔하지 않는 대신 고유값 수에 비례하는 시간이 듭니다
+        (증분 갱신처럼 원본 전체를 다시 읽을 수 없을 때 사용).
+        """
+        counts: Counter = Counter(self.canonical)
+        for counter in self.fixed.values():
+            counts.update(counter)
+        for text, n in self.text.items():
+            number = _parse_number(text)
+            if number is not None:
+                counts[number] += n
+
+        values = sorted(value for value in counts if value == value)
+        total = sum(counts[value] for value in values)
+        if not total:
+            return None
+        low_rank, high_rank = (total - 1) // 2, total // 2
+        seen, low = 0, None
+        for value in values:
+            seen += counts[value]
+            if low is None and seen > low_rank:
+                low = value
+            if seen > high_rank:
+                return (low + value) / 2
+        return None
+
+    def result(self, median: Optional[float] = None) -> ColumnStats:
+        """
+        누적된 값으로 ColumnStats를 만듭니다.
+        
+        Args:
+            median: 별도로 계산한 중앙값 (숫자형 열)
+        """
+        counts = self.value_counts()
+        stats = ColumnStats(
+            name=self.name,
+            dtype=self.dtype,
+            count=self.count,
+            missing=self.missing,
+            unique=len(counts)
+        )
+        
+        if stats.dtype == "numeric":
+            stats.min_val = self.min
+            stats.max_val = self.max
+            stats.mean = self.mean
+            stats.median = median
+            stats.std_dev = math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0
+            stats.sum_val = self.total
+            stats.invalid = self.count - self.missing - self.n
+            stats.invalid_examples = list(self.invalid_examples)
+        else:
+            stats.top_values = counts.most_common(5)
+        
+        return stats
+
+
+class _KLLSketch:
+    """
+    KLL 분위수 스케치 (병합 가능)
+    
+    높이 h의 압축기(compactor)에 있는 값 하나는 원래 값 2^h개를 대표합니다.
+    압축기가 용량을 넘으면 정렬한 뒤 한 칸 건너 하나씩 다음 높이로 올리므로
+    메모리는 O(k)로 유지되고, 정규화된 순위 오차는 대략 1.7/k 수준입니다.
+    """
+    
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.n = 0
+        self.compactors: List[List[float]] = [[]]
+        self._random = random.Random(seed)
+    
+    @classmethod
+    def for_error(cls, error: float, seed: int = 0) -> "_KLLSketch":
+        """
+        순위 오차(0~1)가 error 이내가 되도록 여유를 두고 k를 정합니다.
+        
+        나중에 병합할 스케치들은 압축 때의 동전 던지기가 겹치지 않도록
+        서로 다른 seed로 만들어야 합니다.
+        """
+        return cls(k=max(8, math.ceil(2.5 / error)), seed=seed)
+    
+    def _capacity(self, height: int) -> int:
+        depth = len(self.compactors) - height - 1
+        return max(2, int(self.k * (2 / 3) ** depth))
+    
+    def _compact(self, height: int) -> None:
+        buffer = sorted(self.compactors[height])
+        if height + 1 == len(self.compactors):
+            self.compactors.append([])
+        keep = [buffer.pop()] if len(buffer) % 2 else []
+        offset = self._random.randint(0, 1)
+        self.compactors[height + 1].extend(buffer[offset::2])
+        self.compactors[height] = keep
+    
+    def _compress(self) -> None:
+        while True:
+            over = next((h for h, buffer in enumerate(self.compactors)
+                         if len(buffer) > self._capacity(h)), None)
+            if over is None:
+                return
+            self._compact(over)
+    
+    def update(self, values: Sequence[float]) -> None:
+        """값 목록을 추가합니다."""
+        self.compactors[0].extend(values)
+        self.n += len(values)
+        self._compress()
+    
+    def update_counts(self, counts: Iterable[Tuple[float, int]]) -> None:
+        """
+        (값, 개수) 쌍을 추가합니다.
+        
+        개수를 2의 거듭제곱의 합으로 나눠 가중치가 같은 높이의 압축기에 값을
+        하나씩 넣으므로, 값을 개수만큼 펼친 목록을 만들지 않고도 같은 가중치를
+        정확히 반영합니다.
+        """
+        compactors = self.compactors
+        for value, count in counts:
+            self.n += count
+            height = 0
+            while count:
+                if count & 1:
+                    while height >= len(compactors):
+                        compactors.append([])
+                    compactors[height].append(value)
+                count >>= 1
+                height += 1
+        self._compress()
+    
+    def merge(self, other: "_KLLSketch") -> None:
+        """다른 스케치를 합칩니다."""
+        for height, buffer in enumerate(other.compactors):
+            if height == len(self.compactors):
+                self.compactors.append([])
+            self.compactors[height].extend(buffer)
+        self.n += other.n
+        self._compress()
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """q(0~1) 분위수의 근사값을 반환합니다."""
+        items = sorted((value, 1 << height)
+                       for height, buffer in enumerate(self.compactors) for value in buffer)
+        if not items:
+            return None
+        target = q * sum(weight for _, weight in items)
+        cumulative = 0
+        for value, weight in items:
+            cumulative += weight
+            if cumulative > target:
+                return value
+        return items[-1][0]
+
+
+class _HyperLogLog:
+    """
+    HyperLogLog 고유값 수 추정기 (병합 가능)
+    
+    2^p개의 레지스터(바이트)만 사용하며 상대 표준 오차는 1.04/sqrt(2^p)입니다.
+    작업 프로세스 사이에서도 같은 값이 같은 해시를 갖도록 blake2b를 사용합니다.
+    """
+    
+    def __init__(self, p: int = 14):
+        self.p = p
+        self.registers = bytearray(1 << p)
+    
+    @classmethod
+    def for_error(cls, error: float) -> "_HyperLogLog":
+        """상대 표준 오차가 error 이하가 되도록 p를 정합니다 (4~18)."""
+        p = math.ceil(math.log2((1.04 / error) ** 2))
+        return cls(p=min(18, max(4, p)))
+    
+    def add_strings(self, texts: Iterable[str]) -> None:
+        """문자열들을 추가합니다."""
+        registers = self.registers
+        shift = 64 - self.p
+        mask = (1 << shift) - 1
+        for text in texts:
+            digest = blake2b(text.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+            h = int.from_bytes(digest, "big")
+            index = h >> shift
+            rank = shift - (h & mask).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+    
+    def merge(self, other: "_HyperLogLog") -> None:
+        """다른 추정기를 합칩니다 (p가 같아야 함)."""
+        self.registers = bytearray(map(max, self.registers, other.registers))
+    
+    def estimate(self) -> int:
+        """고유값 수 추정치를 반환합니다."""
+        registers = self.registers
+        m = len(registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in registers)
+        zeros = registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))  # 작은 범위 보정 (linear counting)
+        return round(raw)
+
+
+class _TopValues:
+    """
+    Misra-Gries 상위 값 요약 (병합 가능)
+    
+    최대 capacity개의 카운터만 유지합니다. 보고되는 빈도는 실제 빈도보다
+    최대 (전체 개수 / (capacity + 1))만큼 작을 수 있습니다.
+    """
+    
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.counts: Counter = Counter()
+    
+    def update(self, counts: Dict[str, int]) -> None:
+        """값별 빈도를 추가합니다."""
+        self.counts.update(counts)
+        if len(self.counts) > 2 * self.capacity:
+            self._reduce()
+    
+    def merge(self, other: "_TopValues") -> None:
+        """다른 요약을 합칩니다."""
+        self.update(other.counts)
+    
+    def _reduce(self) -> None:
+        if len(self.counts) <= self.capacity:
+            return
+        threshold = sorted(self.counts.values(), reverse=True)[self.capacity]
+        self.counts = Counter({value: n - threshold for value, n in self.counts.items()
+                               if n > threshold})
+    
+    def most_common(self, n: int) -> List[Tuple[str, int]]:
+        self._reduce()
+        return self.counts.most_common(n)
+
+
+class _ApproxColumnAccumulator(_ColumnAccumulator):
+    """
+    근사 모드 열 집계기
+    
+    값별 빈도를 모두 보관하는 대신 KLL(중앙값), HyperLogLog(고유값 수),
+    Misra-Gries(상위 값) 스케치만 유지하므로 고유값이 많은 열에서도 메모리가
+    일정합니다. 개수/결측/합계/평균/분산/최솟값/최댓값은 정확히 계산합니다.
+    """
+    
+    def __init__(self, name: str, error: float = 0.01, seed: int = 0):
+        super().__init__(name)
+        self.error = error
+        self.quantiles = _KLLSketch.for_error(error, seed)
+        self.distinct = _HyperLogLog.for_error(error)
+        self.top = _TopValues(capacity=max(64, math.ceil(1 / error)))
+    
+    def add_values(self, values: Sequence[float]) -> None:
+        super().add_values(values)
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+        self.quantiles.update(values)
+    
+    def add_column(self, col: Column, numeric_values: Optional[Sequence[float]] = None) -> None:
+        self._add_invalid(col)
+        self.count += len(col)
+        
+        if isinstance(col, NumericColumn):
+            self.add_values(numeric_values if numeric_values is not None else col.numeric_values())
+            self.missing += col.missing_count()
+            # 블록 안에서 중복을 제거한 뒤 해시하여 원문 문자열 기준으로 셉니다.
+            strings = col.strings()
+            while True:
+                block = set(islice(strings, self.BLOCK_SIZE))
+                if not block:
+                    break
+                self.distinct.add_strings(text for text in block if not _is_blank(text))
+            self.top.update(Counter(text for i, text in col.raw.items()
+                                    if col.status[i] == _RAW_TEXT and not _is_blank(text)))
+            return
+        
+        numbers, dictionary = col.numbers(), col.dictionary
+        counts = {}
+        weighted: List[Tuple[float, int]] = []
+        for code, n in col.code_counts().items():
+            text = dictionary[code]
+            if _is_blank(text):
+                self.missing += n
+                continue
+            counts[text] = n
+            number = numbers[code]
+            if number is not None:
+                self._add_moments(n, number, 0.0, number * n, number, number)
+                weighted.append((number, n))
+        self.distinct.add_strings(counts)
+        self.top.update(counts)
+        self.quantiles.update_counts(weighted)
+    
+    def merge(self, other: "_ColumnAccumulator") -> None:
+        super().merge(other)
+        self.quantiles.merge(other.quantiles)
+        self.distinct.merge(other.distinct)
+        self.top.merge(other.top)
+    
+    def value_counts(self) -> Counter:
+        """상위 값의 근사 빈도를 반환합니다."""
+        return Counter(dict(self.top.most_common(self.top.capacity)))
+    
+    def result(self, median: Optional[float] = None) -> ColumnStats:
+        stats = ColumnStats(
+            name=self.name,
+            dtype=self.dtype,
+            count=self.count,
+            missing=self.missing,
+            unique=self.distinct.estimate(),
+            approximate=True
+        )
+        
+        if stats.dtype == "numeric":
+            stats.min_val = self.min
+            stats.max_val = self.max
+            stats.mean = self.mean
+            stats.median = median if median is not None else self.quantiles.quantile(0.5)
+            stats.std_dev = math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0
+            stats.sum_val = self.total
+            stats.invalid = self.count - self.missing - self.n
+            stats.invalid_examples = list(self.invalid_examples)
+        else:
+            stats.top_values = self.top.most_common(5)
+        
+        return stats
+
+
+def _make_accumulator(name: str, approx: Optional[float] = None,
+                      seed: int = 0) -> _ColumnAccumulator:
+    """
+    approx(오차 한도)가 주어지면 근사 모드 집계기를 만듭니다.
+    
+    seed는 근사 스케치의 난수 시드로, 병합할 부분 집계마다 달라야 합니다.
+    """
+    if approx is None:
+        return _ColumnAccumulator(name)
+    if not 0 < approx < 1:
+        raise ValueError(f"근사 오차는 0과 1 사이여야 합니다: {approx}")
+    return _ApproxColumnAccumulator(name, approx, seed)
+
+
+def _summarize_column(name: str, col: Column, approx: Optional[float] = None) -> ColumnStats:
+    """열 하나를 한 번 스캔하여 통계를 계산합니다."""
+    accumulator = _make_accumulator(name, approx)
+    if col.dtype == "numeric" and col.backend == "numpy":
+        values = col.numeric_array()
+        accumulator.add_column(col, values)
+        median = float(np.median(values)) if len(values) and approx is None else None
+        return accumulator.result(median=median)
+    
+    values = col.numeric_values() if col.dtype == "numeric" else None
+    accumulator.add_column(col, values)
+    if approx is not None:
+        return accumulator.result()
+    return accumulator.result(median=_median(values) if values else None)
+
+
+def _accumulate_batch(item: Tuple[int, List[List[str]]], header: List[str], names: List[str],
+                      approx: Optional[float] = None
+                      ) -> Tuple[Dict[str, _ColumnAccumulator], int]:
+    """
+    (묶음 번호, 행 묶음) 하나를 열로 변환하여 열별 부분 집계를 반환합니다
+    (작업 프로세스용). 묶음 번호는 근사 스케치의 시드로 씁니다.
+    """
+    seed, batch = item
+    columns, n_rows = _build_table([batch], header, names)
+    return _accumulate_table(columns, names, approx, seed), n_rows
+
+
+def _accumulate_table(columns: Dict[str, Column], names: List[str],
+                      approx: Optional[float] = None, seed: int = 0
+                      ) -> Dict[str, _ColumnAccumulator]:
+    """열 저장소 하나의 열별 부분 집계를 반환합니다 (작업 프로세스용)."""
+    accumulators = {}
+    for name in names:
+        accumulator = _make_accumulator(name, approx, seed)
+        accumulator.add_column(columns[name])
+        accumulators[name] = accumulator
+    return accumulators
+
+
+class _RankFinder:
+    """
+    여러 번의 스캔으로 k번째 값을 정확히 찾는 탐색기 (메모리 사용량 고정)
+    
+    매 스캔마다 후보 구간을 BINS개 구간으로 나눈 히스토그램을 만들어
+    k번째 값이 속한 구간으로 범위를 좁히고, 남은 값이 COLLECT_LIMIT개
+    이하가 되면 그 값들만 모아 선택 알고리즘으로 답을 구합니다.
+    """
+    
+    BINS = 4096
+    COLLECT_LIMIT = 200000
+    
+    def __init__(self, k: int, low: float, high: float):
+        self.k = k
+        self.low = low
+        self.high = high
+        self.collect = False
+        self.result: Optional[float] = None
+        self._reset()
+    
+    def _reset(self) -> None:
+        self.below = 0
+        self.counts = [0] * self.BINS
+        self.bin_min: List[Optional[float]] = [None] * self.BINS
+        self.bin_max: List[Optional[float]] = [None] * self.BINS
+        self.collected: List[float] = []
+    
+    @property
+    def done(self) -> bool:
+        return self.result is not None
+    
+    def scan(self, values: Iterable[float]) -> None:
+        """한 행 묶음의 숫자 값을 스캔합니다."""
+        low, high = self.low, self.high
+        if self.collect:
+            for x in values:
+                if x < low:
+                    self.below += 1
+                elif x <= high:
+                    self.collected.append(x)
+            return
+        
+        scale = self.BINS / (high - low)
+        last = self.BINS - 1
+        counts, bin_min, bin_max = self.counts, self.bin_min, self.bin_max
+        for x in values:
+            if x < low:
+                self.below += 1
+            elif x <= high:
+                b = min(int((x - low) * scale), last)
+                counts[b] += 1
+                if bin_min[b] is None or x < bin_min[b]:
+                    bin_min[b] = x
+                if bin_max[b] is None or x > bin_max[b]:
+                    bin_max[b] = x
+    
+    def finish_pass(self) -> None:
+        """스캔 결과로 후보 범위를 좁히거나 답을 확정합니다."""
+        rank = self.k - self.below
+        if self.collect:
+            self.result = _select_kth(self.collected, rank)
+            return
+        
+        for b, n in enumerate(self.counts):
+            if rank < n:
+                low, high = self.bin_min[b], self.bin_max[b]
+                if low == high:
+                    self.result = low
+                    return
+                self.low, self.high = low, high
+                self.collect = n <= self.COLLECT_LIMIT
+                self._reset()
+                return
+            rank -= n
+        raise ValueError("순위가 값의 개수를 벗어났습니다")
+
+
+# 증분 갱신 체크포인트 (CSV 옆에 저장되는 병합 가능한 집계 상태)
+CHECKPOINT_SUFFIX = ".dackpt"
+_CHECKPOINT_MAGIC = b"DACKPT02"
+_CHECKPOINT_VERSION = 2
+_CHECKPOINT_PROBE = 4096  # 파일이 다시 쓰였는지 확인할 때 비교하는 앞/끝 바이트 수
+
+
+def _checkpoint_path(filepath: Path) -> Path:
+    """CSV 파일에 대응하는 체크포인트 파일 경로를 반환합니다."""
+    return filepath.with_name(filepath.name + CHECKPOINT_SUFFIX)
+
+
+def _probe_digests(f: BinaryIO, offset: int) -> Tuple[str, str]:
+    """
+    파일 앞부분과 offset 직전 구간의 해시를 반환합니다.
+
+    두 구간이 체크포인트를 저장할 때와 같으면 offset 앞부분은 그대로이고
+    뒤에 행만 추가되었다고 봅니다.
+    """
+    f.seek(0)
+    head = f.read(min(offset, _CHECKPOINT_PROBE))
+    start = max(0, offset - _CHECKPOINT_PROBE)
+    f.seek(start)
+    tail = f.read(offset - start)
+    return (blake2b(head, digest_size=16).hexdigest(),
+            blake2b(tail, digest_size=16).hexdigest())
+
+
+def _last_line_end(f: BinaryIO, size: int, block_size: int = 1 << 16) -> int:
+    """마지막 줄바꿈 바로 뒤의 위치(완성된 줄의 끝)를 반환합니다. 없으면 0."""
+    end = size
+    while end > 0:
+        start = max(0, end - block_size)
+        f.seek(start)
+        position = f.read(end - start).rfind(b"\n")
+        if position >= 0:
+            return start + position + 1
+        end = start
+    return 0
+
+
+def _checked(value: Any, kind, optional: bool = False) -> Any:
+    """체크포인트 필드의 타입을 확인합니다 (bool은 숫자로 보지 않음)."""
+    if optional and value is None:
+        return value
+    if isinstance(value, bool) or not isinstance(value, kind):
+        raise ValueError(f"체크포인트 필드가 잘못되었습니다: {value!r}")
+    return value
+
+
+def _dump_counter(counter: Counter, segments: _Segments) -> Dict[str, List[int]]:
+    """숫자 값별 빈도를 (값 배열, 개수 배열) 구간으로 저장합니다."""
+    return {"values": segments.add(array("d", counter.keys()).tobytes()),
+            "counts": segments.add(array("q", counter.values()).tobytes())}
+
+
+def _load_counter(meta: Dict[str, Any], data: memoryview, swap: bool) -> Counter:
+    values = _sidecar_segment(data, meta["values"], "d", swap)
+    counts = _sidecar_segment(data, meta["counts"], "q", swap)
+    if len(values) != len(counts) or any(n < 0 for n in counts):
+        raise ValueError("체크포인트의 빈도 구간이 잘못되었습니다")
+    return Counter(dict(zip(values, counts)))
+
+
+def _load_pairs(pairs: Any) -> Counter:
+    """[[문자열, 개수], ...]를 Counter로 읽습니다."""
+    for pair in _checked(pairs, list):
+        if (not isinstance(pair, list) or len(pair) != 2
+                or not isinstance(pair[0], str) or _checked(pair[1], int) < 0):
+            raise ValueError(f"체크포인트의 빈도 항목이 잘못되었습니다: {pair!r}")
+    return Counter(dict(pairs))
+
+
+def _dump_accumulator(accumulator: _ColumnAccumulator, segments: _Segments) -> Dict[str, Any]:
+    """열 집계기를 JSON 헤더 항목과 데이터 구간으로 저장합니다."""
+    state = {
+        "name": accumulator.name,
+        "count": accumulator.count,
+        "missing": accumulator.missing,
+        "invalid_examples": accumulator.invalid_examples,
+        "n": accumulator.n,
+        "mean": accumulator.mean,
+        "m2": accumulator.m2,
+        "total": accumulator.total,
+        "min": accumulator.min,
+        "max": accumulator.max,
+        "canonical": _dump_counter(accumulator.canonical, segments),
+        "fixed": [dict(_dump_counter(counter, segments), decimals=decimals)
+                  for decimals, counter in accumulator.fixed.items()],
+        "text": list(accumulator.text.items()),
+    }
+    if isinstance(accumulator, _ApproxColumnAccumulator):
+        quantiles = accumulator.quantiles
+        version, internal, gauss = quantiles._random.getstate()
+        state["approx"] = {
+            "error": accumulator.error,
+            "kll_k": quantiles.k,
+            "kll_n": quantiles.n,
+            "kll_compactors": [segments.add(array("d", buffer).tobytes())
+                               for buffer in quantiles.compactors],
+            "kll_random": [version, list(internal), gauss],
+            "hll_registers": segments.add(bytes(accumulator.distinct.registers)),
+            "top_capacity": accumulator.top.capacity,
+            "top_counts": list(accumulator.top.counts.items()),
+        }
+    return state
+
+
+def _load_accumulator(state: Dict[str, Any], data: memoryview, swap: bool
+                      ) -> _ColumnAccumulator:
+    """_dump_accumulator()로 저장한 열 집계기를 검사하며 되살립니다."""
+    name = _checked(state["name"], str)
+    approx = state.get("approx")
+    if approx is None:
+        accumulator = _ColumnAccumulator(name)
+    else:
+        error = _checked(approx["error"], float)
+        if not 0 < error < 1:
+            raise ValueError(f"체크포인트의 근사 오차가 잘못되었습니다: {error}")
+        accumulator = _ApproxColumnAccumulator(name, error)
+    
+    accumulator.count = _checked(state["count"], int)
+    accumulator.missing = _checked(state["missing"], int)
+    for example in _checked(state["invalid_examples"], list):
+        if (not isinstance(example, list) or len(example) != 2
+                or not isinstance(example[1], str)):
+            raise ValueError(f"체크포인트의 잘못된 값 예시가 잘못되었습니다: {example!r}")
+        _checked(example[0], int)
+    accumulator.invalid_examples = [tuple(example) for example in state["invalid_examples"]]
+    accumulator.n = _checked(state["n"], int)
+    accumulator.mean = _checked(state["mean"], (int, float))
+    accumulator.m2 = _checked(state["m2"], (int, float))
+    accumulator.total = _checked(state["total"], (int, float))
+    accumulator.min = _checked(state["min"], (int, float), optional=True)
+    accumulator.max = _checked(state["max"], (int, float), optional=True)
+    if min(accumulator.count, accumulator.missing, accumulator.n) < 0:
+        raise ValueError("체크포인트의 개수가 음수입니다")
+    accumulator.canonical = _load_counter(state["canonical"], data, swap)
+    for fixed in _checked(state["fixed"], list):
+        decimals = _checked(fixed["decimals"], int)
+        accumulator.fixed[decimals] = _load_counter(fixed, data, swap)
+    accumulator.text = _load_pairs(state["text"])
+    
+    if approx is not None:
+        quantiles = _KLLSketch(k=_checked(approx["kll_k"], int))
+        quantiles.n = _checked(approx["kll_n"], int)
+        quantiles.compactors = [_sidecar_segment(data, location, "d", swap).tolist()
+                                for location in _checked(approx["kll_compactors"], list)]
+        if quantiles.k < 2 or quantiles.n < 0 or not quantiles.compactors:
+            raise ValueError("체크포인트의 분위수 스케치가 잘못되었습니다")
+        version, internal, gauss = _checked(approx["kll_random"], list)
+        quantiles._random.setstate((version, tuple(_checked(internal, list)), gauss))
+        accumulator.quantiles = quantiles
+        
+        registers = _sidecar_segment(data, approx["hll_registers"], "B")
+        if len(registers) != len(accumulator.distinct.registers):
+            raise ValueError("체크포인트의 고유값 추정기가 잘못되었습니다")
+        accumulator.distinct.registers = bytearray(registers)
+        accumulator.top = _TopValues(capacity=_checked(approx["top_capacity"], int))
+        if accumulator.top.capacity < 1:
+            raise ValueError("체크포인트의 상위 값 요약이 잘못되었습니다")
+        accumulator.top.counts = _load_pairs(approx["top_counts"])
+    return accumulator
+
+
+def _read_checkpoint(filepath: Path) -> Optional[Dict[str, Any]]:
+    """
+    체크포인트 파일을 읽습니다. 없거나 형식·구조가 잘못되었으면 None을 반환합니다.
+    
+    캐시와 같은 사이드카 형식(_write_sidecar() 참고)이며, 코드를 실행하지
+    않고 필드마다 타입과 범위를 검사하며 집계기를 되살립니다.
+    """
+    try:
+        meta, data = _open_sidecar(_checkpoint_path(filepath), _CHECKPOINT_MAGIC)
+        if meta.get("version") != _CHECKPOINT_VERSION:
+            return None
+        swap = meta["byteorder"] != sys.byteorder
+        state = {
+            "encoding": _checked(meta["encoding"], str),
+            "delimiter": _checked(meta["delimiter"], str),
+            "header": _checked(meta["header"], list),
+            "approx": _checked(meta["approx"], float, optional=True),
+            "offset": _checked(meta["offset"], int),
+            "rows": _checked(meta["rows"], int),
+            "digests": tuple(_checked(meta["digests"], list)),
+        }
+        accumulators = [_load_accumulator(item, data, swap)
+                        for item in _checked(meta["accumulators"], list)]
+    except (OSError, ValueError, TypeError, KeyError, AttributeError, OverflowError):
+        return None
+    
+    if not all(isinstance(name, str) for name in state["header"]):
+        return None
+    names = list(dict.fromkeys(state["header"]))
+    if (state["offset"] < 0 or [acc.name for acc in accumulators] != names
+            or any(isinstance(acc, _ApproxColumnAccumulator) != (state["approx"] is not None)
+                   for acc in accumulators)):
+        return None
+    state["accumulators"] = {acc.name: acc for acc in accumulators}
+    return state
+
+
+def _write_checkpoint(filepath: Path, state: Dict[str, Any]) -> None:
+    """
+    체크포인트를 사이드카 형식으로 저장합니다.
+
+    임시 파일에 쓴 뒤 교체하므로 쓰는 도중 중단되어도 이전 체크포인트가
+    깨지지 않습니다.
+    """
+    segments = _Segments()
+    meta = {key: value for key, value in state.items() if key != "accumulators"}
+    meta["byteorder"] = sys.byteorder
+    meta["accumulators"] = [_dump_accumulator(accumulator, segments)
+                            for accumulator in state["accumulators"].values()]
+    _write_sidecar(_checkpoint_path(filepath), _CHECKPOINT_MAGIC, meta, segments)
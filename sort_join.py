@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+sort_join.py - 정렬 키와 조인
+
+data_analyzer.py의 sort_by()/top()/bottom()과 join()에서 쓰는 정렬 키 생성,
+외부 정렬의 런(run) 파일 입출력, 해시 조인과 메모리를 넘는 입력을 위한
+grace hash join을 제공합니다.
+"""
+
+import heapq
+import pickle
+import operator
+import tempfile
+from itertools import compress, islice
+from typing import List, Dict, Optional, Tuple, Union, Iterable, Iterator, Sequence
+from collections import defaultdict
+from pathlib import Path
+
+from column_store import (Column, NumericColumn, StringColumn, _INVERT_TABLE, _is_blank,
+                          _numeric_arrays)
+
+# 선택적 의존성: 설치되어 있으면 숫자 연산을 벡터화합니다.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class _Descending:
+    """내림차순 정렬용 문자열 래퍼 (비교 방향을 뒤집음)"""
+    
+    __slots__ = ("text",)
+    
+    def __init__(self, text: str):
+        self.text = text
+    
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.text < self.text
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.text == other.text
+
+
+def _sort_key(text: str, number: Optional[float], descending: bool) -> Tuple:
+    """
+    셀 하나의 정렬 키를 만듭니다.
+    
+    숫자 값이 먼저(숫자 순서), 숫자가 아닌 값이 그다음(문자열 순서), 결측치는
+    정렬 방향과 관계없이 마지막입니다. 키는 셀 원문만으로 정해지므로 열 타입을
+    따로 추론한 청크 사이에서도 비교할 수 있습니다.
+    """
+    if number is not None and number == number:
+        return (0, -number if descending else number)
+    if _is_blank(text):
+        return (2,)
+    return (1, _Descending(text) if descending else text)
+
+
+def _column_sort_keys(col: Column, descending: bool) -> List[Tuple]:
+    """열의 셀별 정렬 키 목록을 반환합니다 (문자형 열은 사전 항목마다 한 번만 계산)."""
+    if isinstance(col, StringColumn):
+        entries = [_sort_key(text, number, descending)
+                   for text, number in zip(col.dictionary, col.numbers())]
+        return list(map(entries.__getitem__, col.codes))
+    
+    keys = []
+    get = col.get
+    for i, number in enumerate(col.iter_numeric()):
+        if number is not None and number == number:
+            keys.append((0, -number if descending else number))
+        else:
+            keys.append(_sort_key(get(i), None, descending))
+    return keys
+
+
+def _row_sort_keys(columns: Dict[str, Column], names: List[str],
+                   descending: List[bool]) -> List[Tuple]:
+    """행별 정렬 키(열별 키의 튜플) 목록을 반환합니다."""
+    return list(zip(*(_column_sort_keys(columns[name], desc)
+                      for name, desc in zip(names, descending))))
+
+
+def _sort_spec(all_columns: List[str], columns: Union[str, List[str]],
+               descending: Union[bool, List[bool]]) -> Tuple[List[str], List[bool]]:
+    """sort_by() 인자를 (정렬 열 목록, 열별 내림차순 여부)로 변환합니다."""
+    names = [columns] if isinstance(columns, str) else list(columns)
+    if not names:
+        raise ValueError("정렬 기준 열이 필요합니다")
+    for name in names:
+        if name not in all_columns:
+            raise ValueError(f"열이 존재하지 않습니다: {name}")
+    if isinstance(descending, bool):
+        return names, [descending] * len(names)
+    flags = list(descending)
+    if len(flags) != len(names):
+        raise ValueError("descending은 정렬 열마다 하나씩 지정해야 합니다")
+    return names, flags
+
+
+def _top_k_indices(col: Column, k: int, largest: bool = True) -> List[int]:
+    """
+    숫자 값이 가장 큰(작은) k개 행의 번호를 값 순서로 반환합니다.
+    
+    전체를 정렬하지 않고 크기 k의 힙(NumPy 백엔드면 부분 선택)으로 찾습니다.
+    숫자가 아닌 셀과 NaN은 제외하며, 값이 같으면 앞쪽 행이 먼저입니다.
+    """
+    if k <= 0:
+        return []
+    if col.backend == "numpy":
+        values, valid = _numeric_arrays(col)
+        rows = np.flatnonzero(valid & ~np.isnan(values))
+        if len(rows) > k:
+            vals = values[rows]
+            position = len(vals) - k if largest else k - 1
+            kth = np.partition(vals, position)[position]
+            beyond = vals > kth if largest else vals < kth
+            tied = np.flatnonzero(vals == kth)[:k - int(beyond.sum())]
+            rows = np.sort(np.concatenate([rows[beyond], rows[tied]]))
+        vals = values[rows]
+        return rows[np.lexsort((rows, -vals if largest else vals))].tolist()
+    
+    values = col.values if isinstance(col, NumericColumn) else list(col.iter_numeric())
+    candidates = (i for i, x in enumerate(col.iter_numeric()) if x is not None and x == x)
+    select = heapq.nlargest if largest else heapq.nsmallest
+    return select(k, candidates, key=values.__getitem__)
+
+
+def _write_run(path: Path, items: Iterable[Tuple], block_size: int) -> None:
+    """정렬된 (키, 행) 항목들을 block_size개씩 묶어 임시 파일에 씁니다."""
+    items = iter(items)
+    with open(path, "wb") as f:
+        while True:
+            block = list(islice(items, block_size))
+            if not block:
+                return
+            pickle.dump(block, f, pickle.HIGHEST_PROTOCOL)
+
+
+def _read_run(path: Path) -> Iterator[Tuple]:
+    """_write_run()으로 쓴 항목들을 묶음 단위로 읽어 차례로 반환합니다."""
+    with open(path, "rb") as f:
+        while True:
+            try:
+                block = pickle.load(f)
+            except EOFError:
+                return
+            yield from block
+
+
+JOIN_TYPES = ("inner", "left")
+
+# 오른쪽 열 이름이 왼쪽과 겹칠 때 붙이는 접미사
+_JOIN_SUFFIX = "_right"
+
+
+def _join_spec(left_columns: List[str], right_columns: List[str],
+               on: Union[str, List[str]], how: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    join() 인자를 검사합니다.
+    
+    Returns:
+        (키 열 목록, 결과에 넣을 오른쪽 열 목록, 그 열들의 결과 이름 목록)
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError(f"지원하지 않는 조인 방식입니다: {how}")
+    keys = [on] if isinstance(on, str) else list(on)
+    if not keys:
+        raise ValueError("조인 키 열이 필요합니다")
+    for name in keys:
+        if name not in left_columns or name not in right_columns:
+            raise ValueError(f"조인 키 열이 두 데이터셋에 모두 있어야 합니다: {name}")
+    right_names = [name for name in dict.fromkeys(right_columns) if name not in keys]
+    out_names = [name + _JOIN_SUFFIX if name in left_columns else name for name in right_names]
+    return keys, right_names, out_names
+
+
+def _join_keys(columns: Dict[str, Column], keys: List[str]) -> List[Optional[Tuple[str, ...]]]:
+    """행별 조인 키 튜플 목록을 반환합니다 (키에 결측치가 있으면 None)."""
+    return [None if any(map(_is_blank, key)) else key
+            for key in zip(*(columns[name].strings() for name in keys))]
+
+
+def _join_pairs(left_keys: Sequence[Optional[Tuple]], right_keys: Sequence[Optional[Tuple]],
+                how: str) -> List[Tuple[int, Optional[int]]]:
+    """
+    해시 조인으로 (왼쪽 행 번호, 오른쪽 행 번호 또는 None) 쌍을 구합니다.
+    
+    해시 테이블은 행이 적은 쪽에 만들고 다른 쪽으로 탐색합니다. 결과는 왼쪽
+    행 순서이며, 한 왼쪽 행의 짝은 오른쪽 행 순서입니다. 키가 None인 행은
+    어떤 행과도 일치하지 않습니다 (left 조인이면 짝 없이 남음).
+    """
+    pairs: List[Tuple[int, Optional[int]]] = []
+    if len(left_keys) < len(right_keys):
+        table: Dict[Tuple, List[int]] = defaultdict(list)
+        for i, key in enumerate(left_keys):
+            if key is not None:
+                table[key].append(i)
+        matched = bytearray(len(left_keys))
+        for j, key in enumerate(right_keys):
+            for i in table.get(key, ()) if key is not None else ():
+                pairs.append((i, j))
+                matched[i] = 1
+        if how == "left":
+            pairs.extend((i, None) for i in compress(range(len(left_keys)),
+                                                     matched.translate(_INVERT_TABLE)))
+        pairs.sort(key=operator.itemgetter(0))
+        return pairs
+    
+    table = defaultdict(list)
+    for j, key in enumerate(right_keys):
+        if key is not None:
+            table[key].append(j)
+    for i, key in enumerate(left_keys):
+        matches = table.get(key) if key is not None else None
+        if matches:
+            pairs.extend((i, j) for j in matches)
+        elif how == "left":
+            pairs.append((i, None))
+    return pairs
+
+
+def _spill_partitions(rows: Iterable[Sequence[str]], key_positions: List[int],
+                      keep: Optional[List[int]], paths: List[Path],
+                      keep_blank: bool, block_size: int) -> None:
+    """
+    행을 조인 키 해시로 분할해 임시 파일들에 (키, 행) 묶음으로 씁니다.
+    
+    keep을 지정하면 그 위치의 값만 저장합니다. 키에 결측치가 있는 행은
+    keep_blank가 True일 때만 키 None으로 저장합니다.
+    """
+    partitions = len(paths)
+    buffers: List[List[Tuple]] = [[] for _ in range(partitions)]
+    files = [open(path, "wb") for path in paths]
+    try:
+        for row in rows:
+            key = tuple(row[p] for p in key_positions)
+            if any(map(_is_blank, key)):
+                if not keep_blank:
+                    continue
+                key = None
+            part = hash(key) % partitions
+            buffer = buffers[part]
+            buffer.append((key, row if keep is None else [row[p] for p in keep]))
+            if len(buffer) >= block_size:
+                pickle.dump(buffer, files[part], pickle.HIGHEST_PROTOCOL)
+                buffers[part] = []
+        for f, buffer in zip(files, buffers):
+            if buffer:
+                pickle.dump(buffer, f, pickle.HIGHEST_PROTOCOL)
+    finally:
+        for f in files:
+            f.close()
+
+
+def _grace_hash_join(left_rows: Iterable[Sequence[str]], left_keys: List[int],
+                     right_rows: Iterable[Sequence[str]], right_keys: List[int],
+                     right_keep: List[int], how: str, partitions: int,
+                     block_size: int = 4096
+                     ) -> Iterator[Tuple[Sequence[str], Optional[Sequence[str]]]]:
+    """
+    분할(grace) 해시 조인으로 (왼쪽 행, 오른쪽 행 또는 None) 쌍을 차례로 반환합니다.
+    
+    양쪽을 키 해시로 partitions개의 임시 파일에 나누어 쓴 뒤, 같은 번호의
+    분할끼리만 메모리에 올려 _join_pairs()로 조인합니다. 따라서 어느 쪽도
+    전체가 메모리에 들어갈 필요가 없습니다. 결과는 분할 순서로 나오며, 분할
+    안에서는 왼쪽 행 순서입니다.
+    """
+    with tempfile.TemporaryDirectory(prefix="data_analyzer_") as tmpdir:
+        left_paths = [Path(tmpdir) / f"left{p}.pkl" for p in range(partitions)]
+        right_paths = [Path(tmpdir) / f"right{p}.pkl" for p in range(partitions)]
+        _spill_partitions(left_rows, left_keys, None, left_paths, how == "left", block_size)
+        _spill_partitions(right_rows, right_keys, right_keep, right_paths, False, block_size)
+        
+        for left_path, right_path in zip(left_paths, right_paths):
+            left_items = list(_read_run(left_path))
+            right_items = list(_read_run(right_path))
+            pairs = _join_pairs([key for key, _ in left_items],
+                                [key for key, _ in right_items], how)
+            for i, j in pairs:
+                yield left_items[i][1], right_items[j][1] if j is not None else None
+
+
+def _join_rows(pairs: Iterable[Tuple[Sequence[str], Optional[Sequence[str]]]],
+               left_columns: List[str], out_names: List[str]) -> Iterator[Dict[str, str]]:
+    """(왼쪽 행, 오른쪽 행) 쌍을 결과 행(dict)으로 변환합니다 (짝이 없으면 빈 값)."""
+    blank = [""] * len(out_names)
+    for left, right in pairs:
+        row = dict(zip(left_columns, left))
+        row.update(zip(out_names, right if right is not None else blank))
+        yield row
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+test_data_analyzer.py - data_analyzer.py 동등성 테스트
+
+같은 결과를 내야 하는 두 경로(스트리밍과 메모리, 병렬과 직렬, 캐시와 CSV,
+인덱스와 전체 스캔, 실행 계획과 행 단위 평가, 증분 갱신과 전체 재구성,
+.dacol 내보내기와 다시 읽기)를 작은 CSV로 비교합니다.
+
+실행: python -m pytest -q
+"""
+
+import csv
+import math
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from column_store import _cache_path
+from data_analyzer import DataAnalyzer, StreamingDataAnalyzer, read_columnar, write_rows
+from sketches import _checkpoint_path
+
+HEADER = ["id", "score", "cat", "amount", "late", "name"]
+
+# 증분 갱신 시나리오의 CSV 생성에 쓰는 난수 (행마다 값이 달라지도록 모듈에서 공유)
+_ROWS_RNG = random.Random(7)
+
+
+def _make_rows(n, start=0, rng=_ROWS_RNG):
+    """숫자/문자/빈 값/천 단위 구분 숫자가 섞인 행을 만듭니다."""
+    rows = []
+    for i in range(start, start + n):
+        score = rng.choice(["", "1,234", "n/a", str(rng.randint(0, 50)),
+                            f"{rng.random() * 100:.2f}"])
+        # late: 앞부분은 문자지만 전체로는 숫자형인 열 (첫 묶음만 보면 문자형)
+        late = "x" if i < 120 else repr(rng.gauss(0, 1))
+        rows.append([str(i), score, rng.choice("abcde"), f"{rng.uniform(-50, 50):.3f}",
+                     late, rng.choice(["kim", "lee", "park, jr", 'say "hi"', ""])])
+    return rows
+
+
+def _write_csv(path, rows, header=HEADER):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return path
+
+
+def _assert_stats_equal(actual, expected):
+    """두 DataSummary의 열 통계가 (부동소수점 오차 안에서) 같은지 확인합니다."""
+    assert actual.rows == expected.rows
+    assert actual.column_names == expected.column_names
+    for name, want in expected.column_stats.items():
+        _assert_column_equal(actual.column_stats[name], want)
+
+
+def _assert_column_equal(got, want):
+    """두 ColumnStats가 같은지 확인합니다 (합계에서 나온 값은 더하는 순서의 오차 허용)."""
+    for field in ("name", "dtype", "count", "missing", "unique", "invalid", "invalid_examples",
+                  "top_values", "min_val", "max_val", "median", "approximate"):
+        assert getattr(got, field) == getattr(want, field), (want.name, field)
+    for field in ("mean", "std_dev", "sum_val"):
+        a, b = getattr(got, field), getattr(want, field)
+        assert (a is None) == (b is None), (want.name, field)
+        if a is not None:
+            assert math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9), (want.name, field, a, b)
+
+
+def _assert_close(actual, expected):
+    """중첩된 dict/list의 숫자를 부동소수점 오차 안에서 비교합니다."""
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            _assert_close(actual[key], expected[key])
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected)
+        for a, b in zip(actual, expected):
+            _assert_close(a, b)
+    elif isinstance(expected, float) and not math.isnan(expected):
+        assert math.isclose(actual, expected, rel_tol=1e-9, abs_tol=1e-12)
+    else:
+        assert actual == expected or (actual != actual and expected != expected)
+
+
+@pytest.fixture
+def data_csv(tmp_path):
+    return _write_csv(tmp_path / "data.csv", _make_rows(2000, rng=random.Random(1)))
+
+
+@pytest.fixture
+def partitions(tmp_path):
+    """헤더 순서와 열 구성이 조금씩 다른 파일 세 개로 된 디렉터리"""
+    rng = random.Random(2)
+    folder = tmp_path / "parts"
+    folder.mkdir()
+    for i, header in enumerate([HEADER, HEADER[::-1], HEADER[:-1]]):
+        rows = _make_rows(700, start=i * 700, rng=rng)
+        positions = [HEADER.index(name) for name in header]
+        _write_csv(folder / f"part{i}.csv", [[row[p] for p in positions] for row in rows],
+                   header)
+    return folder
+
+
+# --- 스트리밍 vs 메모리 ---
+
+@pytest.mark.parametrize("chunksize", [97, 5000])
+def test_streaming_matches_in_memory(data_csv, chunksize):
+    memory = DataAnalyzer(str(data_csv))
+    stream = StreamingDataAnalyzer(str(data_csv), chunksize=chunksize)
+
+    _assert_stats_equal(stream.get_summary(), memory.get_summary())
+    _assert_column_equal(stream.get_column_stats("amount"), memory.get_column_stats("amount"))
+    # 근사 중앙값은 묶음 나누기에 따라 달라질 수 있으므로 순위 오차 한도로 비교합니다.
+    values = sorted(memory.get_numeric_values("amount"))
+    for analyzer in (stream, memory):
+        median = analyzer.get_column_stats("amount", approx=0.01).median
+        rank = sum(value <= median for value in values) / len(values)
+        assert abs(rank - 0.5) <= 0.02
+
+    expression = "score ge 10 AND (cat in (a, b) OR name ~ '^k')"
+    assert list(stream.query(expression)) == memory.query(expression)
+    assert list(stream.sort_by(["cat", "amount"], descending=[False, True])) == \
+        list(memory.sort_by(["cat", "amount"], descending=[False, True]))
+    assert list(stream.sort_by("score", limit=25)) == memory.sort_by("score", limit=25)
+    assert stream.top_k("amount", 7) == memory.top_k("amount", 7)
+    assert stream.value_counts("cat") == memory.value_counts("cat")
+
+    aggs = {"amount": ["count", "sum", "mean", "min", "max", "std", "median", "p90"]}
+    _assert_close(stream.group_by(keys=["cat"], aggs=aggs), memory.group_by(keys=["cat"], aggs=aggs))
+    _assert_close(stream.group_by("cat", "score"), memory.group_by("cat", "score"))
+
+
+def test_streaming_correlation_uses_full_scan_types(data_csv):
+    # late 열은 첫 묶음이 모두 문자라도 전체로는 숫자형이므로 상관 행렬에 포함됩니다.
+    memory = DataAnalyzer(str(data_csv))
+    stream = StreamingDataAnalyzer(str(data_csv), chunksize=100)
+    expected = memory.correlation_matrix()
+    assert "late" in expected
+    _assert_close(stream.correlation_matrix(), expected)
+
+
+def test_streaming_matches_in_memory_across_files(partitions):
+    memory = DataAnalyzer(str(partitions), jobs=1)
+    stream = StreamingDataAnalyzer(str(partitions), chunksize=256)
+    assert stream.columns == memory.columns
+    _assert_stats_equal(stream.get_summary(), memory.get_summary())
+    assert list(stream.iter_rows()) == list(memory.data)
+
+
+# --- 병렬 vs 직렬 ---
+
+def test_parallel_matches_serial(partitions, data_csv):
+    serial = DataAnalyzer(str(partitions), jobs=1)
+    parallel = DataAnalyzer(str(partitions), jobs=2)
+    assert list(parallel.data) == list(serial.data)
+    _assert_stats_equal(parallel.get_summary(jobs=2), serial.get_summary(jobs=1))
+
+    aggs = {"amount": ["sum", "mean", "std", "median"], "score": ["count", "max"]}
+    _assert_close(parallel.group_by(keys=["cat"], aggs=aggs, jobs=2),
+                  serial.group_by(keys=["cat"], aggs=aggs, jobs=1))
+
+    stream = StreamingDataAnalyzer(str(data_csv), chunksize=150)
+    _assert_stats_equal(stream.get_summary(jobs=2), stream.get_summary(jobs=1))
+    assert stream.get_summary(jobs=2, approx=0.01) == stream.get_summary(jobs=1, approx=0.01)
+
+
+# --- 캐시 round-trip ---
+
+def test_cache_round_trip(data_csv):
+    plain = DataAnalyzer(str(data_csv))
+    first = DataAnalyzer(str(data_csv), cache=True)
+    assert _cache_path(data_csv).exists()
+    cached = DataAnalyzer(str(data_csv), cache=True)
+
+    for analyzer in (first, cached):
+        assert analyzer.columns == plain.columns
+        assert list(analyzer.data) == list(plain.data)
+        _assert_stats_equal(analyzer.get_summary(), plain.get_summary())
+        assert analyzer.invalid_values("score") == plain.invalid_values("score")
+
+
+def test_cache_ignores_damaged_sidecar(data_csv):
+    plain = DataAnalyzer(str(data_csv))
+    DataAnalyzer(str(data_csv), cache=True)
+    sidecar = _cache_path(data_csv)
+    data = bytearray(sidecar.read_bytes())
+    data[len(data) // 2:] = b"\xff" * (len(data) - len(data) // 2)
+    sidecar.write_bytes(bytes(data))
+
+    # 손상된 캐시는 버리고 CSV를 다시 읽습니다.
+    assert list(DataAnalyzer(str(data_csv), cache=True).data) == list(plain.data)
+
+
+# --- 인덱스 vs 전체 스캔 ---
+
+EXPRESSIONS = [
+    "id lt 100",
+    "amount between -10 AND 10",
+    "cat eq c",
+    "cat in (a, e) AND id ge 1500",
+    "NOT cat eq b AND amount gt 40",
+    "score gt 25 OR name eq kim",
+    "cat ne a AND (id le 50 OR id ge 1950)",
+    "name contains jr",
+]
+
+
+@pytest.mark.parametrize("kind", ["sorted", "hash"])
+def test_index_matches_scan(data_csv, kind):
+    analyzer = DataAnalyzer(str(data_csv))
+    expected = [analyzer.query(expression) for expression in EXPRESSIONS]
+    for column in ("id", "cat", "amount", "score", "name"):
+        analyzer.create_index(column, kind=kind)
+    assert [analyzer.query(expression) for expression in EXPRESSIONS] == expected
+
+
+# --- 실행 계획 vs 행 단위 평가 ---
+
+def _number(text):
+    try:
+        return float(text.replace(",", ""))
+    except ValueError:
+        return None
+
+
+NAIVE = [
+    ("id gt 1000 AND cat in (a, b)",
+     lambda r: int(r["id"]) > 1000 and r["cat"] in ("a", "b")),
+    ("amount between -5 AND 5 OR cat eq d",
+     lambda r: -5 <= float(r["amount"]) <= 5 or r["cat"] == "d"),
+    ("NOT (cat eq a OR cat eq b) AND id lt 300",
+     lambda r: r["cat"] not in ("a", "b") and int(r["id"]) < 300),
+    ("score ge 40", lambda r: _number(r["score"]) is not None and _number(r["score"]) >= 40),
+    ("name ~ '^(kim|lee)$' AND amount lt 0",
+     lambda r: re.search("^(kim|lee)$", r["name"]) is not None and float(r["amount"]) < 0),
+    ("cat not in (c, d, e) OR NOT id ge 10", lambda r: r["cat"] in ("a", "b") or int(r["id"]) < 10),
+]
+
+
+@pytest.mark.parametrize("expression, predicate", NAIVE)
+def test_planner_matches_naive_evaluation(data_csv, expression, predicate):
+    with open(data_csv, encoding="utf-8", newline="") as f:
+        expected = [row for row in csv.DictReader(f) if predicate(row)]
+
+    analyzer = DataAnalyzer(str(data_csv))
+    assert analyzer.query(expression) == expected
+    analyzer.create_index("cat", kind="hash")
+    analyzer.create_index("id", kind="sorted")
+    assert analyzer.query(expression) == expected
+    # 로딩 중 원문 셀 평가와 스트리밍 평가도 같은 행을 고릅니다.
+    assert list(DataAnalyzer(str(data_csv), where=expression).data) == expected
+    assert list(StreamingDataAnalyzer(str(data_csv), chunksize=333).query(expression)) == expected
+
+
+# --- 증분 갱신 vs 전체 재구성 ---
+
+def _refresh(path, **kwargs):
+    analyzer = StreamingDataAnalyzer(str(path), chunksize=250)
+    summary = analyzer.get_summary(incremental=True, **kwargs)
+    _assert_stats_equal(summary, StreamingDataAnalyzer(str(path), chunksize=250).get_summary())
+    return analyzer.last_refresh
+
+
+def test_incremental_matches_full_rebuild(tmp_path):
+    path = _write_csv(tmp_path / "log.csv", _make_rows(1500))
+    assert _refresh(path).startswith("전체 재구성 (체크포인트 없음)")
+    assert _checkpoint_path(path).exists()
+    assert _refresh(path).startswith("증분 갱신")
+
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(_make_rows(800, start=1500))
+    assert _refresh(path).startswith("증분 갱신")
+    assert _refresh(path, jobs=2).startswith("증분 갱신")
+
+    # 쓰는 중인 마지막 줄은 이번 결과에만 반영하고, 완성되면 다시 읽습니다.
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write("9999,5,c,1.5")
+    assert _refresh(path).startswith("증분 갱신")
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write("00,0.5,kim\n")
+    assert _refresh(path).startswith("증분 갱신")
+
+
+def test_incremental_falls_back_when_truncated(tmp_path):
+    path = _write_csv(tmp_path / "log.csv", _make_rows(1500))
+    _refresh(path)
+
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    path.write_text("".join(lines[:700]), encoding="utf-8")
+    assert _refresh(path).startswith("전체 재구성 (파일이 잘림)")
+    assert _refresh(path).startswith("증분 갱신")
+
+    # 길이는 그대로지만 앞부분이 다시 쓰인 파일
+    path.write_text(path.read_text(encoding="utf-8").replace(",a,", ",b,", 5), encoding="utf-8")
+    assert _refresh(path).startswith("전체 재구성 (파일 내용이 바뀜)")
+
+    # 체크포인트 파일이 손상되어도 전체 재구성으로 돌아갑니다.
+    _checkpoint_path(path).write_bytes(b"not a checkpoint")
+    assert _refresh(path).startswith("전체 재구성 (체크포인트 없음)")
+
+
+# --- .dacol 내보내기 round-trip ---
+
+def test_columnar_export_round_trip(data_csv, tmp_path):
+    analyzer = DataAnalyzer(str(data_csv))
+    target = tmp_path / "all.dacol"
+    assert analyzer.export(str(target)) == 2000
+    assert list(read_columnar(str(target))) == list(analyzer.data)
+
+    # 생성기 결과를 바로 내보내도 같은 행이 저장됩니다.
+    expression = "cat in (a, b) AND score ge 10"
+    target = tmp_path / "query.dacol"
+    assert analyzer.export(str(target), analyzer.iter_query(expression)) == \
+        len(analyzer.query(expression))
+    assert list(read_columnar(str(target))) == analyzer.query(expression)
+
+    stream = StreamingDataAnalyzer(str(data_csv), chunksize=300)
+    target = tmp_path / "stream.dacol"
+    stream.export(str(target))
+    assert list(read_columnar(str(target))) == list(analyzer.data)
+
+
+def test_columnar_export_keeps_value_types(tmp_path):
+    rows = [{"k": 1, "f": 1.5, "m": None, "big": -2 ** 62, "s": "가"},
+            {"k": 2, "f": float("inf"), "m": "z", "big": 1, "s": ""}]
+    target = tmp_path / "mixed.dacol"
+    assert write_rows(str(target), iter(rows), list(rows[0])) == 2
+    assert list(read_columnar(str(target))) == rows
+
+
+# --- 한 번의 스캔으로 만드는 표본 ---
+
+@pytest.mark.parametrize("options", [["--sample", "300"], ["--sample", "0.1"],
+                                     ["--sample", "300", "--stratify", "cat"]])
+def test_cli_sample_reads_file_once(data_csv, monkeypatch, capsys, options):
+    import data_analyzer
+
+    passes = []
+    iter_batches = StreamingDataAnalyzer.iter_batches
+
+    def counting_iter_batches(self):
+        passes.append(self.filepath)
+        return iter_batches(self)
+
+    def no_full_load(self, jobs):
+        raise AssertionError("표본 모드에서 파일 전체를 메모리로 읽었습니다")
+
+    monkeypatch.setattr(StreamingDataAnalyzer, "iter_batches", counting_iter_batches)
+    monkeypatch.setattr(DataAnalyzer, "_load_data", no_full_load)
+    monkeypatch.setattr("sys.argv", ["data_analyzer.py", str(data_csv), *options, "--seed", "3",
+                                     "--describe", "--group", "cat", "--agg", "amount:mean",
+                                     "--filter", "amount gt 0", "--sort", "id", "--hist", "amount",
+                                     "--corr", "amount", "late", "--value-counts", "cat"])
+    data_analyzer.main()
+
+    assert passes == [data_csv]
+    out = capsys.readouterr().out
+    assert "아래 결과는 표본 기준입니다" in out
+    assert "평균의 95% 오차 한계" in out
+
+
+# --- numpy 백엔드 vs 순수 파이썬 ---
+
+def test_numpy_backend_matches_python(data_csv):
+    pytest.importorskip("numpy")
+    from data_analyzer import create_histogram
+
+    python = DataAnalyzer(str(data_csv), backend="python")
+    numpy = DataAnalyzer(str(data_csv), backend="numpy")
+
+    _assert_stats_equal(numpy.get_summary(), python.get_summary())
+    _assert_stats_equal(numpy.get_summary(approx=0.01), python.get_summary(approx=0.01))
+    for expression in EXPRESSIONS + [expression for expression, _ in NAIVE]:
+        assert numpy.query(expression) == python.query(expression)
+    assert numpy.sort_by(["score", "amount"], descending=[True, False]) == \
+        python.sort_by(["score", "amount"], descending=[True, False])
+    assert numpy.top_k("amount", 9, largest=False) == python.top_k("amount", 9, largest=False)
+
+    _assert_close(numpy.correlation("amount", "late"), python.correlation("amount", "late"))
+    _assert_close(numpy.correlation_matrix(), python.correlation_matrix())
+    for column in ("amount", "score"):
+        values = python.get_numeric_values(column)
+        assert create_histogram(values, bins=12, backend="numpy") == \
+            create_histogram(values, bins=12, backend="python")
+        assert numpy.histogram(column, bins=7).counts == python.histogram(column, bins=7).counts
+
+    aggs = {"amount": ["sum", "mean", "std", "median", "p90"], "score": ["count", "min"]}
+    _assert_close(numpy.group_by(keys=["cat"], aggs=aggs), python.group_by(keys=["cat"], aggs=aggs))
+    _assert_close(numpy.rolling("amount", 25, agg="mean"), python.rolling("amount", 25, agg="mean"))
+    _assert_close(numpy.cumulative("score", agg="max"), python.cumulative("score", agg="max"))